@@ -1,13 +1,14 @@
-import pygame
-
 class Bush:
-    """Repräsentiert einen Busch, der gegessen werden kann."""
-    def __init__(self, x, y, size=4):
+    """Repräsentiert einen Busch, der gegessen werden kann (Typdaten wie bei Tree an der Klasse)."""
+    __slots__ = ("x", "y", "slot")
+    size = 4
+    color = (0, 180, 0)
+
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.size = size
-        self.color = (0, 180, 0)
 
     def draw(self, surface):
         """Zeichnet den Busch."""
+        import pygame
         pygame.draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
@@ -1,6 +1,19 @@
-import pygame
 import math
 import random
+from Objects.house import HOUSE_SIZE
+
+SIGHT = 120
+KILL_RANGE = 6
+
+
+class Waypoint:
+    """Patrouillenpunkt als Ziel eines Gegners."""
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
 
 class Enemy:
     """
@@ -12,14 +25,20 @@ class Enemy:
         speed (float): Bewegungsgeschwindigkeit.
         sight (float): Sichtweite des Gegners.
         target (object): Aktuelles Zielobjekt.
+        rng (random.Random): Zufallsquelle, in der Simulation deren Strom `enemies`.
+        color (tuple): Farbe, für alle Gegner gleich (Klassenattribut).
     """
-    def __init__(self, x, y):
+    __slots__ = ("x", "y", "speed", "sight", "target", "rng")
+    color = (200, 0, 0)
+
+    def __init__(self, x, y, rng=random):
         """Initialisiert den Enemy an einer Position."""
         self.x = float(x)
         self.y = float(y)
         self.speed = 0.6
-        self.sight = 120
+        self.sight = SIGHT
         self.target = None
+        self.rng = rng
 
     def distance(self, x, y):
         """Berechnet die Distanz zu einem Punkt."""
@@ -35,23 +54,44 @@ class Enemy:
 
     def move_random(self):
         """Bewegt den Enemy zufällig, z. B. wenn kein Ziel vorhanden."""
-        self.x += random.uniform(-1,1)
-        self.y += random.uniform(-1,1)
+        self.x += self.rng.uniform(-1,1)
+        self.y += self.rng.uniform(-1,1)
+
+    def is_sheltered(self, agent, houses):
+        """
+        Prüft, ob ein Agent in einem Haus steht und damit unsichtbar ist.
+
+        Agenten mit `in_house` sind immer geschützt; sonst werden nur
+        Häuser in unmittelbarer Nähe auf Überdeckung geprüft.
+
+        Args:
+            agent (Agent): Zu prüfender Agent.
+            houses (list | SpatialGrid): Häuser, als Raster nach Mittelpunkt indiziert.
+        """
+        if agent.in_house:
+            return True
+        nearby = houses.query(agent.x, agent.y, HOUSE_SIZE) if hasattr(houses, "query") else houses
+        return any(h.contains(agent) for h in nearby)
 
     def choose_target(self, agents, houses):
         """
         Wählt das aktuelle Ziel für den Enemy.
-        
+
+        Args:
+            agents (list | SpatialGrid): Alle Agenten.
+            houses (list | SpatialGrid): Alle Häuser.
+
         Priorität:
             1. Sichtbare Agenten
             2. Patrouille um nächstes Haus
             3. Zufällig
         """
         # Sichtbare Agenten
+        candidates = agents.query(self.x, self.y, self.sight) if hasattr(agents, "query") else agents
         visible_agents = [
-            a for a in agents 
-            if self.distance(a.x, a.y) <= self.sight 
-            and not any(h.contains(a) for h in houses)
+            a for a in candidates
+            if self.distance(a.x, a.y) <= self.sight
+            and not self.is_sheltered(a, houses)
         ]
         if visible_agents:
             self.target = min(visible_agents, key=lambda a: self.distance(a.x, a.y))
@@ -59,12 +99,15 @@ class Enemy:
 
         # Patrouille um nächstes Haus
         if houses:
-            nearest_house = min(houses, key=lambda h: self.distance(h.x + h.width/2, h.y + h.height/2))
-            angle = random.uniform(0, 2*math.pi)
+            if hasattr(houses, "nearest"):
+                nearest_house = houses.nearest(self.x, self.y)
+            else:
+                nearest_house = min(houses, key=lambda h: self.distance(h.x + h.width/2, h.y + h.height/2))
+            angle = self.rng.uniform(0, 2*math.pi)
             patrol_radius = max(nearest_house.width, nearest_house.height)/2 + 1  # 1 Pixel Abstand
             patrol_x = nearest_house.x + nearest_house.width/2 + patrol_radius * math.cos(angle)
             patrol_y = nearest_house.y + nearest_house.height/2 + patrol_radius * math.sin(angle)
-            self.target = type('Point', (), {'x': patrol_x, 'y': patrol_y})()
+            self.target = Waypoint(patrol_x, patrol_y)
             return
 
         # Kein Ziel
@@ -75,8 +118,8 @@ class Enemy:
         Aktualisiert die Position des Enemy und prüft Angriffe.
 
         Args:
-            agents (list): Liste aller Agenten.
-            houses (list): Liste aller Häuser.
+            agents (list | SpatialGrid): Alle Agenten.
+            houses (list | SpatialGrid): Alle Häuser.
 
         Returns:
             Agent: Getöteter Agent oder None.
@@ -88,11 +131,13 @@ class Enemy:
 
         # Angriff auf Agenten
         if self.target and hasattr(self.target, "x") and hasattr(self.target, "y"):
-            for agent in agents:
-                if self.distance(agent.x, agent.y) < 6 and not agent.in_house:
+            nearby = agents.query(self.x, self.y, KILL_RANGE) if hasattr(agents, "query") else agents
+            for agent in nearby:
+                if self.distance(agent.x, agent.y) < KILL_RANGE and not agent.in_house:
                     return agent
         return None
 
     def draw(self, surface):
         """Zeichnet den Enemy auf dem Surface."""
-        pygame.draw.rect(surface, (200,0,0), (int(self.x), int(self.y), 6,6))
+        import pygame
+        pygame.draw.rect(surface, self.color, (int(self.x), int(self.y), 6,6))
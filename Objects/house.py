@@ -1,12 +1,17 @@
-import pygame
 import random
 
+HOUSE_SIZE = 40  # Standard-Kantenlänge eines Hauses
+HOUSE_CAPACITY = 4
+
 class House:
     """
     Repräsentiert ein Haus, das Agenten Schutz bietet.
     """
+    __slots__ = ("x", "y", "width", "height", "capacity", "material",
+                 "occupants", "has_reproduced", "tribe", "observer", "rng")
+    color = (150, 75, 0)  # Standard: Braun, Häuser eines Tribes in dessen Farbe
 
-    def __init__(self, x, y, material="wood", width=40, height=40, capacity=4, tribe=None):
+    def __init__(self, x, y, material="wood", width=HOUSE_SIZE, height=HOUSE_SIZE, capacity=HOUSE_CAPACITY, tribe=None):
         """
         Initialisiert ein Haus.
 
@@ -23,9 +28,11 @@ class House:
         self.height = float(height)
         self.capacity = capacity
         self.material = material
-        self.occupants = []
+        self.occupants = {}  # Agent -> None, geordnete Menge
         self.has_reproduced = False  # einmal pro Nacht
         self.tribe = tribe  # optional
+        self.observer = None  # z.B. die Simulation, erfährt Belegungsänderungen
+        self.rng = random  # Platz im Haus, die Simulation setzt ihren Strom `houses`
 
 
     def has_space(self):
@@ -40,26 +47,38 @@ class House:
             agent (Agent): Agent, der das Haus betritt.
         """
         if self.has_space() and agent not in self.occupants:
-            self.occupants.append(agent)
+            self.occupants[agent] = None
+            if self.observer:
+                self.observer.occupancy_changed(self, 1)
             agent.in_house = True
             agent.current_house = self
             # Zufällige Position innerhalb des Hauses
-            agent.x = random.randint(int(self.x), int(self.x + self.width - 6))
-            agent.y = random.randint(int(self.y), int(self.y + self.height - 6))
+            agent.x = self.rng.randint(int(self.x), int(self.x + self.width - 6))
+            agent.y = self.rng.randint(int(self.y), int(self.y + self.height - 6))
 
     def leave(self, agent):
         """Lässt einen Agenten das Haus verlassen."""
         if agent in self.occupants:
-            self.occupants.remove(agent)
+            del self.occupants[agent]
+            if self.observer:
+                self.observer.occupancy_changed(self, -1)
             agent.in_house = False
             agent.current_house = None
 
     def reset_occupants(self):
+        """Leert das Haus nach der Nacht."""
+        left = len(self.occupants)
         for agent in self.occupants:
             agent.in_house = False
             agent.current_house = None
         self.occupants.clear()
         self.has_reproduced = False
+        if self.observer and left:
+            self.observer.occupancy_changed(self, -left)
+
+    def center(self):
+        """Gibt den Mittelpunkt des Hauses als (x, y) zurück."""
+        return (self.x + self.width / 2, self.y + self.height / 2)
 
     def contains(self, agent):
         """Prüft, ob ein Agent im Haus ist."""
@@ -68,8 +87,9 @@ class House:
 
     def draw(self, surface):
         """Zeichnet das Haus, falls es einem Tribe gehört, in der Tribe-Farbe."""
-        color = (150, 75, 0)  # Standard: Braun
-        if hasattr(self, "tribe") and self.tribe is not None:
+        import pygame
+        color = self.color
+        if self.tribe is not None:
             color = self.tribe.color  # Farbe vom Tribe
 
         pygame.draw.rect(surface, color, 
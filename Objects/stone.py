@@ -1,13 +1,14 @@
-import pygame
-
 class Stone:
-    """Repräsentiert einen Stein als Ressource."""
-    def __init__(self, x, y, size=4, color=(120, 120, 120)):
+    """Repräsentiert einen Stein als Ressource (Typdaten wie bei Tree an der Klasse)."""
+    __slots__ = ("x", "y", "slot")
+    size = 4
+    color = (120, 120, 120)
+
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.size = size
-        self.color = color
 
     def draw(self, surface):
         """Zeichnet den Stein."""
+        import pygame
         pygame.draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
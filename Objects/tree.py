@@ -1,13 +1,19 @@
-import pygame
-
 class Tree:
-    """Repräsentiert einen Baum als Ressource."""
-    def __init__(self, x, y, size=4, color=(139, 69, 19)):
+    """
+    Repräsentiert einen Baum als Ressource.
+
+    Größe und Farbe sind für alle Bäume gleich und liegen deshalb nur
+    einmal an der Klasse; eine Instanz speichert nur Position und Slot.
+    """
+    __slots__ = ("x", "y", "slot")
+    size = 4
+    color = (139, 69, 19)
+
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.size = size
-        self.color = color
 
     def draw(self, surface):
         """Zeichnet den Baum."""
+        import pygame
         pygame.draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
@@ -15,9 +15,10 @@ class Tribe:
     - Organisation von Hausbau-Nähe
     """
 
+    __slots__ = ("id", "members", "center_x", "center_y", "color", "max_size", "houses", "rng")
     _id_counter = 0
 
-    def __init__(self, founder_agent, center_x, center_y, color=None):
+    def __init__(self, founder_agent, center_x, center_y, color=None, rng=random):
         """
         Erstellt einen neuen Tribe.
 
@@ -26,18 +27,20 @@ class Tribe:
             center_x (float): X-Koordinate des Stammeszentrums
             center_y (float): Y-Koordinate des Stammeszentrums
             color (tuple, optional): RGB-Farbe des Tribes
+            rng (random.Random, optional): Zufallsquelle, Standard ist das Modul random
         """
         Tribe._id_counter += 1
         self.id = Tribe._id_counter
 
-        self.members = []
+        self.members = {}  # Agent -> None, geordnete Menge
+        self.rng = rng
         self.center_x = float(center_x)
         self.center_y = float(center_y)
 
         self.color = color if color else (
-            random.randint(80, 255),
-            random.randint(80, 255),
-            random.randint(80, 255)
+            rng.randint(80, 255),
+            rng.randint(80, 255),
+            rng.randint(80, 255)
         )
 
         self.max_size = 15  # ab hier Abspaltung möglich
@@ -53,16 +56,15 @@ class Tribe:
         Args:
             agent (Agent)
         """
-        if agent not in self.members:
-            self.members.append(agent)
-            agent.tribe = self
+        self.members[agent] = None
+        agent.tribe = self
 
     def remove_member(self, agent):
         """
         Entfernt einen Agenten aus dem Tribe.
         """
         if agent in self.members:
-            self.members.remove(agent)
+            del self.members[agent]
             agent.tribe = None
 
     # --------------------------------------------------
@@ -92,16 +94,16 @@ class Tribe:
             return None
 
         split_count = len(self.members) // 2
-        new_members = random.sample(self.members, split_count)
+        new_members = self.rng.sample(list(self.members), split_count)
 
         # Neuer Mittelpunkt leicht entfernt
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.randint(120, 200)
+        angle = self.rng.uniform(0, 2 * math.pi)
+        distance = self.rng.randint(120, 200)
 
         new_x = self.center_x + math.cos(angle) * distance
         new_y = self.center_y + math.sin(angle) * distance
 
-        new_tribe = Tribe(new_members[0], new_x, new_y)
+        new_tribe = Tribe(new_members[0], new_x, new_y, rng=self.rng)
 
         for agent in new_members:
             self.remove_member(agent)
@@ -121,8 +123,8 @@ class Tribe:
         Returns:
             (x, y)
         """
-        offset_x = random.randint(-80, 80)
-        offset_y = random.randint(-80, 80)
+        offset_x = self.rng.randint(-80, 80)
+        offset_y = self.rng.randint(-80, 80)
 
         return (
             int(self.center_x + offset_x),
@@ -1,13 +1,37 @@
-import pygame
 import random
 import math
-import time
+from array import array
+from clock import SimClock
+
+VISION_RADIUS = 100
+MOVE_BOUNDS = (1600, 1080)  # Standardgrenzen für Bewegung = Standardgröße der Welt
+THREAT_RADIUS = 80  # Gegner näher als das lösen die Flucht ins Haus aus
+REACH = 8           # Ressourcen näher als das werden abgebaut, sonst angesteuert
+
+# Rewards für Aktionen; "*_fail" gilt, wenn die Aktion nicht möglich war
+REWARDS = {
+    "wander": -0.01,
+    "eat_bush": 4,
+    "chop_tree": 3,
+    "craft_pickaxe": 8,
+    "craft_pickaxe_fail": -0.2,
+    "mine_stone": 5,
+    "mine_stone_fail": -1,
+}
+
+# Aktionen in fester Reihenfolge, Index in Agent.memory
+ACTIONS = ("wander", "chop_tree", "eat_bush", "craft_pickaxe", "mine_stone")
+ACTION_INDEX = {action: i for i, action in enumerate(ACTIONS)}
+INITIAL_MEMORY = (1.0, 0.0, 0.0, 0.0, 0.0)
+
+REWARD_WINDOW = 10  # Anzahl Rewards für die Glättung von total_reward
 
 class Agent:
     """
     Repräsentiert einen Agenten in der Simulation.
 
     Attributes:
+        id (int): Fortlaufende Agenten-ID.
         x (float): X-Position des Agenten.
         y (float): Y-Position des Agenten.
         hunger (float): Hungerlevel (0-100).
@@ -17,29 +41,52 @@ class Agent:
         has_pickaxe (bool): Ob der Agent eine Spitzhacke besitzt.
         in_house (bool): Ob der Agent aktuell in einem Haus ist.
         current_house (House): Referenz auf das Haus, in dem der Agent ist.
-        memory (dict): Lernwerte für verschiedene Aktionen.
+        memory (array): Lernwert pro Aktion, Reihenfolge wie ACTIONS.
         vision_radius (float): Wahrnehmungsradius für Ressourcen und Gegner.
+        rewards (dict): Rewards pro Aktion, Standard ist REWARDS.
+        bounds (tuple): (Breite, Höhe) des Bewegungsbereichs, in der Simulation deren Weltgröße.
         reproduction_cooldown (int): Zeit bis zur nächsten Fortpflanzung.
         reproduction_timer (int): Zähler für Fortpflanzung.
         total_reward (float): Durchschnittlicher Reward der letzten Aktionen.
-        reward_buffer (list): Zwischenspeicher für Reward-Glättung.
-        reward_tick (float): Zeitstempel des letzten Reward-Updates.
-        reward_interval (float): Intervall für Reward-Glättung.
+        reward_buffer (array): Ringpuffer der letzten REWARD_WINDOW Rewards.
+        reward_count (int): Belegte Plätze im Ringpuffer.
+        reward_pos (int): Nächster Schreibplatz im Ringpuffer.
+        reward_tick (int): Tick des letzten Reward-Updates.
+        reward_interval (int): Intervall für Reward-Glättung in Ticks.
+        clock (SimClock): Simulationsuhr der Welt.
+        rng (random.Random): Zufallsquelle, in der Simulation deren Strom `agents`.
         tribe (Tribe): Zugehöriger Stamm.
         generation (int): Generation des Agenten innerhalb des Stammes.
+        last_action (str): Zuletzt gewählte Aktion, None vor der ersten Entscheidung.
     """
 
-    def __init__(self, x, y, memory=None, tribe=None, generation=0):
+    # Feste Attribute statt __dict__; _pop/_idx nutzt nur AgentView (siehe population.py)
+    __slots__ = (
+        "id", "x", "y", "hunger", "age", "wood", "stone", "has_pickaxe", "in_house",
+        "current_house", "tribe", "generation", "last_action",
+        "total_reward", "reward_buffer", "reward_count", "reward_pos",
+        "clock", "rng", "reward_tick", "reward_interval", "memory", "vision_radius", "rewards", "bounds",
+        "reproduction_cooldown", "reproduction_timer", "_pop", "_idx",
+    )
+    _id_counter = 0
+
+    def __init__(self, x, y, memory=None, tribe=None, generation=0, clock=None, rng=random):
         """
         Initialisiert einen Agenten mit Position, optionalem Memory, Tribe und Generation.
 
         Args:
             x (float): Start-X-Position.
             y (float): Start-Y-Position.
-            memory (dict, optional): Initiales Lern-Memory.
+            memory (dict | sequence, optional): Initiales Lern-Memory, als
+                dict Aktion -> Wert oder als Werte in der Reihenfolge von ACTIONS.
             tribe (Tribe, optional): Zugehöriger Stamm.
             generation (int, optional): Generation innerhalb des Stammes.
+            clock (SimClock, optional): Simulationsuhr, sonst eine eigene.
+            rng (random.Random, optional): Zufallsquelle, Standard ist das Modul random.
         """
+        Agent._id_counter += 1
+        self.id = Agent._id_counter
+
         self.x = x
         self.y = y
         self.hunger = 100
@@ -52,23 +99,26 @@ class Agent:
 
         self.tribe = None  # Zugehörigkeit zu Tribe
         self.generation = generation
+        self.last_action = None
 
         self.total_reward = 0
-        self.reward_buffer = []
-        self.reward_tick = time.time()
-        self.reward_interval = 0.5
-
-        self.memory = memory if memory else {
-            "wander": 1.0,
-            "chop_tree": 0.0,
-            "eat_bush": 0.0,
-            "craft_pickaxe": 0.0,
-            "mine_stone": 0.0
-        }
-
-        self.vision_radius = 100
+        self.reward_buffer = array("d", bytes(8 * REWARD_WINDOW))
+        self.reward_count = 0
+        self.reward_pos = 0
+        self.clock = clock if clock else SimClock()
+        self.rng = rng
+        self.reward_tick = self.clock.tick
+        self.reward_interval = self.clock.ticks(0.5)
+
+        if isinstance(memory, dict):
+            memory = [memory.get(action, 0.0) for action in ACTIONS]
+        self.memory = array("d", memory if memory else INITIAL_MEMORY)
+
+        self.vision_radius = VISION_RADIUS
+        self.rewards = REWARDS
+        self.bounds = MOVE_BOUNDS
         self.reproduction_cooldown = 600
-        self.reproduction_timer = random.randint(0, 300)
+        self.reproduction_timer = rng.randint(0, 300)
 
     # ----------------------------
 
@@ -79,10 +129,23 @@ class Agent:
         Args:
             r (float): Reward-Wert.
         """
-        self.reward_buffer.append(r)
-        if len(self.reward_buffer) > 10:
-            self.reward_buffer.pop(0)
-        self.total_reward = sum(self.reward_buffer) / len(self.reward_buffer)
+        self.reward_buffer[self.reward_pos] = r
+        self.reward_pos = (self.reward_pos + 1) % REWARD_WINDOW
+        if self.reward_count < REWARD_WINDOW:
+            self.reward_count += 1
+        # Freie Plätze sind 0.0, die Summe über den ganzen Puffer genügt
+        self.total_reward = sum(self.reward_buffer) / self.reward_count
+
+    def recent_rewards(self):
+        """Rewards im Ringpuffer, vom ältesten zum neuesten."""
+        buf, pos, count = self.reward_buffer, self.reward_pos, self.reward_count
+        if count < REWARD_WINDOW:
+            return list(buf[:count])
+        return list(buf[pos:]) + list(buf[:pos])
+
+    def action_values(self):
+        """Memory als dict Aktion -> Wert, z.B. für Auswertungen."""
+        return dict(zip(ACTIONS, self.memory))
 
     def distance(self, obj):
         """
@@ -101,15 +164,27 @@ class Agent:
     def choose_action(self):
         """
         Wählt zufällig eine Aktion basierend auf Memory-Werten.
-        Höher bewertete Aktionen werden häufiger gewählt.
+        Höher bewertete Aktionen werden häufiger gewählt: jede Aktion hat
+        das Gewicht max(1, int(Wert + 1)).
+
+        Statt eine Liste mit entsprechend vielen Einträgen aufzubauen, wird
+        eine Position unter der Gewichtssumme gezogen und über die
+        kumulierten Gewichte aufgelöst. Das verbraucht dieselbe Zufallszahl
+        wie random.choice auf dieser Liste und liefert dieselbe Aktion.
 
         Returns:
             str: Name der gewählten Aktion.
         """
-        pool = []
-        for action, value in self.memory.items():
-            pool.extend([action] * max(1, int(value + 1)))
-        return random.choice(pool)
+        memory = self.memory
+        total = 0
+        for value in memory:
+            total += max(1, int(value + 1))
+        r = self.rng.randrange(total)
+        for action, value in zip(ACTIONS, memory):
+            r -= max(1, int(value + 1))
+            if r < 0:
+                return action
+        return ACTIONS[-1]
 
     def learn(self, action, reward):
         """
@@ -119,22 +194,23 @@ class Agent:
             action (str): Name der Aktion.
             reward (float): Reward für diese Aktion.
         """
-        self.memory[action] += reward
-        self.memory[action] = max(-5, min(10, self.memory[action]))
+        i = ACTION_INDEX[action]
+        self.memory[i] = max(-5, min(10, self.memory[i] + reward))
 
-        current_time = time.time()
-        if current_time - self.reward_tick >= self.reward_interval:
-            self.reward_tick = current_time
+        current_tick = self.clock.tick
+        if current_tick - self.reward_tick >= self.reward_interval:
+            self.reward_tick = current_tick
             self.add_reward(reward)
 
     # ----------------------------
 
     def move_random(self):
         """Bewegt den Agenten zufällig innerhalb erlaubter Grenzen."""
-        self.x += random.randint(-2, 2)
-        self.y += random.randint(-2, 2)
-        self.x = max(0, min(self.x, 880))
-        self.y = max(0, min(self.y, 720))
+        rng = self.rng
+        self.x += rng.randint(-2, 2)
+        self.y += rng.randint(-2, 2)
+        self.x = max(0, min(self.x, self.bounds[0]))
+        self.y = max(0, min(self.y, self.bounds[1]))
 
     def move_towards(self, target):
         """
@@ -153,11 +229,13 @@ class Agent:
         Findet das nächste sichtbare Objekt aus einer Liste.
 
         Args:
-            objects (list): Liste von Objekten mit x- und y-Attributen.
+            objects (list | SpatialGrid): Objekte mit x- und y-Attributen.
 
         Returns:
             Objekt oder None: Nächstes sichtbares Objekt.
         """
+        if hasattr(objects, "nearest"):  # SpatialGrid: nur umliegende Zellen prüfen
+            return objects.nearest(self.x, self.y, self.vision_radius)
         visible = [o for o in objects if self.distance(o) < self.vision_radius]
         return min(visible, key=lambda o: self.distance(o)) if visible else None
 
@@ -168,21 +246,18 @@ class Agent:
         Hauptlogik pro Tick für den Agenten.
 
         Args:
-            trees, stones, bushes (list): Ressourcenlisten.
+            trees, stones, bushes (list | SpatialGrid): Ressourcen.
             agents (list): Alle Agenten.
-            houses (list): Alle Häuser.
+            houses (list | HouseIndex): Alle Häuser.
             is_day (bool): Tag/Nacht-Status.
-            enemies (list): Liste von Gegnern.
+            enemies (list | SpatialGrid): Gegner.
 
         Returns:
             tuple: (status, data)
                 status (str): "alive", "dead" oder "build_house".
                 data: Zusatzinformationen, z.B. Hausmaterial und Position.
         """
-        self.age += 0.01
-        self.hunger -= 0.01
-
-        if self.hunger <= 0 or self.age >= 100:
+        if self.grow_older():
             return "dead", None
 
         # Nacht: im Haus bleiben
@@ -193,63 +268,96 @@ class Agent:
                          min(self.y, self.current_house.y + self.current_house.height - 6))
             return "alive", None
 
+        return self.act(trees, stones, bushes, agents, houses, is_day, enemies)
+
+    def grow_older(self):
+        """
+        Altert den Agenten um einen Tick und lässt seinen Hunger sinken.
+
+        Returns:
+            bool: True, wenn der Agent verhungert oder zu alt ist.
+        """
+        self.age += 0.01
+        self.hunger -= 0.01
+        return self.hunger <= 0 or self.age >= 100
+
+    def act(self, trees, stones, bushes, agents, houses, is_day, enemies, action=None):
+        """
+        Entscheidungsteil von `update` ohne Altern, Hunger und Nacht-Clamping.
+
+        Wird vom vektorisierten Backend (`Population`) direkt aufgerufen,
+        das die übrigen Schritte gebündelt für alle Agenten rechnet.
+
+        Args:
+            siehe `update`.
+            action (str, optional): Bereits gewählte Aktion (z.B. von
+                `Population.choose_actions`), sonst `choose_action`.
+
+        Returns:
+            tuple: (status, data), siehe `update`.
+        """
         # Tag: Haus verlassen
         if is_day and self.in_house:
             self.current_house.leave(self)
 
         # Gegnererkennung
-        threat = any(self.distance(e) < 80 for e in enemies)
+        nearby = enemies.query(self.x, self.y, THREAT_RADIUS) if hasattr(enemies, "query") else enemies
+        threat = any(self.distance(e) < THREAT_RADIUS for e in nearby)
         if threat:
-            safe_houses = [h for h in houses if h.has_space() and h.tribe == self.tribe]
-            if safe_houses:
-                nearest = min(safe_houses, key=lambda h: self.distance(h))
+            if hasattr(houses, "nearest_free"):  # HouseIndex: nur Häuser des eigenen Stammes prüfen
+                nearest = houses.nearest_free(self.x, self.y, self.tribe)
+            else:
+                safe_houses = [h for h in houses if h.has_space() and h.tribe == self.tribe]
+                nearest = min(safe_houses, key=lambda h: self.distance(h)) if safe_houses else None
+            if nearest:
                 nearest.enter(self)
                 return "alive", None
 
         # Aktion ausführen
-        action = self.choose_action()
-        print(f"{self.age:.2f}y chooses {action} with wood={self.wood} stone={self.stone}")
+        if action is None:
+            action = self.choose_action()
+        self.last_action = action
 
         if action == "wander":
             self.move_random()
-            self.learn(action, -0.01)
+            self.learn(action, self.rewards["wander"])
         elif action == "eat_bush":
             bush = self.find_nearest(bushes)
             if bush:
-                if self.distance(bush) < 8:
+                if self.distance(bush) < REACH:
                     bushes.remove(bush)
                     self.hunger = min(100, self.hunger + 40)
-                    self.learn(action, 4)
+                    self.learn(action, self.rewards["eat_bush"])
                 else:
                     self.move_towards(bush)
         elif action == "chop_tree":
             tree = self.find_nearest(trees)
             if tree:
-                if self.distance(tree) < 8:
+                if self.distance(tree) < REACH:
                     trees.remove(tree)
                     self.wood += 1
-                    self.learn(action, 3)
+                    self.learn(action, self.rewards["chop_tree"])
                 else:
                     self.move_towards(tree)
         elif action == "craft_pickaxe":
             if self.wood >= 5 and not self.has_pickaxe:
                 self.wood -= 5
                 self.has_pickaxe = True
-                self.learn(action, 8)
+                self.learn(action, self.rewards["craft_pickaxe"])
             else:
-                self.learn(action, -0.2)
+                self.learn(action, self.rewards["craft_pickaxe_fail"])
         elif action == "mine_stone":
             if self.has_pickaxe:
                 stone = self.find_nearest(stones)
                 if stone:
-                    if self.distance(stone) < 8:
+                    if self.distance(stone) < REACH:
                         stones.remove(stone)
                         self.stone += 1
-                        self.learn(action, 5)
+                        self.learn(action, self.rewards["mine_stone"])
                     else:
                         self.move_towards(stone)
             else:
-                self.learn(action, -1)
+                self.learn(action, self.rewards["mine_stone_fail"])
 
         # Haus bauen
         if self.wood >= 10:
@@ -274,17 +382,20 @@ class Agent:
         Returns:
             Agent: Kind-Agent mit vererbtem Memory, Tribe und Generation.
         """
-        new_memory = {}
-        for key in self.memory:
-            avg = (self.memory[key] + other.memory[key]) / 2
-            new_memory[key] = avg + random.uniform(-0.2, 0.2)
+        uniform = self.rng.uniform
+        new_memory = [
+            (mine + theirs) / 2 + uniform(-0.2, 0.2)
+            for mine, theirs in zip(self.memory, other.memory)
+        ]
 
         child = Agent(
             self.x,
             self.y,
             memory=new_memory,
             tribe=self.tribe,
-            generation=max(self.generation, other.generation) + 1
+            generation=max(self.generation, other.generation) + 1,
+            clock=self.clock,
+            rng=self.rng
         )
         return child
 
@@ -297,5 +408,6 @@ class Agent:
         Args:
             surface: Pygame Surface.
         """
+        import pygame  # erst beim Rendern laden, damit die Simulation headless läuft
         color = self.tribe.color if self.tribe else (255, 255, 255)
         pygame.draw.rect(surface, color, (self.x, self.y, 6, 6))
@@ -0,0 +1,291 @@
+import json
+import os
+import platform
+import random
+import time
+from datetime import datetime, timezone
+
+from agent import Agent
+from Objects.enemy import Enemy
+from population import Population
+from simulation import Simulation, TREE_COUNT, STONE_COUNT, BUSH_COUNT, ENEMY_COUNT
+
+SCALES = (100, 1000, 10000)
+RESOURCES = {"sparse": 0.25, "dense": 4}  # Faktor auf die Standardmengen
+PHASES = ("day", "night")
+
+FOREVER = 10 ** 9  # Tag-/Nachtlänge in Sekunden, damit die Phase im Lauf nicht wechselt
+AGENTS_PER_HOUSE = 25
+AGENTS_PER_ENEMY = 50
+
+# Gemessene Methoden: Anzeigename -> (Klasse, Methodenname)
+TIMED = {
+    "Agent.update": (Agent, "update"),
+    "Agent.act": (Agent, "act"),  # Entscheidungsteil, im NumPy-Backend nur noch für Sonderfälle
+    "Population.choose_actions": (Population, "choose_actions"),  # Aktionswahl aller Agenten (NumPy)
+    "Population.act": (Population, "act"),  # gebündelte Aktionen aller Agenten (NumPy)
+    "Agent.find_nearest": (Agent, "find_nearest"),
+    "Enemy.update": (Enemy, "update"),
+    "Simulation.reproduce": (Simulation, "reproduce"),
+}
+
+
+class Scenario:
+    """
+    Reproduzierbare Ausgangswelt für einen Benchmark.
+
+    Attributes:
+        agents (int): Anzahl Agenten (zufällig verteilt, Alter 0-60).
+        resources (str): Ressourcendichte, Schlüssel aus RESOURCES.
+        phase (str): "day" oder "night" (nachts mit Gegnern).
+        seed (int): Startwert der Zufallsgeneratoren.
+    """
+
+    def __init__(self, agents, resources, phase, seed=1):
+        self.agents = agents
+        self.resources = resources
+        self.phase = phase
+        self.seed = seed
+
+    @property
+    def name(self):
+        return f"{self.agents}-{self.resources}-{self.phase}"
+
+    def build(self, vectorized=False):
+        """
+        Erzeugt die Welt des Szenarios. Gleiche Seeds liefern identische Welten.
+        Agenten, Häuser und Nacht werden als Eingriffe über `apply_input`
+        gesetzt, damit sich ein Szenario auch aufzeichnen lässt.
+
+        Args:
+            vectorized (bool, optional): NumPy-Backend verwenden.
+
+        Returns:
+            Simulation
+        """
+        factor = RESOURCES[self.resources]
+        sim = Simulation(
+            vectorized=vectorized, seed=self.seed,
+            day_time=FOREVER, night_time=FOREVER,
+            tree_count=int(TREE_COUNT * factor),
+            stone_count=int(STONE_COUNT * factor),
+            bush_count=int(BUSH_COUNT * factor),
+            enemy_count=max(ENEMY_COUNT, self.agents // AGENTS_PER_ENEMY),
+        )
+        rng = random.Random(self.seed)
+        w, h = sim.world_size
+        for _ in range(self.agents - len(sim.agents)):
+            sim.apply_input("agent", x=rng.randint(0, w), y=rng.randint(0, h), age=rng.uniform(0, 60))
+        for _ in range(self.agents // AGENTS_PER_HOUSE):
+            sim.apply_input("house", x=rng.randint(0, w), y=rng.randint(0, h))
+        if self.phase == "night":
+            sim.apply_input("night")
+        return sim
+
+
+def scenarios(scales=SCALES, resources=tuple(RESOURCES), phases=PHASES, seed=1):
+    """Alle Kombinationen aus Größe, Ressourcendichte und Phase."""
+    return [Scenario(n, r, p, seed) for n in scales for r in resources for p in phases]
+
+
+class CallTimer:
+    """
+    Misst Aufrufe und Gesamtzeit ausgewählter Methoden, indem sie für die
+    Dauer eines `with`-Blocks auf Klassenebene umhüllt werden.
+
+    Zeiten sind inklusiv: `Agent.update` enthält z.B. die darin
+    aufgerufenen `Agent.find_nearest`.
+
+    Attributes:
+        calls (dict): Name -> Anzahl Aufrufe.
+        totals (dict): Name -> Gesamtzeit in Sekunden.
+    """
+
+    def __init__(self, targets):
+        """
+        Args:
+            targets (dict): Name -> (Klasse, Methodenname) bzw. (Objekt, Methodenname).
+        """
+        self.targets = targets
+        self.calls = dict.fromkeys(targets, 0)
+        self.totals = dict.fromkeys(targets, 0.0)
+        self._originals = []
+
+    def _wrap(self, name, func):
+        calls, totals = self.calls, self.totals
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                totals[name] += clock() - start
+                calls[name] += 1
+        return timed
+
+    def __enter__(self):
+        for name, (owner, attr) in self.targets.items():
+            original = owner.__dict__[attr] if isinstance(owner, type) else getattr(owner, attr)
+            self._originals.append((owner, attr, original))
+            setattr(owner, attr, self._wrap(name, getattr(owner, attr)))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, attr, original in reversed(self._originals):
+            if isinstance(owner, type):
+                setattr(owner, attr, original)
+            else:
+                delattr(owner, attr)
+        self._originals.clear()
+
+    def results(self):
+        """
+        Returns:
+            dict: Name -> {"calls", "total_s", "mean_us"}.
+        """
+        return {
+            name: {
+                "calls": self.calls[name],
+                "total_s": round(self.totals[name], 6),
+                "mean_us": round(1e6 * self.totals[name] / self.calls[name], 3) if self.calls[name] else None,
+            }
+            for name in self.targets
+        }
+
+
+def run_scenario(scenario, ticks, vectorized=False, ui=True, warmup=5):
+    """
+    Führt ein Szenario zweimal aus: einmal ungestört für Ticks pro Sekunde,
+    einmal mit `CallTimer` für die Zeiten pro Aufruf. Mit `ui` wird im
+    zweiten Lauf nach jedem Tick zusätzlich `Game.draw_ui` gemessen.
+
+    Args:
+        scenario (Scenario): Auszuführendes Szenario.
+        ticks (int): Gemessene Ticks pro Lauf.
+        vectorized (bool, optional): NumPy-Backend verwenden.
+        ui (bool, optional): `Game.draw_ui` mitmessen (benötigt pygame).
+        warmup (int, optional): Ungemessene Ticks vor jedem Lauf.
+
+    Returns:
+        dict: Ergebniszeile.
+    """
+    sim = scenario.build(vectorized)
+    sim.run(warmup)
+    start = time.perf_counter()
+    sim.run(ticks)
+    elapsed = time.perf_counter() - start
+    final_agents = len(sim.agents)
+
+    sim = scenario.build(vectorized)
+    sim.run(warmup)
+    targets = dict(TIMED)
+    game = _headless_game(sim) if ui else None
+    if game is not None:
+        targets["Game.draw_ui"] = (game, "draw_ui")
+    with CallTimer(targets) as timer:
+        for _ in range(ticks):
+            sim.step()
+            if game is not None:
+                game.draw_ui()
+                game.frame += 1
+
+    return {
+        "scenario": scenario.name,
+        "agents": scenario.agents,
+        "resources": scenario.resources,
+        "phase": scenario.phase,
+        "seed": scenario.seed,
+        "vectorized": vectorized,
+        "ticks": ticks,
+        "seconds": round(elapsed, 6),
+        "ticks_per_second": round(ticks / max(elapsed, 1e-9), 2),
+        "final_agents": final_agents,
+        "timings": timer.results(),
+    }
+
+
+def _headless_game(sim):
+    """Game ohne Mainloop und, falls kein Display gesetzt ist, ohne Fenster."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        from main import Game
+    except ImportError:
+        return None
+    return Game(sim, run=False)
+
+
+def environment():
+    """Angaben zur Messumgebung für die Ergebnisdatei."""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "numpy": numpy_version,
+    }
+
+
+def compare(results, baseline):
+    """
+    Vergleicht Ticks pro Sekunde mit einer früheren Ergebnisdatei.
+
+    Args:
+        results (list): Aktuelle Ergebniszeilen.
+        baseline (list): Ergebniszeilen des Vergleichslaufs.
+
+    Returns:
+        list: (Szenario, alt, neu, Faktor) für Szenarien, die in beiden vorkommen.
+    """
+    old = {(r["scenario"], r["vectorized"]): r["ticks_per_second"] for r in baseline}
+    rows = []
+    for r in results:
+        before = old.get((r["scenario"], r["vectorized"]))
+        if before:
+            rows.append((r["scenario"], before, r["ticks_per_second"], r["ticks_per_second"] / before))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    def csv_list(cast):
+        return lambda text: [cast(v) for v in text.split(",") if v]
+
+    parser = argparse.ArgumentParser(description="Benchmark-Szenarien für die Simulation.")
+    parser.add_argument("--scales", type=csv_list(int), default=list(SCALES), help="Agentenzahlen, z.B. 100,1000")
+    parser.add_argument("--resources", type=csv_list(str), default=list(RESOURCES), help="sparse,dense")
+    parser.add_argument("--phases", type=csv_list(str), default=list(PHASES), help="day,night")
+    parser.add_argument("--ticks", type=int, default=100, help="Gemessene Ticks pro Szenario")
+    parser.add_argument("--seed", type=int, default=1, help="Startwert der Szenarien")
+    parser.add_argument("--vectorized", action="store_true", help="NumPy-Backend für Agenten nutzen")
+    parser.add_argument("--no-ui", action="store_true", help="Game.draw_ui nicht messen")
+    parser.add_argument("--out", help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei, Ticks/s werden gegenübergestellt")
+    args = parser.parse_args()
+
+    results = []
+    for scenario in scenarios(args.scales, args.resources, args.phases, args.seed):
+        row = run_scenario(scenario, args.ticks, args.vectorized, ui=not args.no_ui)
+        results.append(row)
+        timings = ", ".join(f"{name} {t['mean_us']:.1f}us" for name, t in row["timings"].items()
+                            if t["mean_us"] is not None)
+        print(f"{row['scenario']:>22}: {row['ticks_per_second']:>9.1f} Ticks/s | {timings}")
+
+    report = {"environment": environment(), "results": results}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        print()
+        for name, before, after, factor in compare(results, baseline):
+            print(f"{name:>22}: {before:>9.1f} -> {after:>9.1f} Ticks/s ({factor:.2f}x)")
@@ -0,0 +1,117 @@
+MIN_ZOOM = 0.02   # Bildschirm-Pixel pro Welt-Pixel, weit herausgezoomt
+MAX_ZOOM = 8.0
+LOD_ZOOM = 0.5    # darunter werden dichte Bereiche als Kacheln zusammengefasst
+ZOOM_STEP = 1.25  # Faktor pro Mausrad-Raste
+
+
+class Camera:
+    """
+    Ausschnitt der Welt, der im Fenster zu sehen ist.
+
+    Hält die linke obere Ecke des Ausschnitts in Weltkoordinaten und den
+    Zoom (Bildschirm-Pixel pro Welt-Pixel). Jede Änderung erhöht `version`,
+    damit Renderer ihre gecachte statische Ebene neu aufbauen.
+
+    Attributes:
+        view (tuple): (Breite, Höhe) des Ausschnitts in Bildschirm-Pixeln.
+        world (tuple): (Breite, Höhe) der Welt in Pixeln.
+        x, y (float): Linke obere Ecke des Ausschnitts in Weltkoordinaten.
+        zoom (float): Bildschirm-Pixel pro Welt-Pixel.
+        version (int): Wird bei jeder Bewegung und jedem Zoom erhöht.
+    """
+
+    __slots__ = ("view", "world", "x", "y", "zoom", "version")
+
+    def __init__(self, view, world, x=0.0, y=0.0, zoom=1.0):
+        """
+        Args:
+            view (tuple): (Breite, Höhe) des Ausschnitts in Bildschirm-Pixeln.
+            world (tuple): (Breite, Höhe) der Welt in Pixeln.
+            x, y (float, optional): Linke obere Ecke in Weltkoordinaten.
+            zoom (float, optional): Bildschirm-Pixel pro Welt-Pixel.
+        """
+        self.view = view
+        self.world = world
+        self.x = float(x)
+        self.y = float(y)
+        self.zoom = zoom
+        self.version = 0
+        self.clamp()
+
+    @property
+    def lod(self):
+        """True, wenn so weit herausgezoomt ist, dass Dichte-Kacheln gezeichnet werden."""
+        return self.zoom < LOD_ZOOM
+
+    def visible(self):
+        """
+        Sichtbarer Bereich der Welt.
+
+        Returns:
+            tuple: (x, y, Breite, Höhe) in Weltkoordinaten.
+        """
+        return (self.x, self.y, self.view[0] / self.zoom, self.view[1] / self.zoom)
+
+    def to_screen(self, x, y):
+        """Weltkoordinaten -> Bildschirm-Pixel."""
+        return (int((x - self.x) * self.zoom), int((y - self.y) * self.zoom))
+
+    def to_world(self, sx, sy):
+        """Bildschirm-Pixel -> Weltkoordinaten."""
+        return (self.x + sx / self.zoom, self.y + sy / self.zoom)
+
+    def rect(self, x, y, w, h):
+        """
+        Rechteck in Weltkoordinaten als Bildschirm-Rechteck, mindestens 1 Pixel groß.
+
+        Returns:
+            tuple: (x, y, Breite, Höhe) in Bildschirm-Pixeln.
+        """
+        z = self.zoom
+        return (int((x - self.x) * z), int((y - self.y) * z), max(1, int(w * z)), max(1, int(h * z)))
+
+    # ----------------------------
+
+    def pan(self, dx, dy):
+        """
+        Verschiebt den Ausschnitt.
+
+        Args:
+            dx, dy (float): Verschiebung in Bildschirm-Pixeln.
+        """
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+
+    def zoom_at(self, factor, sx, sy):
+        """
+        Zoomt so, dass der Weltpunkt unter (sx, sy) an seiner Stelle bleibt.
+
+        Args:
+            factor (float): > 1 hinein, < 1 heraus.
+            sx, sy (float): Bezugspunkt in Bildschirm-Pixeln, z.B. der Mauszeiger.
+        """
+        wx, wy = self.to_world(sx, sy)
+        self.zoom = min(MAX_ZOOM, max(MIN_ZOOM, self.zoom * factor))
+        self.x = wx - sx / self.zoom
+        self.y = wy - sy / self.zoom
+        self.clamp()
+
+    def fit(self):
+        """Zoomt heraus, bis die ganze Welt im Ausschnitt liegt."""
+        self.zoom = max(MIN_ZOOM, min(1.0, self.view[0] / self.world[0], self.view[1] / self.world[1]))
+        self.x = self.y = 0.0
+        self.clamp()
+
+    def reset(self):
+        """Zurück zu Zoom 1 an der linken oberen Ecke der Welt."""
+        self.zoom = 1.0
+        self.x = self.y = 0.0
+        self.clamp()
+
+    def clamp(self):
+        """Hält den Ausschnitt innerhalb der Welt, kleinere Welten liegen oben links."""
+        w, h = self.view[0] / self.zoom, self.view[1] / self.zoom
+        self.x = min(max(0.0, self.x), max(0.0, self.world[0] - w))
+        self.y = min(max(0.0, self.y), max(0.0, self.world[1] - h))
+        self.version += 1
@@ -0,0 +1,376 @@
+import json
+import math
+import mmap
+import struct
+
+from agent import Agent, ACTIONS, ACTION_INDEX, REWARD_WINDOW
+from Objects.house import House
+from Objects.enemy import Enemy, Waypoint
+from Objects.tribe import Tribe
+from spatial import SpatialGrid, HouseIndex
+from registry import AgentRegistry
+from stats import WorldStats
+from population import Population
+from scheduler import Scheduler
+from streams import STREAMS
+
+MAGIC = b"LIFESIM\0"
+VERSION = 2
+
+# Aufbau einer Checkpoint-Datei (Little Endian):
+#   Kopf       MAGIC, Version, Länge des Meta-Blocks
+#   Meta       JSON: Konfiguration, Uhr, Zähler, Stringtabelle, Anzahlen
+#   RNG        Zustand jedes Zufallsstroms aus STREAMS (je 625 x uint32)
+#   Agenten    feste Records, danach Memory als Matrix Agenten x Aktionen
+#   Stämme, Häuser, Ressourcen-Slots pro Pool, Gegner: feste Records
+#   Indizes    alle Listen variabler Länge als int32 (Mitglieder, Häuser
+#              eines Stammes, Bewohner, Grid-Reihenfolge, Free-Lists)
+HEADER = struct.Struct("<8sHI")
+RNG_STATE = struct.Struct("<625I")
+AGENT = struct.Struct("<qdddddqq??iiiidqqii" + "B%dd" % REWARD_WINDOW)
+TRIBE = struct.Struct("<qdd3Biii")
+HOUSE = struct.Struct("<ddddiii?i")
+SLOT = struct.Struct("<dd?")
+ENEMY = struct.Struct("<ddddBddi")
+
+NO_TARGET, AGENT_TARGET, POINT_TARGET = 0, 1, 2
+
+
+class CheckpointError(ValueError):
+    """Datei ist kein Checkpoint oder hat eine unbekannte Version."""
+
+
+def save(sim, path):
+    """
+    Schreibt den kompletten Weltzustand in eine Checkpoint-Datei.
+
+    Gespeichert werden Agenten (inkl. Memory, Generation, Stamm und Haus),
+    Häuser mit Bewohnern, Stämme, Ressourcen-Pools, Gegner, der Zustand
+    der Zufallsgeneratoren sowie Uhr und Tag/Nacht-Phase. Eine geladene
+    Welt rechnet danach exakt so weiter wie das Original.
+    Das Ereignisprotokoll gehört nicht zum Weltzustand und wird nicht
+    gespeichert.
+
+    Args:
+        sim (Simulation): Zu speichernde Simulation.
+        path (str): Zieldatei.
+
+    Returns:
+        int: Größe der Datei in Bytes.
+    """
+    sim.settle()  # schlafende Agenten auf den aktuellen Tick bringen
+    strings = []
+    string_ids = {}
+
+    def string_id(s):
+        if s is None:
+            return -1
+        if s not in string_ids:
+            string_ids[s] = len(strings)
+            strings.append(s)
+        return string_ids[s]
+
+    agents = sim.agents
+    agent_ids = {a: i for i, a in enumerate(agents)}
+    tribe_ids = {t: i for i, t in enumerate(sim.tribes)}
+    house_ids = {h: i for i, h in enumerate(sim.houses)}
+    indices = []
+
+    actions = list(ACTIONS)
+
+    agent_data = bytearray()
+    memory = []
+    for a in agents:
+        buffer = a.recent_rewards()
+        agent_data += AGENT.pack(
+            a.id, a.x, a.y, a.hunger, a.age, a.total_reward, a.wood, a.stone,
+            a.has_pickaxe, a.in_house, a.generation,
+            tribe_ids.get(a.tribe, -1), house_ids.get(a.current_house, -1),
+            string_id(a.last_action), a.vision_radius, a.reward_tick, a.reward_interval,
+            a.reproduction_cooldown, a.reproduction_timer,
+            len(buffer), *(buffer + [0.0] * (REWARD_WINDOW - len(buffer))))
+        memory.extend(a.memory)
+
+    tribe_data = bytearray()
+    for t in sim.tribes:
+        tribe_data += TRIBE.pack(t.id, t.center_x, t.center_y, *t.color, t.max_size,
+                                 len(t.members), len(t.houses))
+        indices.extend(agent_ids.get(a, -1) for a in t.members)
+        indices.extend(house_ids[h] for h in t.houses)
+
+    house_data = bytearray()
+    for h in sim.houses:
+        house_data += HOUSE.pack(h.x, h.y, h.width, h.height, h.capacity,
+                                 string_id(h.material), tribe_ids.get(h.tribe, -1),
+                                 h.has_reproduced, len(h.occupants))
+        indices.extend(agent_ids[a] for a in h.occupants)
+
+    # Zeilenreihenfolge des NumPy-Backends, bestimmt die Zufallszahlen der Bewegung
+    if sim.population is not None:
+        indices.extend(agent_ids[a] for a in sim.population.views)
+
+    pool_meta = []
+    slot_data = bytearray()
+    for pool in _pools(sim):
+        for obj, active in zip(pool.slots, pool.active):
+            slot_data += SLOT.pack(obj.x, obj.y, active)
+        order = [obj.slot for obj in pool.grid]
+        indices.extend(order)
+        indices.extend(pool.free)
+        pool_meta.append({
+            "target": pool.target, "slots": len(pool.slots), "active": len(order),
+            "free": len(pool.free), "version": pool.version,
+            "regrow_credit": pool._regrow_credit,
+        })
+
+    enemy_data = bytearray()
+    for e in sim.enemies:
+        target = e.target
+        if target is None:
+            kind, tx, ty, ti = NO_TARGET, 0.0, 0.0, -1
+        elif target in agent_ids:
+            kind, tx, ty, ti = AGENT_TARGET, target.x, target.y, agent_ids[target]
+        else:
+            kind, tx, ty, ti = POINT_TARGET, target.x, target.y, -1
+        enemy_data += ENEMY.pack(e.x, e.y, e.speed, e.sight, kind, tx, ty, ti)
+
+    rng_states = sim.rng.getstate()
+    meta = {
+        "config": sim.config(),
+        "clock": {"tick": sim.clock.tick, "ticks_per_second": sim.clock.ticks_per_second,
+                  "speed": sim.clock.speed},
+        "is_day": sim.is_day,
+        "cycle_start": sim.cycle_start,
+        "scheduler_cursor": sim.scheduler.cursor,
+        "agent_counter": Agent._id_counter,
+        "tribe_counter": Tribe._id_counter,
+        "max_generation": sim.stats.max_generation,
+        "rng": {name: {"version": version, "gauss_next": gauss_next}
+                for name, (version, _, gauss_next) in rng_states.items()},
+        "numpy_rng": sim.population.rng.bit_generator.state if sim.population is not None else None,
+        "strings": strings,
+        "actions": actions,
+        "agents": len(agents),
+        "tribes": len(sim.tribes),
+        "houses": len(sim.houses),
+        "pools": pool_meta,
+        "enemies": len(sim.enemies),
+        "indices": len(indices),
+    }
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+        for name in STREAMS:
+            f.write(RNG_STATE.pack(*rng_states[name][1]))
+        f.write(agent_data)
+        f.write(struct.pack("<%dd" % len(memory), *memory))
+        f.write(tribe_data)
+        f.write(house_data)
+        f.write(slot_data)
+        f.write(enemy_data)
+        f.write(struct.pack("<%di" % len(indices), *indices))
+        return f.tell()
+
+
+class _Reader:
+    """Liest aufeinanderfolgende Abschnitte aus einem Puffer (z.B. mmap)."""
+
+    def __init__(self, view, offset):
+        self.view = view
+        self.offset = offset
+
+    def records(self, layout, count):
+        end = self.offset + layout.size * count
+        rows = list(layout.iter_unpack(self.view[self.offset:end])) if count else []
+        self.offset = end
+        return rows
+
+    def array(self, code, count):
+        layout = struct.Struct("<%d%s" % (count, code))
+        values = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size
+        return list(values)
+
+
+def load(path, events=None):
+    """
+    Lädt einen Checkpoint als neue Simulation.
+
+    Die Datei wird per Memory-Mapping gelesen; die festen Records werden
+    direkt aus dem gemappten Puffer entpackt, ohne die Datei vorher
+    komplett einzulesen.
+
+    Args:
+        path (str): Checkpoint-Datei.
+        events (EventLog, optional): Ereignisprotokoll der geladenen Welt.
+
+    Returns:
+        Simulation: Welt im gespeicherten Zustand.
+
+    Raises:
+        CheckpointError: Wenn die Datei kein gültiger Checkpoint ist.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            if len(view) < HEADER.size:
+                raise CheckpointError(f"{path}: Datei zu kurz für einen Checkpoint")
+            magic, version, meta_len = HEADER.unpack_from(view)
+            if magic != MAGIC:
+                raise CheckpointError(f"{path}: kein Life-Sim-Checkpoint")
+            if version != VERSION:
+                raise CheckpointError(f"{path}: Checkpoint-Version {version} wird nicht unterstützt")
+            meta = json.loads(bytes(view[HEADER.size:HEADER.size + meta_len]))
+            return _restore(meta, _Reader(view, HEADER.size + meta_len), events)
+
+
+def _restore(meta, reader, events):
+    """Baut die Simulation aus Meta-Block und Binärabschnitten auf."""
+    from simulation import Simulation
+
+    config = meta["config"]
+    sim = Simulation(events=events, **config)
+    strings = meta["strings"]
+    actions = meta["actions"]
+
+    rng_states = {name: reader.array("I", RNG_STATE.size // 4) for name in STREAMS}
+    agent_rows = reader.records(AGENT, meta["agents"])
+    memory = reader.array("d", meta["agents"] * len(actions))
+    tribe_rows = reader.records(TRIBE, meta["tribes"])
+    house_rows = reader.records(HOUSE, meta["houses"])
+    slot_rows = [reader.records(SLOT, p["slots"]) for p in meta["pools"]]
+    enemy_rows = reader.records(ENEMY, meta["enemies"])
+    indices = iter(reader.array("i", meta["indices"]))
+
+    def take(count):
+        return [next(indices) for _ in range(count)]
+
+    # Uhr und Phase
+    clock = sim.clock
+    clock.tick = meta["clock"]["tick"]
+    clock.ticks_per_second = meta["clock"]["ticks_per_second"]
+    clock.speed = meta["clock"]["speed"]
+    sim.is_day = meta["is_day"]
+    sim.cycle_start = meta["cycle_start"]
+
+    # Welt leeren, die Statistik entsteht beim Einfügen neu
+    sim.stats = WorldStats()
+    if sim.population is not None:
+        sim.population = Population(rng=sim.population.rng, bounds=sim.population.bounds)
+    sim.agents = AgentRegistry()
+    sim.scheduler = Scheduler(sim.scheduler.decisions_per_tick)
+    sim.scheduler.cursor = meta.get("scheduler_cursor", 0)
+    sim.agent_grid = SpatialGrid(sim.agent_grid.cell_size)
+    sim.houses = []
+    sim.house_grid = SpatialGrid(sim.house_grid.cell_size, position=House.center)
+    sim.house_index = HouseIndex(sim.house_index.cell_size)
+    sim.enemies.clear()
+    sim.tribes = []
+
+    # Agenten (noch ohne Population, Tribe und Haus)
+    agents = []
+    for i, row in enumerate(agent_rows):
+        (aid, x, y, hunger, age, total_reward, wood, stone, has_pickaxe, in_house, generation,
+         _tribe, _house, last_action, vision_radius, reward_tick, reward_interval,
+         cooldown, timer, buffer_len) = row[:20]
+        values = memory[i * len(actions):(i + 1) * len(actions)]
+        agent_memory = {a: v for a, v in zip(actions, values) if a in ACTION_INDEX and not math.isnan(v)}
+        agent = Agent(x, y, memory=agent_memory, generation=generation, clock=clock)
+        agent.id = aid
+        agent.hunger, agent.age = hunger, age
+        agent.wood, agent.stone = wood, stone
+        agent.has_pickaxe, agent.in_house = has_pickaxe, in_house
+        agent.last_action = strings[last_action] if last_action >= 0 else None
+        agent.total_reward = total_reward
+        for r in row[20:20 + buffer_len]:
+            agent.reward_buffer[agent.reward_pos] = r
+            agent.reward_pos = (agent.reward_pos + 1) % REWARD_WINDOW
+        agent.reward_count = buffer_len
+        agent.reward_tick, agent.reward_interval = reward_tick, reward_interval
+        agent.reproduction_cooldown, agent.reproduction_timer = cooldown, timer
+        agents.append(agent)
+
+    # Stämme
+    tribes = []
+    for tid, cx, cy, r, g, b, max_size, n_members, n_houses in tribe_rows:
+        tribe = Tribe.__new__(Tribe)
+        tribe.id = tid
+        tribe.center_x, tribe.center_y = cx, cy
+        tribe.color = (r, g, b)
+        tribe.max_size = max_size
+        tribe.rng = sim.rng.tribes
+        tribe.members = dict.fromkeys(agents[i] for i in take(n_members) if i >= 0)
+        tribe.houses = take(n_houses)  # Indizes, Häuser folgen unten
+        tribes.append(tribe)
+
+    # Häuser mit Bewohnern
+    houses = []
+    for x, y, w, h, capacity, material, tribe, has_reproduced, n_occupants in house_rows:
+        house = House(x, y, strings[material], w, h, capacity, tribes[tribe] if tribe >= 0 else None)
+        house.has_reproduced = has_reproduced
+        house.occupants = dict.fromkeys(agents[i] for i in take(n_occupants))
+        houses.append(house)
+    for tribe in tribes:
+        tribe.houses = [houses[i] for i in tribe.houses]
+
+    population, sim.population = sim.population, None
+    for agent, row in zip(agents, agent_rows):
+        agent.tribe = tribes[row[11]] if row[11] >= 0 else None
+        agent.current_house = houses[row[12]] if row[12] >= 0 else None
+        sim.add_agent(agent)
+        agent.vision_radius = row[14]
+    if population is not None:
+        for i in take(len(agents)):
+            population.add(agents[i])
+        sim.population = population
+    for house in houses:
+        sim.add_house(house)
+    sim.tribes = tribes
+    sim.stats.max_generation = max(sim.stats.max_generation, meta["max_generation"])
+
+    # Ressourcen: Slots, Grid-Reihenfolge und Free-List exakt wie gespeichert
+    for pool, info, rows in zip(_pools(sim), meta["pools"], slot_rows):
+        pool.target = info["target"]
+        pool.slots = []
+        pool.active = []
+        for slot, (x, y, active) in enumerate(rows):
+            obj = pool.factory(_number(x), _number(y))
+            obj.slot = slot
+            pool.slots.append(obj)
+            pool.active.append(active)
+        pool.grid.clear()
+        pool.grid.extend(pool.slots[i] for i in take(info["active"]))
+        pool.free = take(info["free"])
+        pool.version = info["version"]
+        pool._regrow_credit = info["regrow_credit"]
+        if pool.changes is not None:
+            pool.changes = []
+
+    # Gegner
+    for x, y, speed, sight, kind, tx, ty, ti in enemy_rows:
+        enemy = Enemy(x, y, sim.rng.enemies)
+        enemy.speed, enemy.sight = speed, sight
+        if kind == AGENT_TARGET:
+            enemy.target = agents[ti]
+        elif kind == POINT_TARGET:
+            enemy.target = Waypoint(tx, ty)
+        sim.enemies.append(enemy)
+
+    # Zähler und Zufallsgeneratoren zuletzt, Konstruktoren oben ziehen selbst Zufallszahlen
+    Agent._id_counter = meta["agent_counter"]
+    Tribe._id_counter = meta["tribe_counter"]
+    sim.rng.setstate({name: (info["version"], tuple(rng_states[name]), info["gauss_next"])
+                      for name, info in meta["rng"].items()})
+    if sim.population is not None and meta["numpy_rng"]:
+        sim.population.rng.bit_generator.state = meta["numpy_rng"]
+    return sim
+
+
+def _pools(sim):
+    return (sim.trees, sim.stones, sim.bushes)
+
+
+def _number(value):
+    """Ganzzahlige Koordinaten wieder als int liefern (wie beim Spawnen)."""
+    return int(value) if value.is_integer() else value
@@ -0,0 +1,60 @@
+TICKS_PER_SECOND = 60  # entspricht den 60 FPS des Fensters
+
+SPEEDS = (1, 10, None)  # Vorspulen: 1x, 10x, maximal (None)
+
+class SimClock:
+    """
+    Deterministische Simulationsuhr, gezählt in Ticks.
+
+    Alle zeitabhängigen Abläufe (Tag/Nacht, Reward-Glättung, Cooldowns)
+    rechnen in Ticks statt in Wanduhrzeit. Dadurch vergehen simulierte
+    Tage schneller, wenn schneller simuliert wird, und Ergebnisse hängen
+    nicht mehr von der Geschwindigkeit des Rechners ab.
+
+    Attributes:
+        tick (int): Anzahl bisher simulierter Ticks.
+        ticks_per_second (int): Ticks pro simulierter Sekunde.
+        speed (int or None): Vorspul-Faktor für das Fenster
+            (Ticks pro Frame), None = so schnell wie möglich.
+    """
+
+    def __init__(self, ticks_per_second=TICKS_PER_SECOND, speed=1):
+        """
+        Args:
+            ticks_per_second (int, optional): Ticks pro simulierter Sekunde.
+            speed (int or None, optional): Anfangs-Vorspulfaktor.
+        """
+        self.tick = 0
+        self.ticks_per_second = ticks_per_second
+        self.speed = speed
+
+    def advance(self, ticks=1):
+        """Stellt die Uhr um eine Anzahl Ticks weiter."""
+        self.tick += ticks
+
+    def ticks(self, seconds):
+        """
+        Rechnet simulierte Sekunden in Ticks um.
+
+        Args:
+            seconds (float): Dauer in simulierten Sekunden.
+
+        Returns:
+            int: Dauer in Ticks.
+        """
+        return int(round(seconds * self.ticks_per_second))
+
+    @property
+    def seconds(self):
+        """Bisher simulierte Zeit in Sekunden."""
+        return self.tick / self.ticks_per_second
+
+    def next_speed(self):
+        """Schaltet zum nächsten Vorspulfaktor aus SPEEDS weiter."""
+        i = SPEEDS.index(self.speed) if self.speed in SPEEDS else -1
+        self.speed = SPEEDS[(i + 1) % len(SPEEDS)]
+        return self.speed
+
+    def speed_label(self):
+        """Anzeigetext für den aktuellen Vorspulfaktor."""
+        return "MAX" if self.speed is None else f"{self.speed}x"
@@ -0,0 +1,112 @@
+import json
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING"}
+
+class EventLog:
+    """
+    Gepuffertes, gestuftes Ereignisprotokoll der Simulation.
+
+    Ereignisse landen in einem Ringpuffer fester Größe (für Debugging zur
+    Laufzeit) und werden optional gesammelt als NDJSON in eine Datei
+    geschrieben. Ereignisse unterhalb von `level` kosten nur einen
+    Vergleich, DEBUG-Ereignisse können zusätzlich ausgedünnt werden.
+
+    Attributes:
+        level (int): Mindeststufe, ab der Ereignisse erfasst werden.
+        buffer (deque): Ringpuffer der letzten Ereignisse als
+            (tick, level, event, agent_id, data)-Tupel.
+        path (str): Zieldatei oder None (nur Ringpuffer).
+        sample_every (int): Nur jedes n-te DEBUG-Ereignis erfassen.
+        flush_every (int): Anzahl gesammelter Ereignisse pro Schreibvorgang.
+    """
+
+    def __init__(self, path=None, level=INFO, capacity=10000, sample_every=1, flush_every=1000):
+        """
+        Args:
+            path (str, optional): Datei für NDJSON-Ausgabe, None = keine Datei.
+            level (int, optional): Mindeststufe (DEBUG, INFO, WARNING, OFF).
+            capacity (int, optional): Größe des Ringpuffers.
+            sample_every (int, optional): Ausdünnung der DEBUG-Ereignisse.
+            flush_every (int, optional): Ereignisse pro Schreibvorgang.
+        """
+        self.level = level
+        self.buffer = deque(maxlen=capacity)
+        self.path = path
+        self.sample_every = max(1, sample_every)
+        self.flush_every = flush_every
+        self._pending = []
+        self._sampled = 0
+        self._file = None
+
+    def enabled(self, level):
+        """Gibt True zurück, wenn Ereignisse dieser Stufe erfasst werden."""
+        return level >= self.level
+
+    def log(self, level, tick, event, agent_id=None, **data):
+        """
+        Erfasst ein Ereignis.
+
+        Args:
+            level (int): Stufe des Ereignisses.
+            tick (int): Simulations-Tick.
+            event (str): Art des Ereignisses, z.B. eine Aktion oder "died".
+            agent_id (int, optional): Betroffener Agent.
+            **data: Weitere Felder, z.B. Inventar.
+        """
+        if level < self.level:
+            return
+        if level <= DEBUG and self.sample_every > 1:
+            self._sampled += 1
+            if self._sampled % self.sample_every:
+                return
+
+        record = (tick, level, event, agent_id, data)
+        self.buffer.append(record)
+        if self.path:
+            self._pending.append(record)
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def recent(self, n=None):
+        """
+        Liefert die letzten Ereignisse aus dem Ringpuffer.
+
+        Args:
+            n (int, optional): Anzahl, None = alle gepufferten.
+
+        Returns:
+            list: Ereignis-Tupel, älteste zuerst.
+        """
+        records = list(self.buffer)
+        return records if n is None else records[-n:]
+
+    def flush(self):
+        """Schreibt alle gesammelten Ereignisse in einem Rutsch in die Datei."""
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        lines = []
+        for tick, level, event, agent_id, data in self._pending:
+            entry = {"tick": tick, "level": LEVEL_NAMES.get(level, level), "event": event}
+            if agent_id is not None:
+                entry["agent"] = agent_id
+            entry.update(data)
+            lines.append(json.dumps(entry))
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        self._pending.clear()
+
+    def close(self):
+        """Schreibt offene Ereignisse und schließt die Datei."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,298 +1,444 @@
 import pygame
-import random
 import time
-import math
-from agent import Agent
-from Objects.tree import Tree
-from Objects.stone import Stone
-from Objects.bush import Bush
-from Objects.house import House
-from Objects.enemy import Enemy
-from Objects.tribe import Tribe
+from simulation import Simulation, WORLD_W, WORLD_H
+from renderer import CameraRenderer, PixelRenderer, SnapshotRenderer
+from camera import Camera, ZOOM_STEP
+from snapshot import SimulationThread
+from profiler import PhaseProfiler
 
 
 SCREEN_W, SCREEN_H = 1920, 1080
-WORLD_W = 1600
 UI_X = 1550
 
-DAY_TIME = 30
-NIGHT_TIME = 20
+FRAME_BUDGET = 1 / 60  # Sekunden Rechenzeit pro Frame beim Vorspulen auf MAX
+UI_REFRESH = 15  # Frames zwischen zwei Neuberechnungen der Infoleiste
+TEXT_CACHE_SIZE = 512
+PROFILE_POS = (10, 10)  # Position des Profiler-Overlays in der Welt
+SEEK_STEP = 10  # simulierte Sekunden pro Sprung im Replay (Bild auf/ab)
+PAN_SPEED = 12  # Bildschirm-Pixel pro Frame beim Verschieben mit WASD
+RENDERERS = {"rects": CameraRenderer, "pixels": PixelRenderer}  # Zeichenwege ohne eigenen Thread
 
 class Game:
     """
-    Hauptklasse für das Spiel / Simulation.
+    Pygame-Renderer für die Simulation.
+
+    Die eigentliche Weltlogik steckt in `Simulation`; Game zeichnet nur
+    deren Zustand und treibt sie im Fenster mit 60 FPS an. Mit der Taste F
+    wird zwischen 1x, 10x und maximaler Geschwindigkeit umgeschaltet, die
+    Taste P blendet die Zeiten der einzelnen Frame-Phasen ein.
+
+    W/A/S/D oder Ziehen mit der rechten Maustaste verschieben den
+    Ausschnitt, das Mausrad zoomt zum Mauszeiger, C springt zurück auf
+    Zoom 1 und V zeigt die ganze Welt.
+
+    Beim Abspielen einer Aufzeichnung pausiert Leertaste, Pfeil rechts
+    rechnet pausiert einen Tick weiter, Bild auf/ab springt SEEK_STEP
+    Sekunden zurück bzw. vor und Pos1 an den Anfang.
+
+    Mit `threaded` rechnet die Simulation in einem eigenen Thread in ihrem
+    eigenen Tempo; das Fenster zeichnet mit 60 FPS den jeweils neuesten
+    Snapshot und bleibt auch bei MAX-Tempo bedienbar.
 
     Attributes:
+        sim (Simulation): Die dargestellte Simulation.
         screen (pygame.Surface): Haupt-Screen der Simulation.
         clock (pygame.time.Clock): Pygame Clock für FPS.
         font (pygame.font.Font): Schriftart für UI.
-        trees, stones, bushes (list): Listen der Ressourcenobjekte.
-        agents (list): Liste aller Agenten in der Welt.
-        houses (list): Liste aller Häuser.
-        enemies (list): Liste aller Gegner.
-        is_day (bool): Status Tag/Nacht.
-        cycle_timer (float): Zeitstempel des letzten Tag/Nacht-Wechsels.
+        camera (Camera): Gezeigter Ausschnitt der Welt.
+        renderer (CameraRenderer): Zeichnet den Ausschnitt mit gecachter statischer Ebene.
+        renderer_class (type): Klasse aus RENDERERS, mit der `renderer` entsteht.
+        ui_refresh (int): Frames zwischen zwei Neuberechnungen der Infoleiste.
+        text_cache (dict): Textzeile -> gerenderte Surface.
+        frame (int): Anzahl gezeichneter Frames.
+        profiler (PhaseProfiler): Zeitmessung der Frame-Phasen, auch von `sim` genutzt.
+        show_profile (bool): Ob das Profiler-Overlay angezeigt wird.
+        profile_csv (str): Datei, in die beim Beenden die Phasenzeiten geschrieben werden.
+        cprofile (CProfileWindow): Laufende cProfile-Messung oder None.
+        replay (Replay): Abgespielte Aufzeichnung oder None.
+        recorder (Recorder): Laufende Aufzeichnung oder None, wird beim Beenden geschlossen.
+        paused (bool): Ob die Simulation angehalten ist.
+        sim_thread (SimulationThread): Simulations-Thread oder None (alles im Fenster-Thread).
+        snapshot (Snapshot): Zuletzt gezeichneter Snapshot im Thread-Betrieb.
     """
 
-    def __init__(self):
+    def __init__(self, sim=None, ui_refresh=UI_REFRESH, run=True, profile_csv=None, cprofile=None,
+                 replay=None, recorder=None, paused=False, threaded=False, render="rects"):
         """
-        Initialisiert die Welt, spawnt Ressourcen, Agenten und Häuser
-        und startet die Mainloop.
+        Öffnet das Fenster und startet die Mainloop.
+
+        Args:
+            sim (Simulation, optional): Bestehende Simulation, sonst wird eine neue erzeugt.
+            ui_refresh (int, optional): Frames zwischen zwei Neuberechnungen der Infoleiste.
+            run (bool, optional): Mainloop sofort starten; False z.B. für Benchmarks,
+                die einzelne Methoden aufrufen.
+            profile_csv (str, optional): Phasenzeiten beim Beenden als CSV speichern.
+            cprofile (CProfileWindow, optional): cProfile für die ersten Ticks.
+            replay (Replay, optional): Aufzeichnung abspielen, `sim` ist dann deren Welt.
+            recorder (Recorder, optional): Aufzeichnung, die beim Beenden geschlossen wird.
+            paused (bool, optional): Angehalten starten.
+            threaded (bool, optional): Simulation in einem eigenen Thread rechnen.
+            render (str, optional): Zeichenweg aus RENDERERS, im Thread-Betrieb
+                zeichnet immer SnapshotRenderer.
         """
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("consolas", 16)
 
-        # Ressourcen generieren
-        self.trees = [Tree(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(160)]
-        self.stones = [Stone(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(120)]
-        self.bushes = [Bush(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(100)]
-
-        # Agenten und Häuser
-        self.agents = [Agent(400, 360), Agent(420, 360)]
-        self.houses = [House(430, 350, "wood")]
-        self.enemies = []
-        self.tribes = []
-
-        self.is_day = True
-        self.cycle_timer = time.time()
-
-        self.mainloop()
-
-    def update_day_night(self):
-        """
-        Prüft den Tag/Nacht-Wechsel basierend auf Zeit.
-        Spawnt Gegner bei Nacht und Ressourcen bei Tag.
-        """
-        elapsed = time.time() - self.cycle_timer
-
-        if self.is_day and elapsed > DAY_TIME:
-            self.is_day = False
-            self.cycle_timer = time.time()
-            self.spawn_enemies()  # Gegner erscheinen bei Nacht
-        elif not self.is_day and elapsed > NIGHT_TIME:
-            self.is_day = True
-            self.cycle_timer = time.time()
-            self.enemies.clear()  # Gegner verschwinden bei Tag
-            self.respawn_resources()
-            for house in self.houses:
-                house.reset_occupants()  # Nacht-Status zurücksetzen
-
-    def respawn_resources(self):
-        """
-        Setzt Ressourcen zurück und spawnt neue an zufälligen Positionen.
-        """
-        self.trees = [Tree(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(160)]
-        self.stones = [Stone(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(120)]
-        self.bushes = [Bush(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)) for _ in range(100)]
-
-    def spawn_enemies(self):
-        """
-        Spawnt Gegner zufällig in der Welt.
-        """
-        for _ in range(10):
-            self.enemies.append(Enemy(random.randint(0, WORLD_W), random.randint(0, SCREEN_H)))
-
-    def draw_ui(self):
+        self.replay = replay
+        self.recorder = recorder
+        self.paused = paused
+        if replay is not None:
+            sim = replay.sim
+        self.sim = sim if sim else Simulation()
+
+        self.ui_refresh = max(1, ui_refresh)
+        self.ui_lines = None
+        self.text_cache = {}
+        self.frame = 0
+
+        # Im Thread-Betrieb misst der Profiler nur die Phasen des Fensters
+        self.profiler = PhaseProfiler()
+        self.snapshot = None
+        self.camera = Camera((SCREEN_W, SCREEN_H), self.sim.world_size)
+        self.renderer_class = RENDERERS[render]
+        if threaded:
+            self.renderer = SnapshotRenderer(self.camera)
+            self.sim_thread = SimulationThread(lambda: self.sim, self.step, ui_lines=self.build_ui_lines,
+                                               ui_every=self.ui_refresh)
+            self.sim_thread.paused = paused
+        else:
+            self.renderer = self.renderer_class(self.sim, self.camera)
+            self.sim_thread = None
+            self.sim.profiler = self.profiler
+        self.show_profile = False
+        self.profile_lines = []
+        self.profile_csv = profile_csv
+        self.cprofile = cprofile
+
+        if run:
+            self.mainloop()
+
+    def build_ui_lines(self):
         """
-        Zeichnet die Informationsleiste rechts mit:
+        Stellt die Zeilen der Infoleiste aus `sim.stats` zusammen:
         - Bevölkerungsstatistiken
         - Überleben (Ø Alter, Hunger)
         - KI-Status (Reward, Top-Aktion)
         - Infrastruktur (Häuser, freie Plätze)
         - Stamm-Informationen (Anzahl Stämme, Mitglieder pro Stamm, Häuser pro Stamm)
         - Weltstatus (Tag/Nacht, Gegner, Ressourcen)
+
+        Returns:
+            list: Textzeilen.
         """
-        pygame.draw.rect(self.screen, (25, 25, 25), (UI_X, 0, 400, SCREEN_H))
+        sim = self.sim
+        stats = sim.stats
+        stats.refresh(sim)
 
-        pop = len(self.agents)
-        kids = sum(1 for a in self.agents if a.age < 18)
-        adults = sum(1 for a in self.agents if 18 <= a.age < 80)
-        hungry = sum(1 for a in self.agents if a.hunger < 30)
-        avg_age = round(sum(a.age for a in self.agents) / max(1, pop), 1)
-        avg_hunger = round(sum(a.hunger for a in self.agents) / max(1, pop), 1)
-        avg_reward = round(sum(a.total_reward for a in self.agents) / max(1, pop), 2)
-
-        # Häufigste Aktion
-        action_counter = {}
-        for a in self.agents:
-            for k, v in a.memory.items():
-                action_counter[k] = action_counter.get(k, 0) + v
-        top_action = max(action_counter, key=action_counter.get) if action_counter else "-"
-
-        # Häuser
-        total_capacity = sum(h.capacity for h in self.houses)
-        occupied = sum(len(h.occupants) for h in self.houses)
-        free_places = total_capacity - occupied
-
-        # Stämme zählen und Statistik erstellen
-        tribes = {}
-        for agent in self.agents:
-            if hasattr(agent, "tribe") and agent.tribe:
-                tribe_name = agent.tribe.name if hasattr(agent.tribe, "name") else str(id(agent.tribe))
-                if tribe_name not in tribes:
-                    tribes[tribe_name] = {"members": 0, "houses": 0}
-                tribes[tribe_name]["members"] += 1
-
-        for house in self.houses:
-            if hasattr(house, "tribe") and house.tribe:
-                tribe_name = house.tribe.name if hasattr(house.tribe, "name") else str(id(house.tribe))
-                if tribe_name not in tribes:
-                    tribes[tribe_name] = {"members": 0, "houses": 0}
-                tribes[tribe_name]["houses"] += 1
-
-        # Lines zusammenstellen
         lines = [
             "=== BEVÖLKERUNG ===",
-            f"Gesamt: {pop}",
-            f"Kinder: {kids}",
-            f"Erwachsene: {adults}",
-            f"Hungrig (<30): {hungry}",
+            f"Gesamt: {stats.population}",
+            f"Kinder: {stats.kids}",
+            f"Erwachsene: {stats.adults}",
+            f"Hungrig (<30): {stats.hungry}",
             "",
             "=== ÜBERLEBEN ===",
-            f"Ø Alter: {avg_age}",
-            f"Ø Hunger: {avg_hunger}",
+            f"Ø Alter: {round(stats.average(stats.sum_age), 1)}",
+            f"Ø Hunger: {round(stats.average(stats.sum_hunger), 1)}",
             "",
             "=== KI / LERNEN ===",
-            f"Ø Reward: {avg_reward}",
-            f"Top Aktion: {top_action}",
+            f"Ø Reward: {round(stats.average(stats.sum_reward), 2)}",
+            f"Top Aktion: {stats.top_action()}",
             "",
             "=== INFRASTRUKTUR ===",
-            f"Häuser: {len(self.houses)}",
-            f"Plätze frei: {free_places}",
+            f"Häuser: {stats.houses}",
+            f"Plätze frei: {stats.capacity - stats.occupied}",
             "",
             "=== STÄMME ===",
-            f"Stämme: {len(self.tribes)}",
+            f"Stämme: {len(sim.tribes)}",
         ]
 
-        for name, stats in tribes.items():
-            lines.append(f"{name}: {stats['members']} Mitglieder, {stats['houses']} Häuser")
+        for tribe, (members, houses) in stats.tribes.items():
+            lines.append(f"Stamm {tribe.id}: {members} Mitglieder, {houses} Häuser")
 
         lines += [
             "",
             "=== WELT ===",
-            f"Phase: {'TAG' if self.is_day else 'NACHT'}",
-            f"Gegner: {len(self.enemies)}",
-            f"Bäume: {len(self.trees)}",
-            f"Steine: {len(self.stones)}",
-            f"Büsche: {len(self.bushes)}",
+            f"Phase: {'TAG' if sim.is_day else 'NACHT'}",
+            f"Tempo: {sim.clock.speed_label()}"
+            + (f" ({self.sim_thread.rate:.0f} Ticks/s)" if self.sim_thread else ""),
+            f"Gegner: {len(sim.enemies)}",
+            f"Bäume: {len(sim.trees)}",
+            f"Steine: {len(sim.stones)}",
+            f"Büsche: {len(sim.bushes)}",
         ]
+        return lines
+
+    def render_text(self, line):
+        """
+        Liefert die gerenderte Surface einer Zeile aus dem Glyph-Cache.
+
+        Args:
+            line (str): Textzeile.
+
+        Returns:
+            pygame.Surface
+        """
+        text = self.text_cache.get(line)
+        if text is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            color = (180, 220, 255) if "===" in line else (200, 200, 200)
+            text = self.text_cache[line] = self.font.render(line, True, color)
+        return text
 
-        # Text zeichnen
+    def draw_ui(self):
+        """
+        Zeichnet die Informationsleiste rechts. Die Statistik wird nur alle
+        `ui_refresh` Frames neu berechnet, Texte kommen aus dem Glyph-Cache.
+        """
+        if self.sim_thread is not None:
+            self.ui_lines = self.snapshot.ui_lines
+        elif self.frame % self.ui_refresh == 0 or self.ui_lines is None:
+            self.ui_lines = self.build_ui_lines()
+
+        pygame.draw.rect(self.screen, (25, 25, 25), (UI_X, 0, 400, SCREEN_H))
         y = 15
-        for line in lines:
-            color = (200, 200, 200)
-            if "===" in line:
-                color = (180, 220, 255)
-            text = self.font.render(line, True, color)
-            self.screen.blit(text, (UI_X + 15, y))
+        for line in self.ui_lines:
+            if line:
+                self.screen.blit(self.render_text(line), (UI_X + 15, y))
             y += 22
 
+    def draw_profile(self):
+        """
+        Zeichnet das Profiler-Overlay (p50/p95/p99/max pro Phase) über die
+        Welt. Der Bereich wird im nächsten Frame aus der statischen Ebene
+        wiederhergestellt.
+
+        Returns:
+            pygame.Rect: Gezeichneter Bereich.
+        """
+        if self.frame % self.ui_refresh == 0 or not self.profile_lines:
+            self.profile_lines = self.profiler.report_lines()
+
+        x, y = PROFILE_POS
+        texts = [self.render_text(line) for line in self.profile_lines]
+        width = max(t.get_width() for t in texts) + 20
+        rect = pygame.Rect(x, y, width, 20 * len(texts) + 10)
+        pygame.draw.rect(self.screen, (25, 25, 25), rect)
+        for i, text in enumerate(texts):
+            self.screen.blit(text, (x + 10, y + 5 + 20 * i))
+        self.renderer.invalidate(rect)
+        return rect
+
+    def draw_world(self):
+        """
+        Zeichnet Ressourcen, Häuser, Agenten, Gegner und das Nacht-Overlay.
+
+        Im Thread-Betrieb wird der neueste Snapshot gezeichnet.
+
+        Returns:
+            list or None: Geänderte Rechtecke, None bei komplettem Neuzeichnen.
+        """
+        if self.sim_thread is not None:
+            self.snapshot = self.sim_thread.buffer.latest()
+            return self.renderer.draw(self.screen, self.snapshot)
+        return self.renderer.draw(self.screen)
+
+    def step(self):
+        """Rechnet einen Tick, beim Replay inklusive aufgezeichneter Eingriffe."""
+        if self.replay is not None:
+            self.replay.step()
+        else:
+            self.sim.step()
+
+    def advance_simulation(self):
+        """
+        Rechnet die Ticks dieses Frames: `clock.speed` Ticks bei festem
+        Vorspulfaktor, bei MAX so viele, wie in FRAME_BUDGET passen.
+        """
+        if self.paused or self.sim_thread is not None:
+            return
+        speed = self.sim.clock.speed
+        if speed is not None:
+            for _ in range(speed):
+                self.step()
+            return
+
+        deadline = time.perf_counter() + FRAME_BUDGET
+        self.step()
+        while time.perf_counter() < deadline:
+            self.step()
+
+    def seek(self, tick):
+        """
+        Springt im Replay zu einem Tick. Nach einem Rücksprung ist die Welt
+        ein neues Objekt, Renderer und Infoleiste werden neu aufgebaut.
+
+        Args:
+            tick (int): Ziel-Tick.
+        """
+        speed = self.sim.clock.speed
+        sim = self.replay.seek(tick)
+        sim.clock.speed = speed
+        if sim is not self.sim:
+            self.sim = sim
+            if self.sim_thread is None:
+                sim.profiler = self.profiler
+                self.renderer = self.renderer_class(sim, self.camera)
+        self.ui_lines = None
+
+    def command(self, action):
+        """
+        Führt eine Änderung an der Simulation aus, im Thread-Betrieb
+        zwischen zwei Ticks im Simulations-Thread.
+
+        Args:
+            action (callable): Aufruf ohne Argumente.
+        """
+        if self.sim_thread is not None:
+            self.sim_thread.submit(action)
+        else:
+            action()
+
+    def handle_replay_key(self, key):
+        """Tasten zum Anhalten, Schrittweise-Rechnen und Springen im Replay."""
+        step = self.sim.clock.ticks(SEEK_STEP)
+        if key == pygame.K_SPACE:
+            self.paused = not self.paused
+        elif key == pygame.K_RIGHT and self.paused:
+            self.replay.step()
+            self.ui_lines = None
+        elif key == pygame.K_PAGEDOWN:
+            self.seek(self.sim.tick + step)
+        elif key == pygame.K_PAGEUP:
+            self.seek(self.sim.tick - step)
+        elif key == pygame.K_HOME:
+            self.seek(0)
+        if self.sim_thread is not None:
+            self.sim_thread.paused = self.paused
+
+    def handle_camera_event(self, event):
+        """Mausrad zoomt, Ziehen mit rechter Maustaste verschiebt, C/V setzen den Zoom."""
+        if event.type == pygame.MOUSEWHEEL:
+            self.camera.zoom_at(ZOOM_STEP ** event.y, *pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEMOTION and event.buttons[2]:
+            self.camera.pan(-event.rel[0], -event.rel[1])
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+            self.camera.reset()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_v:
+            self.camera.fit()
+
+    def pan_camera(self):
+        """Verschiebt den Ausschnitt, solange W/A/S/D gedrückt sind."""
+        keys = pygame.key.get_pressed()
+        dx = (keys[pygame.K_d] - keys[pygame.K_a]) * PAN_SPEED
+        dy = (keys[pygame.K_s] - keys[pygame.K_w]) * PAN_SPEED
+        if dx or dy:
+            self.camera.pan(dx, dy)
 
     def mainloop(self):
         """
-        Haupt-Loop der Simulation:
-        - Tag/Nacht wechseln
-        - Agenten aktualisieren
-        - Gegner aktualisieren
-        - Hausbau & Fortpflanzung
+        Haupt-Loop des Fensters:
+        - Events verarbeiten
+        - Simulation entsprechend Vorspulfaktor weiterrechnen
         - Rendern der Welt und UI
+
+        Jede Phase wird über `profiler` gemessen.
         """
+        profiler = self.profiler
+        mark = profiler.mark
+        if self.sim_thread is not None:
+            self.sim_thread.start()
+            while self.sim_thread.buffer.latest() is None:
+                time.sleep(0.001)
         while True:
+            profiler.start()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    if self.sim_thread is not None:
+                        self.sim_thread.stop()
+                    if self.profile_csv:
+                        profiler.export_csv(self.profile_csv)
+                    if self.recorder:
+                        self.recorder.close()
+                    if self.sim.metrics is not None:
+                        self.sim.metrics.close()
+                    if self.replay:
+                        self.replay.close()
                     pygame.quit()
                     return
-
-            self.update_day_night()
-
-            # Fortpflanzung nachts
-            if not self.is_day:
-                for house in self.houses:
-                    adults = [a for a in house.occupants if a.age >= 18]
-                    if len(adults) >= 2 and not house.has_reproduced:
-                        num_children = random.randint(1, 2)
-                        for _ in range(num_children):
-                            parents = random.sample(adults, 2)
-                            child = parents[0].make_child(parents[1])
-                            self.agents.append(child)
-                            house.enter(child)
-                        house.has_reproduced = True
-
-            dead_agents = []
-
-            for agent in self.agents:
-                status, data = agent.update(
-                    self.trees,
-                    self.stones,
-                    self.bushes,
-                    self.agents,
-                    self.houses,
-                    self.is_day,
-                    self.enemies
-                )
-
-                if status == "dead":
-                    dead_agents.append(agent)
-
-                if status == "build_house":
-                    material, x, y = data
-                    
-                    # Nearby Tribe finden
-                    nearby_tribes = [t for t in self.tribes if any(
-                        math.hypot(h.x - x, h.y - y) < 200 for h in t.houses
-                    )]
-
-                    if nearby_tribes:
-                        tribe = random.choice(nearby_tribes)
-                        tribe.add_member(agent)  # Agent dem Tribe hinzufügen
-                    else:
-                        # Neuen Tribe erstellen, falls keiner in der Nähe
-                        tribe = Tribe(agent, x, y)
-                        self.tribes.append(tribe)
-                    
-                    agent.tribe = tribe
-                    # Haus erzeugen und Tribe zuordnen
-                    new_house = House(x, y, material, tribe=tribe)
-                    self.houses.append(new_house)
-                    tribe.houses.append(new_house)
-
-            for enemy in self.enemies:
-                killed = enemy.update(self.agents, self.houses)
-                if killed and killed in self.agents:
-                    self.agents.remove(killed)
-
-            for d in dead_agents:
-                if d in self.agents:
-                    self.agents.remove(d)
-
-            # Render
-            bg = (0, 120, 0) if self.is_day else (10, 30, 60)
-            self.screen.fill(bg)
-
-            for obj in self.trees + self.stones + self.bushes + self.houses:
-                obj.draw(self.screen)
-
-            for agent in self.agents:
-                # Tribe-Farbe, falls Agent einem Tribe angehört
-                color = agent.tribe.color if hasattr(agent, "tribe") and agent.tribe else (255, 255, 255)
-                pygame.draw.rect(self.screen, color, (agent.x, agent.y, 6, 6))
-
-
-
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
-
-            # Nacht-Overlay
-            if not self.is_day:
-                overlay = pygame.Surface((WORLD_W, SCREEN_H))
-                overlay.set_alpha(100)
-                overlay.fill((0, 0, 50))
-                self.screen.blit(overlay, (0, 0))
-
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                    self.command(lambda: self.sim.clock.next_speed())
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                    self.show_profile = not self.show_profile
+                if event.type == pygame.KEYDOWN and self.replay is not None:
+                    self.command(lambda key=event.key: self.handle_replay_key(key))
+                self.handle_camera_event(event)
+            self.pan_camera()
+            mark("events")
+
+            self.advance_simulation()
+
+            dirty = self.draw_world()
+            mark("render")
             self.draw_ui()
-            pygame.display.flip()
+            if self.show_profile:
+                rect = self.draw_profile()
+                if dirty is not None:
+                    dirty.append(rect)
+            mark("draw_ui")
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                dirty.append(pygame.Rect(UI_X, 0, SCREEN_W - UI_X, SCREEN_H))
+                pygame.display.update(dirty)
+            mark("flip")
+            profiler.end_frame()
+
+            if self.cprofile:
+                self.cprofile.update(self.sim.tick)
+            self.frame += 1
             self.clock.tick(60)
 
-Game()
+
+if __name__ == "__main__":
+    import argparse
+    from profiler import CProfileWindow
+
+    parser = argparse.ArgumentParser(description="Life Sim AI im Fenster.")
+    parser.add_argument("--profile-csv", help="Phasenzeiten der letzten Frames beim Beenden als CSV speichern")
+    parser.add_argument("--cprofile", type=int, metavar="TICKS", help="cProfile für die ersten TICKS Ticks")
+    parser.add_argument("--cprofile-out", help="cProfile-Rohdaten in diese Datei schreiben")
+    parser.add_argument("--seed", type=int, help="Startwert der Zufallsströme")
+    parser.add_argument("--world-size", default=f"{WORLD_W}x{WORLD_H}", help="Weltgröße in Pixeln, z.B. 16000x10800")
+    parser.add_argument("--vectorized", action="store_true", help="NumPy-Backend für Agenten nutzen")
+    parser.add_argument("--record", help="Lauf für ein späteres Replay aufzeichnen (.gz für gzip)")
+    parser.add_argument("--replay", help="Aufzeichnung abspielen (Leertaste, Pfeil rechts, Bild auf/ab, Pos1)")
+    parser.add_argument("--seek", type=int, metavar="TICK", help="Replay headless bis TICK vorspulen und pausieren")
+    parser.add_argument("--threaded", action="store_true", help="Simulation in eigenem Thread rechnen")
+    parser.add_argument("--render", choices=sorted(RENDERERS), default="rects",
+                        help="Welt per Objekt (rects) oder gebündelt in den Pixelpuffer (pixels, NumPy) zeichnen")
+    parser.add_argument("--metrics", help="Zeitreihe der Kennzahlen in diese Datei schreiben (.csv oder .ndjson)")
+    parser.add_argument("--metrics-port", type=int, help="Mit --metrics: letzten Messpunkt per HTTP auf 127.0.0.1 anbieten")
+    args = parser.parse_args()
+
+    cprofile = CProfileWindow(args.cprofile, args.cprofile_out) if args.cprofile else None
+    sim = replay = recorder = None
+    if args.replay:
+        from replay import Replay
+        replay = Replay(args.replay)
+        if args.seek:
+            replay.seek(args.seek)
+    else:
+        world_size = tuple(int(v) for v in args.world_size.lower().split("x"))
+        sim = Simulation(vectorized=args.vectorized, seed=args.seed, world_size=world_size)
+        if args.record:
+            from replay import Recorder
+            recorder = Recorder(sim, args.record)
+        if args.metrics:
+            from metrics import MetricsExporter
+            MetricsExporter(sim, args.metrics, port=args.metrics_port)
+    Game(sim, profile_csv=args.profile_csv, cprofile=cprofile, replay=replay, recorder=recorder,
+         paused=bool(args.seek), threaded=args.threaded, render=args.render)
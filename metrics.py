@@ -0,0 +1,288 @@
+try:
+    import numpy as np
+except ImportError:  # ohne NumPy gibt es auch kein vektorisiertes Backend
+    np = None
+
+import csv
+import io
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from agent import ACTIONS
+
+SAMPLE_EVERY = 600   # Ticks zwischen zwei Messpunkten (10 s Simulationszeit)
+FLUSH_EVERY = 60     # Messpunkte pro Schreibvorgang
+KEEP_FILES = 5       # Anzahl rotierter Dateien, die erhalten bleiben
+BIN_WIDTH = 10       # Breite der Alters- und Hunger-Klassen
+BINS = 10            # Klassen 0-10, 10-20, ..., 90-100 (Randwerte in der letzten)
+
+FORMATS = ("csv", "ndjson", "columnar")
+
+FIELDS = (
+    ["tick", "seconds", "is_day", "population", "kids", "adults", "elders", "hungry",
+     "age_mean", "hunger_mean", "reward_mean"]
+    + [f"age_{i * BIN_WIDTH}" for i in range(BINS)]
+    + [f"hunger_{i * BIN_WIDTH}" for i in range(BINS)]
+    + [f"memory_{action}" for action in ACTIONS]
+    + ["tribes", "tribe_max", "tribe_mean", "houses", "capacity", "occupied",
+       "trees", "stones", "bushes", "enemies", "max_generation"]
+)
+
+
+def _histogram(values):
+    """Häufigkeiten in BINS Klassen der Breite BIN_WIDTH (Python-Listen)."""
+    counts = [0] * BINS
+    last = BINS - 1
+    for v in values:
+        i = int(v // BIN_WIDTH)
+        counts[0 if i < 0 else last if i > last else i] += 1
+    return counts
+
+
+def sample(sim):
+    """
+    Misst den aktuellen Zustand einer Simulation.
+
+    Zähler kommen aus `sim.stats`, Summen aus `WorldStats.refresh`; nur die
+    Verteilungen von Alter und Hunger brauchen einen eigenen Durchlauf,
+    mit NumPy-Backend als Array-Operation.
+
+    Args:
+        sim (Simulation): Zu messende Welt.
+
+    Returns:
+        dict: Ein Wert pro Eintrag in FIELDS.
+    """
+    stats = sim.stats
+    stats.refresh(sim)
+    n = stats.sampled
+
+    pop = sim.population
+    if pop is not None and pop.count:
+        age, hunger = pop.age[:pop.count], pop.hunger[:pop.count]
+        ages = np.bincount(np.clip(age // BIN_WIDTH, 0, BINS - 1).astype(int), minlength=BINS).tolist()
+        hungers = np.bincount(np.clip(hunger // BIN_WIDTH, 0, BINS - 1).astype(int), minlength=BINS).tolist()
+        elders = int((age >= 80).sum())
+    else:
+        ages = _histogram(a.age for a in sim.agents)
+        hungers = _histogram(a.hunger for a in sim.agents)
+        elders = sum(1 for a in sim.agents if a.age >= 80)
+
+    members = [counts[0] for counts in stats.tribes.values() if counts[0] > 0]
+    row = {
+        "tick": sim.clock.tick,
+        "seconds": round(sim.clock.seconds, 2),
+        "is_day": int(sim.is_day),
+        "population": stats.population,
+        "kids": stats.kids,
+        "adults": stats.adults,
+        "elders": elders,
+        "hungry": stats.hungry,
+        "age_mean": round(stats.average(stats.sum_age), 3),
+        "hunger_mean": round(stats.average(stats.sum_hunger), 3),
+        "reward_mean": round(stats.average(stats.sum_reward), 4),
+    }
+    for i in range(BINS):
+        row[f"age_{i * BIN_WIDTH}"] = ages[i]
+    for i in range(BINS):
+        row[f"hunger_{i * BIN_WIDTH}"] = hungers[i]
+    for action in ACTIONS:
+        row[f"memory_{action}"] = round(stats.action_totals.get(action, 0.0) / max(1, n), 4)
+    row.update({
+        "tribes": len(members),
+        "tribe_max": max(members, default=0),
+        "tribe_mean": round(sum(members) / len(members), 2) if members else 0,
+        "houses": stats.houses,
+        "capacity": stats.capacity,
+        "occupied": stats.occupied,
+        "trees": len(sim.trees),
+        "stones": len(sim.stones),
+        "bushes": len(sim.bushes),
+        "enemies": len(sim.enemies),
+        "max_generation": stats.max_generation,
+    })
+    return row
+
+
+class MetricsExporter:
+    """
+    Schreibt alle `every` Ticks einen Messpunkt als Zeitreihe in eine Datei.
+
+    Wird wie `Recorder` an eine Simulation gehängt (`sim.metrics`);
+    `Simulation.step` meldet jeden Tick, gemessen wird aber nur alle
+    `every` Ticks, dazwischen kostet der Exporter einen Modulo-Vergleich.
+    Messpunkte werden gesammelt und in Blöcken angehängt, ab `max_bytes`
+    rotiert die Datei wie ein Logfile (metrics.csv -> metrics.csv.1 ...).
+
+    Formate:
+        csv       Eine Zeile pro Messpunkt, Kopfzeile am Anfang jeder Datei.
+        ndjson    Ein JSON-Objekt pro Messpunkt.
+        columnar  Ein JSON-Objekt pro Schreibvorgang mit einer Liste pro Spalte.
+
+    Mit `port` beantwortet ein lokaler HTTP-Server in einem eigenen Thread
+    `/metrics` (Prometheus-Textformat) und `/metrics.json` mit dem letzten
+    Messpunkt.
+
+    Attributes:
+        sim (Simulation): Gemessene Welt.
+        path (str): Zieldatei.
+        format (str): "csv", "ndjson" oder "columnar".
+        every (int): Ticks zwischen zwei Messpunkten.
+        flush_every (int): Messpunkte pro Schreibvorgang.
+        max_bytes (int): Dateigröße, ab der rotiert wird, None = nie.
+        keep (int): Anzahl rotierter Dateien.
+        latest (dict): Letzter Messpunkt oder None.
+        server (ThreadingHTTPServer): HTTP-Endpunkt oder None.
+    """
+
+    def __init__(self, sim, path, every=SAMPLE_EVERY, format=None, flush_every=FLUSH_EVERY,
+                 max_bytes=None, keep=KEEP_FILES, port=None):
+        """
+        Args:
+            sim (Simulation): Zu messende Welt.
+            path (str): Zieldatei, es wird angehängt.
+            every (int, optional): Ticks zwischen zwei Messpunkten.
+            format (str, optional): Format, sonst aus der Endung (.csv, sonst ndjson).
+            flush_every (int, optional): Messpunkte pro Schreibvorgang.
+            max_bytes (int, optional): Rotieren ab dieser Dateigröße.
+            keep (int, optional): Anzahl rotierter Dateien.
+            port (int, optional): Port des HTTP-Endpunkts auf 127.0.0.1, 0 = beliebig.
+
+        Raises:
+            ValueError: Bei unbekanntem Format.
+        """
+        if format is None:
+            format = "csv" if path.endswith(".csv") else "ndjson"
+        if format not in FORMATS:
+            raise ValueError(f"Unbekanntes Metrik-Format {format!r}, erlaubt: {', '.join(FORMATS)}")
+        self.sim = sim
+        self.path = path
+        self.format = format
+        self.every = max(1, every)
+        self.flush_every = max(1, flush_every)
+        self.max_bytes = max_bytes
+        self.keep = keep
+        self.latest = None
+        self._pending = []
+        self._file = None
+        self.server = None
+        if port is not None:
+            self.serve(port)
+        sim.metrics = self
+
+    # ----------------------------
+
+    def stepped(self, sim):
+        """Nach jedem Tick aufgerufen, misst ggf. einen Messpunkt."""
+        if sim.clock.tick % self.every == 0:
+            self.record(sim)
+
+    def record(self, sim=None):
+        """Misst sofort einen Messpunkt, unabhängig von `every`."""
+        row = sample(sim if sim is not None else self.sim)
+        self.latest = row
+        self._pending.append(row)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Hängt alle gesammelten Messpunkte in einem Rutsch an die Datei an."""
+        if not self._pending:
+            return
+        if self._file is None:
+            self._open()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+        rows, self._pending = self._pending, []
+        if self.format == "csv":
+            writer = csv.writer(self._file)
+            writer.writerows([row[f] for f in FIELDS] for row in rows)
+        elif self.format == "ndjson":
+            self._file.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows))
+        else:
+            columns = {f: [row[f] for row in rows] for f in FIELDS}
+            self._file.write(json.dumps(columns, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Schreibt offene Messpunkte, schließt Datei und HTTP-Endpunkt."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if getattr(self.sim, "metrics", None) is self:
+            self.sim.metrics = None
+
+    # ----------------------------
+
+    def _open(self):
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        if self.format == "csv" and self._file.tell() == 0:
+            csv.writer(self._file).writerow(FIELDS)
+
+    def _rotate(self):
+        """Verschiebt path -> path.1 -> path.2 ... und beginnt eine neue Datei."""
+        self._file.close()
+        if self.keep <= 0:
+            os.remove(self.path)
+        else:
+            for i in range(self.keep - 1, 0, -1):
+                older = f"{self.path}.{i}"
+                if os.path.exists(older):
+                    os.replace(older, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self._open()
+
+    # ----------------------------
+
+    def prometheus(self):
+        """Letzter Messpunkt im Prometheus-Textformat."""
+        row = self.latest
+        if row is None:
+            return ""
+        out = io.StringIO()
+        for field in FIELDS:
+            out.write(f"lifesim_{field} {row[field]}\n")
+        return out.getvalue()
+
+    def serve(self, port=0):
+        """
+        Startet den HTTP-Endpunkt auf 127.0.0.1 in einem Hintergrund-Thread.
+
+        Args:
+            port (int, optional): Port, 0 = beliebiger freier Port.
+
+        Returns:
+            int: Tatsächlicher Port.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, kind = exporter.prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, kind = json.dumps(exporter.latest), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # keine Zeile pro Abfrage auf stderr
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        return self.server.server_address[1]
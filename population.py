@@ -0,0 +1,497 @@
+try:
+    import numpy as np
+except ImportError:  # optionales Backend, ohne NumPy läuft die Simulation skalar
+    np = None
+
+from array import array
+from agent import Agent, MOVE_BOUNDS, ACTIONS, ACTION_INDEX, REWARD_WINDOW, THREAT_RADIUS, REACH
+from spatial import grid_pairs, grid_nearest
+
+
+# Öffentliche Spalten: werden über AgentView als Attribute angeboten
+COLUMNS = {
+    "x": "float64",
+    "y": "float64",
+    "hunger": "float64",
+    "age": "float64",
+    "wood": "int64",
+    "stone": "int64",
+    "has_pickaxe": "bool",
+    "in_house": "bool",
+    "total_reward": "float64",
+    "reward_tick": "int64",
+    "reward_interval": "int64",
+    "reward_count": "int64",
+    "reward_pos": "int64",
+}
+
+# Öffentliche Matrizen (Spaltenname -> Breite): AgentView liefert seine Zeile als View
+MATRICES = {
+    "memory": len(ACTIONS),
+    "reward_buffer": REWARD_WINDOW,
+}
+
+# Interne Spalten: Hausgrenzen für das Clamping, vorgemerkte Bewegungen,
+# letzte Aktion (Index in ACTIONS, -1 = keine) und zuletzt gemeldete Rasterzelle
+_INTERNAL_COLUMNS = {
+    "has_house": "bool",
+    "hx0": "float64", "hx1": "float64", "hy0": "float64", "hy1": "float64",
+    "wander": "bool",
+    "seek": "bool",
+    "tx": "float64", "ty": "float64",
+    "learning": "bool",
+    "learn_action": "int64",
+    "learn_reward": "float64",
+    "_draw": "float64",
+    "action": "int64",
+    "cell_x": "int64", "cell_y": "int64",
+}
+
+_NO_CELL = -(1 << 62)  # Rasterzelle neuer Zeilen, wird beim nächsten changed_cells gemeldet
+
+WANDER, CHOP_TREE, EAT_BUSH, CRAFT_PICKAXE, MINE_STONE = (ACTION_INDEX[a] for a in ACTIONS)
+
+
+def _column(name):
+    """Erzeugt eine Property, die eine Population-Spalte liest/schreibt."""
+    def get(self):
+        return getattr(self._pop, name).item(self._idx)
+
+    def set(self, value):
+        getattr(self._pop, name)[self._idx] = value
+
+    return property(get, set)
+
+
+def _row(name):
+    """Erzeugt eine Property, die die Zeile einer Population-Matrix als View liefert."""
+    def get(self):
+        return getattr(self._pop, name)[self._idx]
+
+    def set(self, values):
+        getattr(self._pop, name)[self._idx] = values
+
+    return property(get, set)
+
+
+class AgentView(Agent):
+    """
+    Agent, dessen Zustand in den Arrays einer `Population` liegt.
+
+    Verhält sich nach außen wie ein normaler Agent (Rendering, Tribes,
+    Häuser), Bewegungen werden aber nur vorgemerkt und anschließend von
+    `Population.apply_movement` für alle Agenten gebündelt ausgeführt.
+
+    Hat keine eigenen Slots, damit ein Agent per `__class__` zwischen
+    Agent und AgentView wechseln kann; die Properties der Spalten
+    überdecken dabei die gleichnamigen Slots von Agent.
+    """
+    __slots__ = ()
+
+    @property
+    def current_house(self):
+        return self._pop.houses[self._idx]
+
+    @current_house.setter
+    def current_house(self, house):
+        pop, i = self._pop, self._idx
+        pop.houses[i] = house
+        pop.has_house[i] = house is not None
+        if house is not None:
+            pop.hx0[i], pop.hx1[i] = house.x, house.x + house.width - 6
+            pop.hy0[i], pop.hy1[i] = house.y, house.y + house.height - 6
+
+    @property
+    def last_action(self):
+        action = self._pop.action[self._idx]
+        return ACTIONS[action] if action >= 0 else None
+
+    @last_action.setter
+    def last_action(self, action):
+        self._pop.action[self._idx] = -1 if action is None else ACTION_INDEX[action]
+
+    def move_random(self):
+        """Merkt eine Zufallsbewegung für `Population.apply_movement` vor."""
+        self._pop.wander[self._idx] = True
+
+    def move_towards(self, target):
+        """Merkt eine Bewegung auf das Ziel für `Population.apply_movement` vor."""
+        pop, i = self._pop, self._idx
+        pop.seek[i] = True
+        pop.tx[i] = target.x
+        pop.ty[i] = target.y
+
+    def learn(self, action, reward):
+        """Merkt Aktion und Reward für `Population.apply_learning` vor."""
+        pop, i = self._pop, self._idx
+        pop.learning[i] = True
+        pop.learn_action[i] = ACTION_INDEX[action]
+        pop.learn_reward[i] = reward
+
+
+for _name in COLUMNS:
+    setattr(AgentView, _name, _column(_name))
+for _name in MATRICES:
+    setattr(AgentView, _name, _row(_name))
+del _name
+
+
+class Population:
+    """
+    Vektorisierte Agenten-Population (Structure of Arrays).
+
+    Position, Hunger, Alter, Inventar und Hausstatus aller Agenten liegen
+    in NumPy-Arrays, die Lernwerte als Matrix Agenten x Aktionen und die
+    Reward-Glättung als Matrix Agenten x REWARD_WINDOW (Ringpuffer).
+    Altern, Verhungern, Clamping im Haus, Aktionswahl, Lernen und Bewegung
+    laufen pro Tick als Array-Operationen über die ganze Population;
+    die einzelnen Agent-Objekte sind nur noch Views auf ihre Zeile.
+
+    Attributes:
+        count (int): Anzahl belegter Zeilen.
+        views (list): Zeile -> AgentView.
+        houses (list): Zeile -> aktuelles Haus oder None.
+        rng (numpy.random.Generator): Zufallsquelle für Aktionswahl und Bewegungen.
+        bounds (tuple): (Breite, Höhe) des Bewegungsbereichs.
+    """
+
+    def __init__(self, capacity=64, rng=None, seed=None, bounds=MOVE_BOUNDS):
+        """
+        Args:
+            capacity (int, optional): Anfangsgröße der Arrays, wächst bei Bedarf.
+            rng (numpy.random.Generator, optional): Zufallsquelle.
+            seed (int, optional): Startwert, falls kein rng übergeben wird.
+            bounds (tuple, optional): (Breite, Höhe) des Bewegungsbereichs.
+
+        Raises:
+            ImportError: Wenn NumPy nicht installiert ist.
+        """
+        if np is None:
+            raise ImportError("Population benötigt NumPy (pip install numpy)")
+        self.count = 0
+        self.capacity = 0
+        self.views = []
+        self.houses = []
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.bounds = bounds
+        self._resize(capacity)
+
+    # ----------------------------
+
+    def _resize(self, capacity):
+        """Vergrößert alle Arrays auf die neue Kapazität."""
+        shapes = {name: (capacity,) for name in list(COLUMNS) + list(_INTERNAL_COLUMNS)}
+        shapes.update({name: (capacity, width) for name, width in MATRICES.items()})
+        shapes["_weights"] = (capacity, len(ACTIONS))
+        for name, shape in shapes.items():
+            dtype = COLUMNS.get(name) or _INTERNAL_COLUMNS.get(name, "float64")
+            new = np.zeros(shape, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add(self, agent):
+        """
+        Übernimmt einen Agenten in die Population.
+
+        Sein Zustand wird in eine neue Zeile kopiert und das Objekt wird
+        zum AgentView auf diese Zeile; alle Referenzen bleiben gültig.
+
+        Args:
+            agent (Agent): Agent, der übernommen wird.
+        """
+        if self.count == self.capacity:
+            self._resize(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        self.views.append(agent)
+        self.houses.append(None)
+
+        state = {name: getattr(agent, name) for name in list(COLUMNS) + list(MATRICES)}
+        house, action = agent.current_house, agent.last_action
+        agent.current_house = None  # Slot ist als View verdeckt, keine Referenz behalten
+        agent.__class__ = AgentView
+        agent._pop, agent._idx = self, i
+        for name, value in state.items():
+            getattr(self, name)[i] = value
+        agent.current_house = house
+        agent.last_action = action
+        self.wander[i] = self.seek[i] = self.learning[i] = False
+        self.cell_x[i] = self.cell_y[i] = _NO_CELL
+
+    def remove(self, agent):
+        """
+        Entfernt einen Agenten (Swap-Remove mit der letzten Zeile).
+
+        Das Objekt wird wieder zu einem normalen Agenten mit seinem
+        letzten Zustand, damit noch bestehende Referenzen (Tribe, Haus)
+        gültige Werte sehen.
+        """
+        i = agent._idx
+        state = {name: getattr(agent, name) for name in COLUMNS}
+        state.update({name: array("d", getattr(agent, name).tolist()) for name in MATRICES})
+        house, action = agent.current_house, agent.last_action
+
+        last = self.count - 1
+        if i != last:
+            for name in list(COLUMNS) + list(MATRICES) + list(_INTERNAL_COLUMNS):
+                column = getattr(self, name)
+                column[i] = column[last]
+            moved = self.views[last]
+            self.views[i] = moved
+            self.houses[i] = self.houses[last]
+            moved._idx = i
+        self.views.pop()
+        self.houses.pop()
+        self.count = last
+
+        agent.__class__ = Agent
+        del agent._pop, agent._idx
+        for name, value in state.items():
+            setattr(agent, name, value)
+        agent.current_house = house
+        agent.last_action = action
+
+    # ----------------------------
+
+    def age_step(self):
+        """
+        Altert alle Agenten um einen Tick und erhöht den Hunger.
+
+        Returns:
+            list: Agenten, die verhungert oder an Altersschwäche gestorben sind.
+        """
+        n = self.count
+        self.age[:n] += 0.01
+        self.hunger[:n] -= 0.01
+        dead = np.flatnonzero(~self.living())
+        return [self.views[i] for i in dead]
+
+    def living(self):
+        """Maske der Agenten, die weder verhungert noch zu alt sind."""
+        n = self.count
+        return (self.hunger[:n] > 0) & (self.age[:n] < 100)
+
+    def window(self, mask, start, count):
+        """
+        Schränkt eine Maske auf `count` ihrer Zeilen ab Position `start`
+        ein, zyklisch in Zeilenreihenfolge (Entscheidungsbudget).
+
+        Returns:
+            numpy.ndarray: Neue Maske.
+        """
+        rows = np.flatnonzero(mask)
+        chosen = np.zeros_like(mask)
+        chosen[rows.take(np.arange(start, start + count), mode="wrap")] = True
+        return chosen
+
+    def choose_actions(self):
+        """
+        Wählt für alle Agenten gleichzeitig eine Aktion, mit denselben
+        Gewichten wie `Agent.choose_action` (max(1, int(Wert + 1))).
+
+        Die Gewichte werden zeilenweise kumuliert; pro Agent wird eine
+        gleichverteilte Position unter der Gewichtssumme gezogen und die
+        erste Aktion gewählt, deren kumuliertes Gewicht darüber liegt.
+        Gewichte und Zufallszahlen liegen in vorab angelegten Arrays.
+
+        Returns:
+            numpy.ndarray: Index in ACTIONS pro Zeile.
+        """
+        n = self.count
+        weights = self._weights[:n]
+        np.add(self.memory[:n], 1, out=weights)
+        np.trunc(weights, out=weights)
+        np.maximum(weights, 1, out=weights)
+        np.cumsum(weights, axis=1, out=weights)
+
+        draw = self._draw[:n]
+        self.rng.random(out=draw)
+        draw *= weights[:, -1]
+        np.floor(draw, out=draw)
+        chosen = (weights <= draw[:, None]).sum(axis=1)
+        return np.minimum(chosen, len(ACTIONS) - 1, out=chosen)
+
+    def act(self, active, chosen, is_day, resources, enemies, rewards, vision_radius):
+        """
+        Führt die gewählten Aktionen aller aktiven Agenten gebündelt aus,
+        mit denselben Regeln wie `Agent.act`.
+
+        Zufallsschritte, Spitzhacke bauen und Abbauen ohne Spitzhacke
+        laufen als Array-Operationen, ebenso die Suche nach der nächsten
+        Ressource (`grid_nearest`) und das Vormerken des Schritts darauf
+        zu. Einzeln über `Agent.act` müssen nur Agenten, die tagsüber ihr
+        Haus verlassen, einen Gegner in Reichweite haben, bauen können
+        oder ihre Ressource erreicht haben; Letztere verbrauchen sie dort
+        in Zeilenreihenfolge, sodass keine Ressource doppelt vergeben wird.
+        Alle übrigen sehen die Ressourcen wie zu Beginn des Ticks.
+
+        Args:
+            active (numpy.ndarray): Maske der Agenten, die entscheiden.
+            chosen (numpy.ndarray): Index in ACTIONS pro Zeile.
+            is_day (bool): Tag/Nacht-Status.
+            resources (dict): Aktionsindex -> ResourcePool (Holz, Büsche, Steine).
+            enemies (SpatialGrid): Gegner.
+            rewards (dict): Rewards pro Aktion.
+            vision_radius (float): Sichtweite der Agenten.
+
+        Returns:
+            numpy.ndarray: Zeilen, die `Agent.act` einzeln ausführen muss, aufsteigend.
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        wood, stone, pickaxe = self.wood[:n], self.stone[:n], self.has_pickaxe[:n]
+        self.action[:n][active] = -1
+
+        single = active & ((wood >= 10) | ((wood >= 5) & (stone >= 5)))  # kann bauen
+        if is_day:
+            single |= active & self.in_house[:n]  # verlässt sein Haus
+        if len(enemies):
+            rows = np.flatnonzero(active & ~single)
+            objects, point, index = grid_pairs(enemies, x[rows], y[rows], THREAT_RADIUS)
+            if objects:
+                ex = np.fromiter((e.x for e in objects), float, len(objects))
+                ey = np.fromiter((e.y for e in objects), float, len(objects))
+                near = np.hypot(x[rows][point] - ex[index], y[rows][point] - ey[index]) < THREAT_RADIUS
+                single[rows[point[near]]] = True
+
+        rows = np.flatnonzero(active & ~single)
+        action = chosen[rows]
+        self.action[rows] = action
+
+        wander = rows[action == WANDER]
+        self.wander[wander] = True
+        self._learn(wander, WANDER, rewards["wander"])
+
+        craft = rows[action == CRAFT_PICKAXE]
+        ok = (wood[craft] >= 5) & ~pickaxe[craft]
+        wood[craft[ok]] -= 5
+        pickaxe[craft[ok]] = True
+        self._learn(craft[ok], CRAFT_PICKAXE, rewards["craft_pickaxe"])
+        self._learn(craft[~ok], CRAFT_PICKAXE, rewards["craft_pickaxe_fail"])
+
+        mining = action == MINE_STONE
+        self._learn(rows[mining & ~pickaxe[rows]], MINE_STONE, rewards["mine_stone_fail"])
+
+        reached = []
+        for kind, pool in resources.items():
+            seekers = rows[(action == kind) & pickaxe[rows]] if kind == MINE_STONE else rows[action == kind]
+            _, best, dist, ox, oy = grid_nearest(pool.grid, x[seekers], y[seekers], vision_radius)
+            found = best >= 0
+            arrived = found & (dist < REACH)
+            reached.append(seekers[arrived])
+            walk, target = seekers[found & ~arrived], best[found & ~arrived]
+            self.seek[walk] = True
+            self.tx[walk] = ox[target]
+            self.ty[walk] = oy[target]
+        for arrived in reached:
+            single[arrived] = True
+            self.action[arrived] = -1
+        return np.flatnonzero(single)
+
+    def _learn(self, rows, action, reward):
+        """Merkt für mehrere Zeilen Aktion und Reward vor (wie AgentView.learn)."""
+        self.learning[rows] = True
+        self.learn_action[rows] = action
+        self.learn_reward[rows] = reward
+
+    def apply_learning(self, tick):
+        """
+        Übernimmt alle in diesem Tick vorgemerkten Rewards: Lernwerte
+        werden in der Matrix erhöht und auf [-5, 10] begrenzt, fällige
+        Rewards (siehe `Agent.learn`) kommen in den Ringpuffer und
+        `total_reward` wird neu gemittelt.
+
+        Args:
+            tick (int): Aktueller Tick der Simulation.
+        """
+        n = self.count
+        learning = self.learning[:n]
+        rows = np.flatnonzero(learning)
+        if not rows.size:
+            return
+        learning[:] = False
+        actions = self.learn_action[rows]
+        rewards = self.learn_reward[rows]
+        self.memory[rows, actions] = np.clip(self.memory[rows, actions] + rewards, -5, 10)
+
+        due = tick - self.reward_tick[rows] >= self.reward_interval[rows]
+        rows, rewards = rows[due], rewards[due]
+        if rows.size:
+            pos = self.reward_pos[rows]
+            self.reward_tick[rows] = tick
+            self.reward_buffer[rows, pos] = rewards
+            self.reward_pos[rows] = (pos + 1) % REWARD_WINDOW
+            count = np.minimum(self.reward_count[rows] + 1, REWARD_WINDOW)
+            self.reward_count[rows] = count
+            self.total_reward[rows] = self.reward_buffer[rows].sum(axis=1) / count
+
+    def sheltered(self):
+        """Maske der Agenten, die in einem Haus sind."""
+        n = self.count
+        return self.in_house[:n] & self.has_house[:n]
+
+    def clamp_sheltered(self):
+        """
+        Hält alle Agenten in Häusern innerhalb der Hauswände (Nacht).
+
+        Returns:
+            numpy.ndarray: Maske der geclampten Agenten.
+        """
+        mask = self.sheltered()
+        n = self.count
+        self.x[:n][mask] = np.clip(self.x[:n][mask], self.hx0[:n][mask], self.hx1[:n][mask])
+        self.y[:n][mask] = np.clip(self.y[:n][mask], self.hy0[:n][mask], self.hy1[:n][mask])
+        return mask
+
+    def apply_movement(self):
+        """
+        Führt alle in diesem Tick vorgemerkten Bewegungen gebündelt aus:
+        Zufallsschritte (-2..2, auf `bounds` begrenzt) und Schritte
+        der Länge 2 auf das gemerkte Ziel zu.
+        """
+        n = self.count
+        wander = self.wander[:n]
+        k = int(wander.sum())
+        if k:
+            steps = self.rng.integers(-2, 3, size=(2, k))
+            self.x[:n][wander] = np.clip(self.x[:n][wander] + steps[0], 0, self.bounds[0])
+            self.y[:n][wander] = np.clip(self.y[:n][wander] + steps[1], 0, self.bounds[1])
+
+        seek = self.seek[:n]
+        if seek.any():
+            x, y = self.x[:n][seek], self.y[:n][seek]
+            dx, dy = self.tx[:n][seek] - x, self.ty[:n][seek] - y
+            dist = np.maximum(1, np.hypot(dx, dy))
+            self.x[:n][seek] = x + np.trunc(2 * dx / dist)
+            self.y[:n][seek] = y + np.trunc(2 * dy / dist)
+
+        wander[:] = False
+        seek[:] = False
+
+    def changed_cells(self, cell_size):
+        """
+        Zeilen, deren Rasterzelle sich seit dem letzten Aufruf geändert hat.
+
+        Damit muss ein SpatialGrid nach den gebündelten Bewegungen nur
+        die Agenten umsortieren, die tatsächlich eine Zelle gewechselt
+        haben, statt für jeden Agenten `move` aufzurufen.
+
+        Args:
+            cell_size (float): Zellgröße des Rasters.
+
+        Returns:
+            numpy.ndarray: Zeilen, aufsteigend.
+        """
+        n = self.count
+        cx = np.floor(self.x[:n] / cell_size).astype(np.int64)
+        cy = np.floor(self.y[:n] / cell_size).astype(np.int64)
+        rows = np.flatnonzero((cx != self.cell_x[:n]) | (cy != self.cell_y[:n]))
+        self.cell_x[:n] = cx
+        self.cell_y[:n] = cy
+        return rows
@@ -0,0 +1,192 @@
+import csv
+import time
+from collections import deque
+
+# Phasen in Reihenfolge eines Frames; die Simulation meldet ihre Phasen pro Tick,
+# bei mehreren Ticks pro Frame werden sie aufsummiert.
+PHASES = (
+    "events",
+    "update_day_night",
+    "regrow",
+    "reproduce",
+    "agents",
+    "build_house",
+    "enemies",
+    "remove_dead",
+    "render",
+    "draw_ui",
+    "flip",
+)
+WINDOW = 600  # Frames für die gleitenden Perzentile (10 s bei 60 FPS)
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseProfiler:
+    """
+    Leichtgewichtige Zeitmessung der Phasen eines Frames.
+
+    Der Aufrufer setzt nach jeder Phase eine Marke (`mark`); die Zeit seit
+    der vorherigen Marke wird der Phase zugeschrieben. `end_frame` legt die
+    Summen des Frames in einem gleitenden Fenster ab, aus dem Perzentile
+    für das Overlay und der CSV-Export entstehen. Ist der Profiler
+    deaktiviert, kehren alle Methoden sofort zurück.
+
+    Attributes:
+        enabled (bool): Ob gemessen wird.
+        window (int): Anzahl Frames im gleitenden Fenster.
+        samples (dict): Phase -> deque der Frame-Zeiten in Sekunden.
+        frames (deque): Frame-Nummern passend zu `samples`.
+        frame (int): Anzahl abgeschlossener Frames.
+    """
+
+    def __init__(self, enabled=True, window=WINDOW):
+        """
+        Args:
+            enabled (bool, optional): Messung aktiv.
+            window (int, optional): Größe des gleitenden Fensters in Frames.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES + ("frame",)}
+        self.frames = deque(maxlen=window)
+        self.frame = 0
+        self._current = {}
+        self._start = self._last = time.perf_counter()
+
+    def start(self):
+        """Beginnt einen Frame, vorher vergangene Zeit zählt nicht mit."""
+        if self.enabled:
+            self._start = self._last = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Schreibt die Zeit seit der letzten Marke der Phase `phase` zu.
+
+        Args:
+            phase (str): Name der gerade beendeten Phase.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        current = self._current
+        current[phase] = current.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Schließt den Frame ab und übernimmt seine Zeiten ins Fenster."""
+        if not self.enabled:
+            return
+        current = self._current
+        for phase, values in self.samples.items():
+            if phase not in current and phase != "frame":
+                values.append(0.0)
+        for phase, seconds in current.items():
+            values = self.samples.get(phase)
+            if values is None:
+                values = self.samples[phase] = deque([0.0] * len(self.frames), maxlen=self.window)
+            values.append(seconds)
+        self.samples["frame"].append(time.perf_counter() - self._start)
+        self.frames.append(self.frame)
+        self.frame += 1
+        self._current = {}
+
+    # ----------------------------
+
+    def percentiles(self, phase, percentiles=PERCENTILES):
+        """
+        Perzentile einer Phase über das gleitende Fenster.
+
+        Args:
+            phase (str): Name der Phase.
+            percentiles (tuple, optional): Gewünschte Perzentile (0-100).
+
+        Returns:
+            list: Werte in Millisekunden, leer ohne Messwerte.
+        """
+        values = sorted(self.samples.get(phase, ()))
+        if not values:
+            return []
+        last = len(values) - 1
+        return [1000 * values[min(last, int(round(p / 100 * last)))] for p in percentiles]
+
+    def report_lines(self):
+        """
+        Textzeilen mit p50/p95/p99 und Maximum pro Phase in ms.
+
+        Returns:
+            list: Überschrift und eine Zeile pro Phase mit Messwerten.
+        """
+        lines = ["Phase              p50    p95    p99    max"]
+        for phase, values in self.samples.items():
+            if not values or not any(values):
+                continue
+            p50, p95, p99 = self.percentiles(phase)
+            lines.append(f"{phase:<16} {p50:6.2f} {p95:6.2f} {p99:6.2f} {1000 * max(values):6.2f}")
+        return lines
+
+    def export_csv(self, path):
+        """
+        Schreibt das gleitende Fenster als CSV: eine Zeile pro Frame,
+        eine Spalte pro Phase in Millisekunden.
+
+        Args:
+            path (str): Zieldatei.
+        """
+        phases = [p for p, values in self.samples.items() if any(values)]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{p}_ms" for p in phases])
+            columns = [self.samples[p] for p in phases]
+            for i, frame in enumerate(self.frames):
+                writer.writerow([frame] + [round(1000 * c[i], 4) for c in columns])
+
+
+class CProfileWindow:
+    """
+    Führt cProfile für eine feste Anzahl simulierter Ticks aus und gibt
+    danach die teuersten Funktionen aus bzw. speichert die Rohdaten.
+
+    Attributes:
+        ticks (int): Anzahl Ticks, die profiliert werden.
+        path (str): Datei für pstats-Rohdaten, None = nicht speichern.
+        done (bool): Ob die Messung abgeschlossen ist.
+    """
+
+    def __init__(self, ticks, path=None):
+        """
+        Args:
+            ticks (int): Anzahl zu profilierender Ticks.
+            path (str, optional): Zieldatei für die Rohdaten (z.B. für snakeviz).
+        """
+        import cProfile
+        self.ticks = ticks
+        self.path = path
+        self.done = False
+        self._profile = cProfile.Profile()
+        self._first_tick = None
+
+    def update(self, tick):
+        """
+        Startet die Messung beim ersten Aufruf und beendet sie, sobald
+        `ticks` Ticks vergangen sind. Einmal pro Frame aufrufen.
+
+        Args:
+            tick (int): Aktueller Tick der Simulation.
+        """
+        if self.done:
+            return
+        if self._first_tick is None:
+            self._first_tick = tick
+            self._profile.enable()
+        elif tick - self._first_tick >= self.ticks:
+            self._profile.disable()
+            self.done = True
+            self.report()
+
+    def report(self, limit=25):
+        """Gibt die Funktionen mit der höchsten kumulierten Zeit aus."""
+        import pstats
+        if self.path:
+            self._profile.dump_stats(self.path)
+        print(f"cProfile über {self.ticks} Ticks:")
+        pstats.Stats(self._profile).sort_stats("cumulative").print_stats(limit)
@@ -0,0 +1,62 @@
+class AgentRegistry:
+    """
+    Verzeichnis der lebenden Agenten, nach ihrer stabilen id.
+
+    Mitgliedschaft, Entfernen und Nachschlagen per id kosten O(1) statt
+    eines Durchlaufs über eine Liste. Nach außen verhält sich das
+    Verzeichnis wie die bisherige Agentenliste: len(), `in`, append,
+    remove und Iteration in Einfügereihenfolge (= Update-Reihenfolge).
+
+    Attributes:
+        by_id (dict): id -> Agent, Reihenfolge = Einfügereihenfolge.
+    """
+
+    def __init__(self, agents=()):
+        """
+        Args:
+            agents (iterable, optional): Initiale Agenten.
+        """
+        self.by_id = {}
+        for agent in agents:
+            self.append(agent)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(list(self.by_id.values()))
+
+    def __contains__(self, agent):
+        return self.by_id.get(agent.id) is agent
+
+    def get(self, agent_id):
+        """Agent mit dieser id oder None, wenn er nicht (mehr) lebt."""
+        return self.by_id.get(agent_id)
+
+    def append(self, agent):
+        """
+        Registriert einen Agenten.
+
+        Raises:
+            ValueError: Wenn bereits ein anderer Agent diese id trägt.
+        """
+        other = self.by_id.get(agent.id)
+        if other is not None and other is not agent:
+            raise ValueError(f"AgentRegistry.append: id {agent.id} ist bereits vergeben")
+        self.by_id[agent.id] = agent
+
+    def remove(self, agent):
+        """
+        Entfernt einen Agenten.
+
+        Raises:
+            ValueError: Wenn der Agent nicht registriert ist (wie list.remove).
+        """
+        if agent not in self:
+            raise ValueError("AgentRegistry.remove(x): x not in registry")
+        del self.by_id[agent.id]
+
+    def discard(self, agent):
+        """Entfernt einen Agenten, falls er registriert ist."""
+        if agent in self:
+            del self.by_id[agent.id]
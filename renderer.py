@@ -0,0 +1,541 @@
+try:
+    import numpy as np
+except ImportError:  # nur für PixelRenderer nötig
+    np = None
+
+import pygame
+from Objects.house import HOUSE_SIZE
+
+DAY_COLOR = (0, 120, 0)
+NIGHT_COLOR = (10, 30, 60)
+NIGHT_OVERLAY = (0, 0, 50)
+NIGHT_ALPHA = 100
+OUTSIDE_COLOR = (15, 15, 15)  # Bereich außerhalb der Welt
+
+AGENT_SIZE = 6
+AGENT_COLOR = (255, 255, 255)
+ENEMY_COLOR = (200, 0, 0)
+
+RESOURCE_SATURATION = 6  # Ressourcen pro Kachel, ab denen die Kachel voll gefärbt ist
+AGENT_SATURATION = 8     # Agenten pro Kachel, ab denen der Punkt die ganze Kachel füllt
+
+PIXEL_TYPES = {2: "uint16", 4: "uint32"}  # Bytes pro Pixel -> NumPy-Typ für PixelRenderer
+
+
+def _blend(base, color, share):
+    """Farbe zwischen `base` (share 0) und `color` (share 1)."""
+    return tuple(int(b + (c - b) * share) for b, c in zip(base, color))
+
+
+def _overlaps(x, y, w, h, area):
+    """True, wenn sich das Rechteck (x, y, w, h) und `area` überschneiden."""
+    ax, ay, aw, ah = area
+    return x + w >= ax and x <= ax + aw and y + h >= ay and y <= ay + ah
+
+
+class CameraRenderer:
+    """
+    Zeichnet den Ausschnitt einer `Camera` mit Verschieben und Zoom.
+
+    Die Welt liegt in zwei Ebenen: die statische Ebene (Hintergrund,
+    Ressourcen, Häuser und bei Nacht das Overlay) ist für den Ausschnitt
+    auf einer eigenen Surface gecacht. Sie entsteht nur neu, wenn sich
+    Tag/Nacht, die Hausliste, die Verteilung der Ressourcen oder die
+    Kamera ändert; einzelne verbrauchte oder nachgewachsene Ressourcen
+    werden lokal ausgebessert. Pro Frame werden nur die alten und neuen
+    Rechtecke der Agenten und Gegner erneuert und als Dirty-Rects
+    zurückgegeben.
+
+    Gezeichnet wird nur, was die räumlichen Indizes für den sichtbaren
+    Bereich liefern; die Kosten hängen damit vom Ausschnitt ab und nicht
+    von der Größe der Welt.
+
+    Unterhalb von LOD_ZOOM werden Ressourcen und Agenten zu
+    Dichte-Kacheln zusammengefasst, eine pro Zelle ihres Rasters:
+    Ressourcen färben die Kachel in ihrer Mischfarbe, Agenten erscheinen
+    als Punkt, der mit ihrer Anzahl wächst. Häuser und Gegner bleiben
+    einzeln sichtbar.
+
+    Attributes:
+        sim (Simulation): Die dargestellte Simulation.
+        camera (Camera): Gezeigter Ausschnitt.
+        size (tuple): (Breite, Höhe) des Ausschnitts in Bildschirm-Pixeln.
+        static (pygame.Surface): Gecachte statische Ebene.
+        overlay (pygame.Surface): Nacht-Overlay, einmalig angelegt.
+    """
+
+    def __init__(self, sim, camera):
+        """
+        Args:
+            sim (Simulation): Die dargestellte Simulation.
+            camera (Camera): Gezeigter Ausschnitt, Größe der Ebenen = camera.view.
+        """
+        self.sim = sim
+        self.camera = camera
+        self.size = camera.view
+        self.static = pygame.Surface(self.size).convert()
+        self.overlay = pygame.Surface(self.size).convert()
+        self.overlay.set_alpha(NIGHT_ALPHA)
+        self.overlay.fill(NIGHT_OVERLAY)
+
+        self._static_key = None
+        self._sprite_rects = []
+        self._tints = {}
+        for pool in self.pools():
+            pool.track_changes()
+
+    def pools(self):
+        return (self.sim.trees, self.sim.stones, self.sim.bushes)
+
+    def tint(self, color):
+        """Farbe wie unter dem Nacht-Overlay, ohne das Overlay erneut zu blenden."""
+        tinted = self._tints.get(color)
+        if tinted is None:
+            a = NIGHT_ALPHA / 255
+            tinted = tuple(int(c * (1 - a) + o * a) for c, o in zip(color, NIGHT_OVERLAY))
+            self._tints[color] = tinted
+        return tinted
+
+    def invalidate(self, rect):
+        """
+        Merkt einen Bildschirmbereich vor, der im nächsten Frame aus der
+        statischen Ebene wiederhergestellt wird, z.B. unter einem Overlay.
+
+        Args:
+            rect (pygame.Rect): Betroffener Bereich.
+        """
+        self._sprite_rects.append(rect)
+
+    # ----------------------------
+
+    def static_key(self):
+        """Zustand, bei dessen Änderung die statische Ebene neu entsteht."""
+        sim = self.sim
+        return ((sim.is_day, len(sim.houses)) + tuple(pool.version for pool in self.pools())
+                + (self.camera.version,))
+
+    def rebuild_static(self):
+        """Zeichnet die statische Ebene des ganzen Ausschnitts neu."""
+        self._draw_static(self.camera.visible())
+        for pool in self.pools():
+            pool.take_changes()
+
+    def patch_static(self, area):
+        """
+        Bessert die statische Ebene in einem Bereich der Welt aus.
+
+        Args:
+            area (tuple): (x, y, Breite, Höhe) in Weltkoordinaten.
+
+        Returns:
+            pygame.Rect: Betroffener Bildschirmbereich.
+        """
+        rect = pygame.Rect(self.camera.rect(*area))
+        self.static.set_clip(rect)
+        self._draw_static(area)
+        self.static.set_clip(None)
+        return rect
+
+    def _draw_static(self, area):
+        """Hintergrund, Ressourcen, Häuser und Overlay für einen Weltbereich."""
+        sim, cam, surface = self.sim, self.camera, self.static
+        x, y, w, h = area
+        background = DAY_COLOR if sim.is_day else NIGHT_COLOR
+        surface.fill(OUTSIDE_COLOR)
+        surface.fill(background, cam.rect(0, 0, *sim.world_size))
+        fill, to_rect = surface.fill, cam.rect
+
+        if cam.lod:
+            self._draw_resource_tiles(area, background)
+        else:
+            self._draw_resources(area)
+        for house in sim.house_grid.query_rect(x - HOUSE_SIZE, y - HOUSE_SIZE, w + 2 * HOUSE_SIZE, h + 2 * HOUSE_SIZE):
+            color = house.tribe.color if house.tribe is not None else house.color
+            fill(color, to_rect(house.x, house.y, house.width, house.height))
+        if not sim.is_day:
+            surface.blit(self.overlay, (0, 0))
+
+    def _draw_resources(self, area):
+        """Ressourcen einzeln, je ein Rechteck."""
+        x, y, w, h = area
+        fill, to_rect = self.static.fill, self.camera.rect
+        for pool in self.pools():
+            size = pool.factory.size
+            for obj in pool.query_rect(x - size, y - size, w + size, h + size):
+                fill(obj.color, to_rect(obj.x, obj.y, size, size))
+
+    def _draw_resource_tiles(self, area, background):
+        """Ressourcen als Dichte-Kacheln; alle Pools haben dieselbe Zellgröße."""
+        tiles = {}
+        for pool in self.pools():
+            r, g, b = pool.factory.color
+            for key, cell in pool.grid.cells_in_rect(*area):
+                n = len(cell)
+                tile = tiles.get(key)
+                if tile is None:
+                    tile = tiles[key] = [0, 0, 0, 0]
+                tile[0] += n
+                tile[1] += r * n
+                tile[2] += g * n
+                tile[3] += b * n
+        cs = self.sim.trees.grid.cell_size
+        fill, to_rect = self.static.fill, self.camera.rect
+        for (cx, cy), (n, r, g, b) in tiles.items():
+            color = _blend(background, (r / n, g / n, b / n), min(1, n / RESOURCE_SATURATION))
+            fill(color, to_rect(cx * cs, cy * cs, cs, cs))
+
+    # ----------------------------
+
+    def draw(self, screen):
+        """
+        Aktualisiert den Ausschnitt auf dem Screen.
+
+        Args:
+            screen (pygame.Surface): Ziel-Surface.
+
+        Returns:
+            list or None: Geänderte Rechtecke, None wenn der ganze Screen
+            neu gezeichnet wurde.
+        """
+        sim, cam = self.sim, self.camera
+        key = self.static_key()
+        full = key != self._static_key
+        dirty = []
+
+        if full:
+            self._static_key = key
+            self.rebuild_static()
+            screen.blit(self.static, (0, 0))
+        else:
+            visible = cam.visible()
+            areas = {}
+            for pool in self.pools():
+                cs = pool.grid.cell_size
+                for x, y, size in pool.take_changes():
+                    if cam.lod:
+                        x, y, size = x // cs * cs, y // cs * cs, cs  # ganze Kachel, nur einmal
+                    if _overlaps(x, y, size, size, visible):
+                        areas[(x, y, size, size)] = None
+            dirty.extend(self.patch_static(area) for area in areas)
+            dirty.extend(self._sprite_rects)
+            for rect in dirty:
+                screen.blit(self.static, rect, rect)
+
+        night = not sim.is_day
+        vx, vy, vw, vh = cam.visible()
+        z = cam.zoom
+        fill = screen.fill
+        rects = []
+        if cam.lod:
+            cs = sim.agent_grid.cell_size
+            color = self.tint(AGENT_COLOR) if night else AGENT_COLOR
+            for (cx, cy), cell in sim.agent_grid.cells_in_rect(vx, vy, vw, vh):
+                side = cs * min(1, (len(cell) / AGENT_SATURATION) ** 0.5)
+                offset = (cs - side) / 2
+                rects.append(fill(color, cam.rect(cx * cs + offset, cy * cs + offset, side, side)))
+        else:
+            size = max(1, int(AGENT_SIZE * z))
+            for agent in sim.agent_grid.query_rect(vx - AGENT_SIZE, vy - AGENT_SIZE, vw + AGENT_SIZE, vh + AGENT_SIZE):
+                color = agent.tribe.color if agent.tribe else AGENT_COLOR
+                rects.append(fill(self.tint(color) if night else color,
+                                  (int((agent.x - vx) * z), int((agent.y - vy) * z), size, size)))
+        enemy_color = self.tint(ENEMY_COLOR) if night else ENEMY_COLOR
+        size = max(1, int(AGENT_SIZE * z))
+        for enemy in sim.enemies.query_rect(vx - AGENT_SIZE, vy - AGENT_SIZE, vw + AGENT_SIZE, vh + AGENT_SIZE):
+            rects.append(fill(enemy_color, (int((enemy.x - vx) * z), int((enemy.y - vy) * z), size, size)))
+
+        self._sprite_rects = rects
+        if full:
+            return None
+        return dirty + rects
+
+
+class PixelRenderer(CameraRenderer):
+    """
+    CameraRenderer, der Ressourcen, Agenten und Gegner gebündelt direkt in
+    den Pixelpuffer schreibt statt mit einem fill-Aufruf pro Objekt.
+
+    Positionen und Farben aller sichtbaren Objekte eines Typs werden zu
+    NumPy-Arrays; daraus entstehen in einem Schritt die Indizes aller
+    Pixel ihrer Quadrate, die dann mit einer einzigen Zuweisung gesetzt
+    werden. Mit NumPy-Backend kommen die Agenten-Positionen direkt aus den
+    Spalten der `Population`. Statt alte Rechtecke einzeln auszubessern,
+    wird pro Frame die ganze statische Ebene kopiert; `draw` liefert
+    deshalb keine Dirty-Rects. Dichte-Kacheln (LOD) zeichnet weiterhin
+    CameraRenderer.
+
+    Ausgewählt wird dieser Weg im Fenster mit `--render pixels`.
+    """
+
+    def __init__(self, sim, camera):
+        """
+        Args:
+            sim (Simulation): Die dargestellte Simulation.
+            camera (Camera): Gezeigter Ausschnitt.
+
+        Raises:
+            ImportError: Ohne NumPy.
+            ValueError: Wenn das Pixelformat nicht 16 oder 32 Bit hat.
+        """
+        if np is None:
+            raise ImportError("PixelRenderer benötigt NumPy (pip install numpy)")
+        super().__init__(sim, camera)
+        if self.static.get_bytesize() not in PIXEL_TYPES:
+            raise ValueError(f"PixelRenderer unterstützt nur 16 und 32 Bit, nicht {self.static.get_bitsize()}")
+        self._mapped = {}
+
+    def map(self, surface, color):
+        """Farbe als Pixelwert des Surface-Formats (gecacht)."""
+        value = self._mapped.get(color)
+        if value is None:
+            value = self._mapped[color] = surface.map_rgb(color)
+        return value
+
+    @staticmethod
+    def stamp(surface, batches, clip):
+        """
+        Schreibt Quadrate gebündelt in den Pixelpuffer eines Surface.
+
+        Pixelgleich mit `Surface.fill`: Ecken links oder oberhalb des
+        Surface rücken dort auf 0, die Kantenlänge bleibt erhalten; erst
+        danach wird auf `clip` beschnitten.
+
+        Args:
+            surface (pygame.Surface): Ziel, 16 oder 32 Bit pro Pixel.
+            batches (list): (xs, ys, Pixelwerte, Kantenlänge) je Objekttyp,
+                xs/ys als Arrays der linken oberen Ecken in Bildschirm-Pixeln.
+            clip (pygame.Rect): Nur innerhalb dieses Bereichs zeichnen.
+        """
+        pitch = surface.get_pitch() // surface.get_bytesize()
+        pixels = np.frombuffer(surface.get_buffer(), PIXEL_TYPES[surface.get_bytesize()])
+        left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+        for xs, ys, values, size in batches:
+            ox, oy = np.meshgrid(np.arange(size), np.arange(size))
+            ox, oy = ox.ravel(), oy.ravel()
+            values = np.broadcast_to(values, xs.shape)
+            xs = np.where((xs < 0) & (xs + size > 0), 0, xs)
+            ys = np.where((ys < 0) & (ys + size > 0), 0, ys)
+
+            # ganz im Clip: ein Index pro Pixel, ohne Prüfung
+            inside = (xs >= left) & (ys >= top) & (xs + size <= right) & (ys + size <= bottom)
+            base = ys[inside] * pitch + xs[inside]
+            pixels[base[:, None] + (oy * pitch + ox)] = values[inside][:, None]
+
+            # am Rand: Pixel einzeln auf den Clip prüfen
+            edge = ~inside & (xs + size > left) & (ys + size > top) & (xs < right) & (ys < bottom)
+            if edge.any():
+                px = xs[edge][:, None] + ox
+                py = ys[edge][:, None] + oy
+                keep = (px >= left) & (px < right) & (py >= top) & (py < bottom)
+                pixels[(py * pitch + px)[keep]] = np.broadcast_to(values[edge][:, None], keep.shape)[keep]
+        del pixels  # gibt das Surface wieder frei
+
+    # ----------------------------
+
+    def _draw_resources(self, area):
+        """Ressourcen gebündelt je Pool, innerhalb des aktuellen Clips."""
+        x, y, w, h = area
+        cam = self.camera
+        z = cam.zoom
+        batches = []
+        for pool in self.pools():
+            size = pool.factory.size
+            found = pool.query_rect(x - size, y - size, w + size, h + size)
+            if found:
+                xs = np.fromiter((o.x for o in found), float, len(found))
+                ys = np.fromiter((o.y for o in found), float, len(found))
+                batches.append((((xs - cam.x) * z).astype(np.int64), ((ys - cam.y) * z).astype(np.int64),
+                                self.map(self.static, pool.factory.color), max(1, int(size * z))))
+        if batches:
+            self.stamp(self.static, batches, self.static.get_clip())
+
+    def _sprites(self, screen):
+        """Agenten und Gegner im Ausschnitt als Batches für `stamp`."""
+        sim, cam = self.sim, self.camera
+        vx, vy, vw, vh = cam.visible()
+        z = cam.zoom
+        night = not sim.is_day
+        size = max(1, int(AGENT_SIZE * z))
+
+        pop = sim.population
+        if pop is not None and pop.count:
+            n = pop.count
+            xs, ys = pop.x[:n], pop.y[:n]
+            rows = ((xs >= vx - AGENT_SIZE) & (xs <= vx + vw) & (ys >= vy - AGENT_SIZE) & (ys <= vy + vh)).nonzero()[0]
+            views = pop.views
+            agents = [views[i] for i in rows.tolist()]
+            xs, ys = xs[rows], ys[rows]
+        else:
+            agents = sim.agent_grid.query_rect(vx - AGENT_SIZE, vy - AGENT_SIZE, vw + AGENT_SIZE, vh + AGENT_SIZE)
+            xs = np.fromiter((a.x for a in agents), float, len(agents))
+            ys = np.fromiter((a.y for a in agents), float, len(agents))
+
+        colors = {}
+        for tribe in {a.tribe for a in agents}:
+            color = tribe.color if tribe else AGENT_COLOR
+            colors[tribe] = self.map(screen, self.tint(color) if night else color)
+        values = np.fromiter((colors[a.tribe] for a in agents), np.int64, len(agents))
+
+        enemies = sim.enemies.query_rect(vx - AGENT_SIZE, vy - AGENT_SIZE, vw + AGENT_SIZE, vh + AGENT_SIZE)
+        ex = np.fromiter((e.x for e in enemies), float, len(enemies))
+        ey = np.fromiter((e.y for e in enemies), float, len(enemies))
+        enemy_value = self.map(screen, self.tint(ENEMY_COLOR) if night else ENEMY_COLOR)
+        return [
+            (((xs - vx) * z).astype(np.int64), ((ys - vy) * z).astype(np.int64), values, size),
+            (((ex - vx) * z).astype(np.int64), ((ey - vy) * z).astype(np.int64), enemy_value, size),
+        ]
+
+    def draw(self, screen):
+        """
+        Aktualisiert den Ausschnitt auf dem Screen.
+
+        Args:
+            screen (pygame.Surface): Ziel-Surface.
+
+        Returns:
+            None: Der ganze Screen wurde neu gezeichnet (bei Dichte-Kacheln
+            die Rückgabe von CameraRenderer).
+        """
+        if self.camera.lod:
+            return super().draw(screen)
+
+        key = self.static_key()
+        if key != self._static_key:
+            self._static_key = key
+            self.rebuild_static()
+        else:
+            visible = self.camera.visible()
+            for pool in self.pools():
+                for x, y, size in pool.take_changes():
+                    if _overlaps(x, y, size, size, visible):
+                        self.patch_static((x, y, size, size))
+        screen.blit(self.static, (0, 0))
+        self.stamp(screen, self._sprites(screen), screen.get_rect())
+        self._sprite_rects = []
+        return None
+
+
+class SnapshotRenderer:
+    """
+    Zeichnet die Welt aus einem `Snapshot` statt direkt aus der Simulation,
+    für den Betrieb mit eigenem Simulations-Thread.
+
+    Wie beim CameraRenderer liegt die statische Ebene gecacht vor; sie wird
+    neu gezeichnet, sobald sich `static_version` des Snapshots oder die
+    Kamera ändert. Sonst werden pro Frame nur die neuen Ausbesserungen
+    (`patches`) des Snapshots und die Rechtecke von Agenten und Gegnern
+    erneuert. Der Snapshot enthält keine räumlichen Indizes,
+    Objekte außerhalb des Ausschnitts werden einzeln verworfen; Dichte-
+    Kacheln gibt es nur im CameraRenderer.
+
+    Attributes:
+        camera (Camera): Gezeigter Ausschnitt.
+        size (tuple): (Breite, Höhe) des Ausschnitts in Bildschirm-Pixeln.
+        static (pygame.Surface): Gecachte statische Ebene.
+        overlay (pygame.Surface): Nacht-Overlay, einmalig angelegt.
+    """
+
+    def __init__(self, camera):
+        """
+        Args:
+            camera (Camera): Gezeigter Ausschnitt.
+        """
+        self.camera = camera
+        self.size = camera.view
+        self.static = pygame.Surface(self.size).convert()
+        self.overlay = pygame.Surface(self.size).convert()
+        self.overlay.set_alpha(NIGHT_ALPHA)
+        self.overlay.fill(NIGHT_OVERLAY)
+
+        self._static_key = None
+        self._patched = 0  # bereits gezeichnete Einträge von snapshot.patches
+        self._sprite_rects = []
+        self._tints = {}
+
+    tint = CameraRenderer.tint
+    invalidate = CameraRenderer.invalidate
+
+    def rebuild_static(self, snapshot):
+        """Zeichnet die statische Ebene aus dem Snapshot und seinen Ausbesserungen neu."""
+        self._draw_static(snapshot.is_day, snapshot.static, self.camera.visible())
+        self._patched = 0
+        self.patch_static(snapshot)
+
+    def patch_static(self, snapshot):
+        """
+        Zeichnet die noch nicht übernommenen Ausbesserungen des Snapshots.
+
+        Args:
+            snapshot (Snapshot): Snapshot derselben `static_version`.
+
+        Returns:
+            list: Betroffene Bildschirmbereiche im Ausschnitt.
+        """
+        cam = self.camera
+        visible = cam.visible()
+        rects = []
+        for area, items in snapshot.patches[self._patched:snapshot.patch_count]:
+            if not _overlaps(*area, visible):
+                continue
+            rect = pygame.Rect(cam.rect(*area))
+            self.static.set_clip(rect)
+            self._draw_static(snapshot.is_day, items, area)
+            self.static.set_clip(None)
+            rects.append(rect)
+        self._patched = snapshot.patch_count
+        return rects
+
+    def _draw_static(self, is_day, items, area):
+        """Hintergrund, die (Farbe, Rechteck)-Tupel in `area` und Overlay."""
+        cam = self.camera
+        self.static.fill(OUTSIDE_COLOR)
+        self.static.fill(DAY_COLOR if is_day else NIGHT_COLOR, cam.rect(0, 0, *cam.world))
+        fill, to_rect = self.static.fill, cam.rect
+        for color, rect in items:
+            if _overlaps(*rect, area):
+                fill(color, to_rect(*rect))
+        if not is_day:
+            self.static.blit(self.overlay, (0, 0))
+
+    def draw(self, screen, snapshot):
+        """
+        Zeichnet einen Snapshot auf den Screen.
+
+        Args:
+            screen (pygame.Surface): Ziel-Surface.
+            snapshot (Snapshot): Darzustellender Zustand.
+
+        Returns:
+            list or None: Geänderte Rechtecke, None wenn der ganze Screen
+            neu gezeichnet wurde.
+        """
+        cam = self.camera
+        key = (snapshot.static_version, snapshot.is_day, cam.version)
+        full = key != self._static_key
+        if full:
+            self._static_key = key
+            self.rebuild_static(snapshot)
+            screen.blit(self.static, (0, 0))
+            dirty = None
+        else:
+            dirty = self.patch_static(snapshot) + self._sprite_rects
+            for rect in dirty:
+                screen.blit(self.static, rect, rect)
+
+        night = not snapshot.is_day
+        fill = screen.fill
+        vx, vy, vw, vh = cam.visible()
+        x0, y0, x1, y1 = vx - AGENT_SIZE, vy - AGENT_SIZE, vx + vw, vy + vh
+        z = cam.zoom
+        size = max(1, int(AGENT_SIZE * z))
+        rects = [
+            fill(self.tint(color) if night else color, (int((x - vx) * z), int((y - vy) * z), size, size))
+            for x, y, color in snapshot.agents
+            if x0 <= x <= x1 and y0 <= y <= y1
+        ]
+        enemy_color = self.tint(ENEMY_COLOR) if night else ENEMY_COLOR
+        rects.extend(fill(enemy_color, (int((x - vx) * z), int((y - vy) * z), size, size))
+                     for x, y in snapshot.enemies if x0 <= x <= x1 and y0 <= y <= y1)
+
+        self._sprite_rects = rects
+        return None if full else dirty + rects
@@ -0,0 +1,268 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+
+import checkpoint
+from simulation import Simulation
+
+FORMAT = "lifesim-replay"
+VERSION = 1
+
+HASH_INTERVAL = 600       # Ticks zwischen zwei Prüfsummen in der Aufzeichnung (10 s)
+KEYFRAME_INTERVAL = 3600  # Ticks zwischen zwei Keyframes beim Abspielen (1 min)
+
+# Aufbau einer Aufzeichnung (NDJSON, mit Endung .gz komprimiert):
+#   Kopf       {"format", "version", "seed", "config", "hash_interval"}
+#   Einträge   [tick, "input", art, args]   Eingriff über Simulation.apply_input
+#              [tick, "hash", hex]          Prüfsumme des Zustands bei Ankunft in tick
+#              [tick, "end"]                Ende der Aufzeichnung
+# Ein Lauf ist durch Startwert, Konfiguration und Eingriffe vollständig
+# bestimmt; die Prüfsummen erkennen beim Abspielen jede Abweichung.
+
+
+class ReplayError(ValueError):
+    """Aufzeichnung ist ungültig oder das Replay weicht vom Original ab."""
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def state_hash(sim):
+    """
+    Prüfsumme des Weltzustands für den Vergleich von Original und Replay.
+
+    Erfasst Uhr, Phase, Zufallsströme, Agenten (Position, Hunger, Alter,
+    Inventar), Häuser, Gegner und Ressourcen. Ids fließen nicht ein, weil
+    ihre Zähler prozessweit laufen; ihre Reihenfolge bleibt trotzdem gleich.
+
+    Args:
+        sim (Simulation): Zu prüfende Welt.
+
+    Returns:
+        str: Hex-Digest.
+    """
+    sim.settle()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(struct.pack("<q?", sim.clock.tick, sim.is_day))
+    for version, state, gauss_next in sim.rng.getstate().values():
+        h.update(array("I", state).tobytes())
+    if sim.population is not None:
+        h.update(repr(sim.population.rng.bit_generator.state).encode())
+
+    values = array("d")
+    for a in sim.agents:
+        values.extend((a.x, a.y, a.hunger, a.age, a.wood, a.stone))
+    for house in sim.houses:
+        values.extend((house.x, house.y, len(house.occupants)))
+    for enemy in sim.enemies:
+        values.extend((enemy.x, enemy.y))
+    for pool in (sim.trees, sim.stones, sim.bushes):
+        values.append(len(pool))
+    h.update(values.tobytes())
+    return h.hexdigest()
+
+
+class Recorder:
+    """
+    Zeichnet einen Lauf als Startwert, Konfiguration und Eingriffe auf.
+
+    Wird direkt nach dem Erzeugen der Simulation angelegt und hängt sich
+    als `sim.recorder` ein: `Simulation.apply_input` meldet Eingriffe,
+    `Simulation.step` den neuen Tick. Alle `hash_interval` Ticks wird eine
+    Prüfsumme geschrieben. Die Datei bleibt klein, weil der Weltzustand
+    selbst nicht gespeichert wird.
+
+    Attributes:
+        sim (Simulation): Aufgezeichnete Welt.
+        path (str): Zieldatei.
+        hash_interval (int): Ticks zwischen zwei Prüfsummen, 0 = keine.
+    """
+
+    def __init__(self, sim, path, hash_interval=HASH_INTERVAL):
+        """
+        Args:
+            sim (Simulation): Frisch erzeugte Simulation (Tick 0).
+            path (str): Zieldatei, Endung .gz für gzip.
+            hash_interval (int, optional): Ticks zwischen zwei Prüfsummen.
+
+        Raises:
+            ReplayError: Wenn die Simulation schon läuft.
+        """
+        if sim.clock.tick != 0:
+            raise ReplayError("Aufzeichnung muss bei Tick 0 beginnen")
+        self.sim = sim
+        self.path = path
+        self.hash_interval = hash_interval
+        self._file = _open(path, "w")
+        header = {"format": FORMAT, "version": VERSION, "seed": sim.seed,
+                  "config": sim.config(), "hash_interval": hash_interval}
+        self._file.write(json.dumps(header, separators=(",", ":")) + "\n")
+        self._write([0, "hash", state_hash(sim)])
+        sim.recorder = self
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def input(self, tick, kind, args):
+        """Zeichnet einen Eingriff auf (aufgerufen von `Simulation.apply_input`)."""
+        self._write([tick, "input", kind, args])
+
+    def stepped(self, sim):
+        """Nach jedem Tick aufgerufen, schreibt ggf. eine Prüfsumme."""
+        tick = sim.clock.tick
+        if self.hash_interval and tick % self.hash_interval == 0:
+            self._write([tick, "hash", state_hash(sim)])
+
+    def close(self):
+        """Schreibt das Ende der Aufzeichnung und schließt die Datei."""
+        if self._file is None:
+            return
+        self._write([self.sim.clock.tick, "end"])
+        self._file.close()
+        self._file = None
+        self.sim.recorder = None
+
+
+class Replay:
+    """
+    Spielt eine Aufzeichnung headless mit voller Geschwindigkeit ab und
+    erlaubt schrittweises Vor- und Zurückspringen.
+
+    Beim Abspielen werden alle `keyframe_interval` Ticks Checkpoints in
+    einem temporären Verzeichnis abgelegt. Ein Sprung zurück lädt den
+    letzten Keyframe davor und rechnet von dort aus weiter.
+
+    Attributes:
+        sim (Simulation): Aktueller Zustand des Replays.
+        seed (int): Startwert der Aufzeichnung.
+        config (dict): Konfiguration der Aufzeichnung.
+        end (int): Letzter aufgezeichneter Tick, None bei abgebrochener Aufzeichnung.
+        inputs (dict): Tick -> Liste der Eingriffe als (Art, Args).
+        hashes (dict): Tick -> erwartete Prüfsumme.
+        keyframes (dict): Tick -> Checkpoint-Datei.
+    """
+
+    def __init__(self, path, events=None, keyframe_interval=KEYFRAME_INTERVAL):
+        """
+        Args:
+            path (str): Aufzeichnung von `Recorder`.
+            events (EventLog, optional): Ereignisprotokoll des Replays.
+            keyframe_interval (int, optional): Ticks zwischen zwei Keyframes, 0 = keine.
+
+        Raises:
+            ReplayError: Wenn die Datei keine gültige Aufzeichnung ist.
+        """
+        self.events = events
+        self.inputs = {}
+        self.hashes = {}
+        self.end = None
+        with _open(path, "r") as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = None
+            if not isinstance(header, dict) or header.get("format") != FORMAT:
+                raise ReplayError(f"{path}: keine Life-Sim-Aufzeichnung")
+            if header["version"] != VERSION:
+                raise ReplayError(f"{path}: Aufzeichnungs-Version {header['version']} wird nicht unterstützt")
+            for line in f:
+                entry = json.loads(line)
+                tick, kind = entry[0], entry[1]
+                if kind == "input":
+                    self.inputs.setdefault(tick, []).append((entry[2], entry[3]))
+                elif kind == "hash":
+                    self.hashes[tick] = entry[2]
+                elif kind == "end":
+                    self.end = tick
+        self.seed = header["seed"]
+        self.config = header["config"]
+
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = {}
+        self._keyframe_dir = tempfile.mkdtemp(prefix="lifesim-replay-") if keyframe_interval else None
+        self.restart()
+
+    @property
+    def tick(self):
+        """Aktueller Tick des Replays."""
+        return self.sim.clock.tick
+
+    @property
+    def done(self):
+        """True, sobald das Ende der Aufzeichnung erreicht ist."""
+        return self.end is not None and self.tick >= self.end
+
+    def restart(self):
+        """Beginnt das Replay von vorn."""
+        self.sim = Simulation(events=self.events, **self.config)
+        self._arrive()
+        return self.sim
+
+    def _arrive(self):
+        """Prüft den Zustand am aktuellen Tick und wendet dessen Eingriffe an."""
+        sim = self.sim
+        tick = sim.clock.tick
+        expected = self.hashes.get(tick)
+        if expected is not None and state_hash(sim) != expected:
+            raise ReplayError(f"Replay weicht bei Tick {tick} von der Aufzeichnung ab")
+        for kind, args in self.inputs.get(tick, ()):
+            sim.apply_input(kind, **args)
+        if self._keyframe_dir and tick % self.keyframe_interval == 0 and tick not in self.keyframes:
+            path = os.path.join(self._keyframe_dir, f"{tick}.ckpt")
+            checkpoint.save(sim, path)
+            self.keyframes[tick] = path
+
+    def step(self):
+        """Rechnet einen Tick weiter, auch über das Ende der Aufzeichnung hinaus."""
+        self.sim.step()
+        self._arrive()
+
+    def seek(self, tick):
+        """
+        Springt zu einem Tick, rückwärts über den letzten Keyframe davor.
+
+        Args:
+            tick (int): Ziel-Tick.
+
+        Returns:
+            Simulation: Aktueller Zustand, nach einem Rücksprung ein neues Objekt.
+        """
+        tick = max(0, tick)
+        if tick < self.tick:
+            earlier = [t for t in self.keyframes if t <= tick]
+            if earlier:
+                self.sim = checkpoint.load(self.keyframes[max(earlier)], events=self.events)
+            else:
+                self.restart()
+        while self.tick < tick:
+            self.step()
+        return self.sim
+
+    def run(self, until=None):
+        """
+        Spielt ohne Rendering bis `until` bzw. bis zum Ende der Aufzeichnung.
+
+        Returns:
+            Simulation: Zustand am Ziel-Tick.
+        """
+        target = until if until is not None else self.end
+        if target is None:
+            target = max(list(self.hashes) + list(self.inputs) + [0])
+        sim = self.seek(target)
+        sim.events.flush()
+        return sim
+
+    def close(self):
+        """Löscht die Keyframes."""
+        if self._keyframe_dir:
+            shutil.rmtree(self._keyframe_dir, ignore_errors=True)
+            self._keyframe_dir = None
+            self.keyframes = {}
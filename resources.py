@@ -0,0 +1,176 @@
+import random
+from spatial import SpatialGrid
+
+class ResourcePool:
+    """
+    Pool für Ressourcen eines Typs (Bäume, Steine oder Büsche).
+
+    Jede Ressource belegt einen festen Slot (`obj.slot`). Verbrauchte
+    Ressourcen werden nur deaktiviert und ihr Slot kommt auf eine
+    Free-List; nachwachsende Ressourcen verwenden diese Objekte wieder,
+    statt neue anzulegen. Aktive Ressourcen liegen zusätzlich in einem
+    SpatialGrid, damit Agenten die nächste in O(1) finden.
+
+    Nach außen verhält sich der Pool wie die bisherigen Ressourcenlisten:
+    len() zählt aktive Ressourcen, Iteration liefert aktive Ressourcen,
+    `remove` verbraucht eine Ressource.
+
+    Attributes:
+        factory (type): Ressourcenklasse, aufgerufen als factory(x, y).
+        target (int): Zielmenge aktiver Ressourcen.
+        area (tuple): (Breite, Höhe) des Spawnbereichs.
+        slots (list): Slot -> Ressourcenobjekt (aktiv oder inaktiv).
+        active (list): Slot -> bool, ob die Ressource existiert.
+        free (list): Stapel freier Slots.
+        grid (SpatialGrid): Räumlicher Index der aktiven Ressourcen.
+        regrowth (float): Anteil von `target`, der pro Tick nachwächst,
+            None = kein stetiges Nachwachsen (nur `reset`).
+        rng: Zufallsquelle mit randint(), Standard ist das Modul random.
+        version (int): Wird bei jeder Neuverteilung (`clear`/`reset`) erhöht.
+        changes (list): (x, y, size) einzeln gespawnter oder verbrauchter
+            Ressourcen seit dem letzten `take_changes`, None = nicht erfasst.
+    """
+
+    def __init__(self, factory, target, area, cell_size, regrowth=None, rng=random):
+        """
+        Args:
+            factory (type): Ressourcenklasse.
+            target (int): Zielmenge aktiver Ressourcen.
+            area (tuple): (Breite, Höhe) des Spawnbereichs.
+            cell_size (float): Zellgröße des SpatialGrids.
+            regrowth (float, optional): Nachwachsrate pro Tick als Anteil von target.
+            rng (optional): Zufallsquelle.
+        """
+        self.factory = factory
+        self.target = target
+        self.area = area
+        self.slots = []
+        self.active = []
+        self.free = []
+        self.grid = SpatialGrid(cell_size)
+        self.regrowth = regrowth
+        self.rng = rng
+        self.version = 0
+        self.changes = None
+        self._regrow_credit = 0.0
+
+    # ----------------------------
+
+    def __len__(self):
+        return len(self.grid)
+
+    def __iter__(self):
+        return iter(self.grid)
+
+    def __contains__(self, obj):
+        return obj in self.grid
+
+    def query(self, x, y, radius):
+        """Siehe SpatialGrid.query."""
+        return self.grid.query(x, y, radius)
+
+    def query_rect(self, x, y, w, h):
+        """Siehe SpatialGrid.query_rect."""
+        return self.grid.query_rect(x, y, w, h)
+
+    def nearest(self, x, y, radius=None, accept=None):
+        """Siehe SpatialGrid.nearest."""
+        return self.grid.nearest(x, y, radius, accept)
+
+    # ----------------------------
+
+    def spawn(self, x, y):
+        """
+        Aktiviert eine Ressource an (x, y), bevorzugt aus einem freien Slot.
+
+        Returns:
+            Das (wiederverwendete oder neue) Ressourcenobjekt.
+        """
+        if self.free:
+            slot = self.free.pop()
+            obj = self.slots[slot]
+            obj.x, obj.y = x, y
+        else:
+            slot = len(self.slots)
+            obj = self.factory(x, y)
+            obj.slot = slot
+            self.slots.append(obj)
+            self.active.append(False)
+        self.active[slot] = True
+        self.grid.append(obj)
+        if self.changes is not None:
+            self.changes.append((obj.x, obj.y, obj.size))
+        return obj
+
+    def spawn_random(self):
+        """Aktiviert eine Ressource an einer zufälligen Position im Spawnbereich."""
+        return self.spawn(self.rng.randint(0, self.area[0]), self.rng.randint(0, self.area[1]))
+
+    def remove(self, obj):
+        """
+        Verbraucht eine Ressource: Slot wird frei, das Objekt bleibt für
+        die Wiederverwendung erhalten.
+
+        Raises:
+            ValueError: Wenn die Ressource nicht aktiv ist (wie list.remove).
+        """
+        self.grid.remove(obj)
+        self.active[obj.slot] = False
+        self.free.append(obj.slot)
+        if self.changes is not None:
+            self.changes.append((obj.x, obj.y, obj.size))
+
+    def clear(self):
+        """Deaktiviert alle Ressourcen."""
+        self.grid.clear()
+        self.active = [False] * len(self.slots)
+        self.free = list(range(len(self.slots) - 1, -1, -1))
+        self.version += 1
+        if self.changes is not None:
+            self.changes.clear()
+
+    def reset(self):
+        """
+        Verteilt `target` Ressourcen neu im Spawnbereich (Tagesanbruch).
+        Bestehende Objekte werden dabei wiederverwendet.
+        """
+        self.clear()
+        for _ in range(self.target):
+            self.spawn_random()
+
+    def track_changes(self):
+        """Beginnt, einzelne Änderungen für `take_changes` zu erfassen."""
+        if self.changes is None:
+            self.changes = []
+
+    def take_changes(self):
+        """
+        Liefert und leert die seit dem letzten Aufruf erfassten Änderungen.
+
+        Returns:
+            list: (x, y, size)-Tupel.
+        """
+        changes = self.changes or []
+        self.changes = []
+        return changes
+
+    def regrow(self):
+        """
+        Lässt pro Tick `regrowth * target` Ressourcen nachwachsen, bis die
+        Zielmenge erreicht ist. Bruchteile werden über Ticks angesammelt.
+
+        Returns:
+            int: Anzahl nachgewachsener Ressourcen.
+        """
+        if not self.regrowth:
+            return 0
+        missing = self.target - len(self.grid)
+        if missing <= 0:
+            self._regrow_credit = 0.0
+            return 0
+        self._regrow_credit += self.regrowth * self.target
+        count = min(missing, int(self._regrow_credit))
+        self._regrow_credit -= count
+        for _ in range(count):
+            self.spawn_random()
+        return count
@@ -0,0 +1,206 @@
+import heapq
+
+AGE_STEP = 0.01     # Alterung pro Tick, wie in Agent.grow_older
+HUNGER_STEP = 0.01  # Hungerabnahme pro Tick
+DEATH_MARGIN = 2    # Ticks, die ein Agent vor seinem errechneten Tod geweckt wird
+
+
+class Scheduler:
+    """
+    Legt Agenten schlafen, bis ein Weck-Ereignis eintritt, und verteilt
+    Entscheidungen unter Last auf mehrere Ticks.
+
+    Ein Agent, der nachts im Haus sitzt, tut bis zum Morgen nichts außer
+    zu altern und zu hungern; Gegner erreichen ihn dort nicht. Statt ihn
+    jeden Tick zu aktualisieren, schläft er bis zum nächsten Weck-Ereignis:
+    Tagesanbruch (`wake_all`) oder kurz vor dem Tick, an dem er verhungern
+    oder an Altersschwäche sterben würde (Prioritätswarteschlange nach
+    Tick). Beim Aufwachen bzw. bevor jemand Alter oder Hunger liest
+    (`settle`), werden die verschlafenen Ticks mit denselben Rechenschritten
+    nachgeholt wie in `Agent.update`, die Ergebnisse sind also bitgleich.
+
+    Die wachen Agenten führt der Scheduler selbst mit: `sleep` nimmt einen
+    Agenten heraus, Aufwachen legt ihn zurück. Ein Tick durchläuft damit
+    nur wache Agenten; nur nach einem Aufwachen wird die Update-Reihenfolge
+    einmal aus dem Verzeichnis aller Agenten wiederhergestellt.
+
+    Mit `decisions_per_tick` treffen pro Tick höchstens so viele wache
+    Agenten eine volle Entscheidung, reihum; die übrigen altern nur. Das
+    ändert das Verhalten und ist deshalb standardmäßig aus.
+
+    Attributes:
+        sleeping (dict): Agent -> [Tick des letzten Updates, Weck-Tick, Nummer].
+        awake (dict): Wache Agenten als Schlüssel, Reihenfolge = Update-Reihenfolge.
+        queue (list): Heap aus (Weck-Tick, Nummer, Agent), veraltete Einträge
+            werden beim Entnehmen übersprungen.
+        decisions_per_tick (int): Entscheidungen pro Tick, None = alle.
+        cursor (int): Position des Reihum-Verfahrens.
+    """
+
+    def __init__(self, decisions_per_tick=None):
+        """
+        Args:
+            decisions_per_tick (int, optional): Höchstzahl voller Entscheidungen pro Tick.
+        """
+        self.sleeping = {}
+        self.awake = {}
+        self.queue = []
+        self.decisions_per_tick = decisions_per_tick
+        self.cursor = 0
+        self._seq = 0
+        self._woken = False  # Reihenfolge von `awake` wiederherstellen
+
+    def __len__(self):
+        return len(self.sleeping)
+
+    def __contains__(self, agent):
+        return agent in self.sleeping
+
+    # ----------------------------
+
+    def sleep(self, agent, tick):
+        """
+        Legt einen Agenten nach seinem Update in Tick `tick` schlafen.
+
+        Der Weck-Tick liegt DEATH_MARGIN Ticks vor seinem frühestmöglichen
+        Tod; bleibt dafür keine Zeit, schläft er nicht.
+
+        Args:
+            agent (Agent): Agent im Haus bei Nacht.
+            tick (int): Tick des gerade ausgeführten Updates.
+
+        Returns:
+            bool: True, wenn der Agent schläft.
+        """
+        remaining = min(agent.hunger / HUNGER_STEP, (100 - agent.age) / AGE_STEP)
+        wake = tick + int(remaining) - DEATH_MARGIN
+        if wake <= tick + 1:
+            return False
+        self._seq += 1
+        self.sleeping[agent] = [tick, wake, self._seq]
+        self.awake.pop(agent, None)
+        heapq.heappush(self.queue, (wake, self._seq, agent))
+        return True
+
+    def settle(self, agent, tick):
+        """
+        Holt Altern und Hunger eines schlafenden Agenten bis vor das Update
+        von Tick `tick` nach, ohne ihn zu wecken.
+
+        Args:
+            agent (Agent): Beliebiger Agent, wache bleiben unverändert.
+            tick (int): Aktueller Tick.
+        """
+        entry = self.sleeping.get(agent)
+        if entry is None:
+            return
+        missed = tick - 1 - entry[0]
+        if missed > 0:
+            age, hunger = agent.age, agent.hunger
+            for _ in range(missed):
+                age += AGE_STEP
+                hunger -= HUNGER_STEP
+            agent.age, agent.hunger = age, hunger
+            entry[0] = tick - 1
+
+    def settle_all(self, tick):
+        """Holt alle schlafenden Agenten bis vor Tick `tick` nach."""
+        for agent in self.sleeping:
+            self.settle(agent, tick)
+
+    def wake(self, agent, tick):
+        """Weckt einen Agenten; er wird in Tick `tick` wieder aktualisiert."""
+        if agent in self.sleeping:
+            self.settle(agent, tick)
+            del self.sleeping[agent]
+            self._woken = True
+
+    def wake_all(self, tick):
+        """Weckt alle Agenten, z.B. bei Tagesanbruch."""
+        self.settle_all(tick)
+        if self.sleeping:
+            self._woken = True
+        self.sleeping.clear()
+        self.queue.clear()
+
+    def wake_due(self, tick):
+        """
+        Weckt alle Agenten, deren Weck-Tick erreicht ist.
+
+        Returns:
+            list: Geweckte Agenten.
+        """
+        woken = []
+        queue, sleeping = self.queue, self.sleeping
+        while queue and queue[0][0] <= tick:
+            _, seq, agent = heapq.heappop(queue)
+            entry = sleeping.get(agent)
+            if entry is not None and entry[2] == seq:
+                self.wake(agent, tick)
+                woken.append(agent)
+        return woken
+
+    def add(self, agent):
+        """Nimmt einen neuen, wachen Agenten auf (am Ende der Update-Reihenfolge)."""
+        self.awake[agent] = None
+
+    def discard(self, agent):
+        """Vergisst einen Agenten (z.B. nach seinem Tod), ohne nachzuholen."""
+        self.sleeping.pop(agent, None)
+        self.awake.pop(agent, None)
+
+    def awake_agents(self, agents):
+        """
+        Wache Agenten in Update-Reihenfolge.
+
+        Args:
+            agents (AgentRegistry): Alle Agenten, wird nur nach einem
+                Aufwachen durchlaufen.
+
+        Returns:
+            list: Wache Agenten.
+        """
+        if self._woken:
+            sleeping = self.sleeping
+            self.awake = dict.fromkeys(a for a in agents if a not in sleeping)
+            self._woken = False
+        return list(self.awake)
+
+    # ----------------------------
+
+    def deciding(self, agents):
+        """
+        Wählt die wachen Agenten, die in diesem Tick entscheiden dürfen.
+
+        Args:
+            agents (list): Wache Agenten in Update-Reihenfolge.
+
+        Returns:
+            set or None: Ausgewählte Agenten, None = alle.
+        """
+        start = self.window(len(agents))
+        if start is None:
+            return None
+        budget = self.decisions_per_tick
+        chosen = agents[start:start + budget]
+        if len(chosen) < budget:
+            chosen += agents[:budget - len(chosen)]
+        return set(chosen)
+
+    def window(self, count):
+        """
+        Startposition des Reihum-Verfahrens unter `count` Kandidaten und
+        Weiterschalten um das Budget.
+
+        Args:
+            count (int): Anzahl der Kandidaten.
+
+        Returns:
+            int or None: Position des ersten Ausgewählten, None = alle entscheiden.
+        """
+        budget = self.decisions_per_tick
+        if budget is None or count <= budget:
+            return None
+        start = self.cursor % count
+        self.cursor = start + budget
+        return start
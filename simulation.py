@@ -0,0 +1,670 @@
+import time
+from agent import Agent, VISION_RADIUS, REWARDS, ACTIONS
+from Objects.tree import Tree
+from Objects.stone import Stone
+from Objects.bush import Bush
+from Objects.house import House, HOUSE_SIZE, HOUSE_CAPACITY
+from Objects.enemy import Enemy, SIGHT
+from Objects.tribe import Tribe
+from spatial import SpatialGrid, HouseIndex
+from registry import AgentRegistry
+from scheduler import Scheduler
+from streams import RandomStreams
+from resources import ResourcePool
+from population import Population, CHOP_TREE, EAT_BUSH, MINE_STONE
+from swarm import EnemySwarm
+from clock import SimClock
+from eventlog import EventLog, DEBUG, INFO, OFF, LEVELS
+from stats import WorldStats
+from profiler import PhaseProfiler
+
+
+WORLD_W, WORLD_H = 1600, 1080  # Standardgröße der Welt in Pixeln
+
+TREE_COUNT = 160
+STONE_COUNT = 120
+BUSH_COUNT = 100
+ENEMY_COUNT = 10
+
+TRIBE_RADIUS = 200  # Hausbau im Umkreis eines Stammeshauses: Agent tritt dem Stamm bei
+
+DAY_TIME = 30    # simulierte Sekunden
+NIGHT_TIME = 20  # simulierte Sekunden
+
+INPUTS = ("agent", "house", "night")  # Eingriffe von außen, siehe Simulation.apply_input
+
+class Simulation:
+    """
+    Headless Simulationskern ohne pygame-Abhängigkeit.
+
+    Besitzt den kompletten Weltzustand und rechnet ihn Tick für Tick weiter.
+    Rendering übernimmt optional die Klasse `Game` in main.py.
+
+    Ressourcen liegen in ResourcePools, Gegner in SpatialGrids, Agenten zusätzlich zur
+    Liste in `agent_grid`, damit Nachbarschaftsabfragen nur die umliegenden
+    Zellen betrachten. Die Kosten eines Ticks hängen damit von Agenten und
+    Gegnern ab und nicht von der Fläche der Welt.
+
+    Attributes:
+        trees, stones, bushes (ResourcePool): Ressourcen, Zellgröße = Sichtweite der Agenten.
+        agents (AgentRegistry): Alle lebenden Agenten nach id (feste Update-Reihenfolge).
+        agent_grid (SpatialGrid): Räumlicher Index der Agenten, Zellgröße = Sichtweite der Gegner.
+        houses (list): Liste aller Häuser.
+        house_grid (SpatialGrid): Räumlicher Index der Häuser nach Mittelpunkt.
+        house_index (HouseIndex): Häuser nach Ecke und Stamm, für Stammesbeitritt und Schutzsuche.
+        enemies (SpatialGrid): Alle Gegner.
+        tribes (list): Liste aller Stämme.
+        world_size (tuple): (Breite, Höhe) der Welt, Grenze für Bewegung und Spawns.
+        scheduler (Scheduler): Schlafende Agenten und Entscheidungsbudget pro Tick.
+        is_day (bool): Status Tag/Nacht.
+        clock (SimClock): Deterministische Simulationsuhr in Ticks.
+        cycle_start (int): Tick des letzten Tag/Nacht-Wechsels.
+        population (Population): Vektorisiertes Agenten-Backend oder None.
+        swarm (EnemySwarm): Gebündelte Gegner-Rechnung des NumPy-Backends oder None.
+        events (EventLog): Ereignisprotokoll (Aktionen, Geburten, Tode, Hausbau).
+        stats (WorldStats): Laufende Statistik für Infoleiste und Auswertungen.
+        profiler (PhaseProfiler): Zeitmessung der Phasen eines Ticks, standardmäßig aus.
+        day_time, night_time (float): Dauer von Tag und Nacht in simulierten Sekunden.
+        enemy_count (int): Gegner pro Nacht.
+        vision_radius (float): Sichtweite neuer Agenten.
+        house_capacity (int): Kapazität neuer Häuser.
+        rewards (dict): Rewards pro Aktion für alle Agenten.
+        seed (int): Startwert, aus dem alle Zufallsströme abgeleitet sind.
+        rng (RandomStreams): Ein Zufallsgenerator pro Teilsystem.
+        recorder (Recorder): Zeichnet Eingaben und Prüfsummen für Replays auf, sonst None.
+        metrics (MetricsExporter): Schreibt Zeitreihen-Messpunkte, sonst None.
+    """
+
+    def __init__(self, vectorized=False, events=None, regrowth=None, seed=None,
+                 day_time=DAY_TIME, night_time=NIGHT_TIME,
+                 tree_count=TREE_COUNT, stone_count=STONE_COUNT, bush_count=BUSH_COUNT,
+                 enemy_count=ENEMY_COUNT, vision_radius=VISION_RADIUS,
+                 house_capacity=HOUSE_CAPACITY, rewards=None, profiler=None,
+                 world_size=(WORLD_W, WORLD_H), decisions_per_tick=None):
+        """
+        Initialisiert die Welt und spawnt Ressourcen, Agenten und Häuser.
+
+        Args:
+            vectorized (bool, optional): Physiologie und Bewegung der Agenten
+                über das NumPy-Backend `Population` rechnen.
+            events (EventLog, optional): Ereignisprotokoll, sonst ein deaktiviertes.
+            regrowth (float, optional): Ressourcen wachsen stetig nach (Anteil
+                der Zielmenge pro Tick) statt jeden Morgen neu verteilt zu werden.
+            seed (int, optional): Startwert der Zufallsströme, sonst ein zufälliger.
+            day_time, night_time (float, optional): Dauer von Tag und Nacht in Sekunden.
+            tree_count, stone_count, bush_count (int, optional): Zielmengen der Ressourcen.
+            enemy_count (int, optional): Gegner pro Nacht.
+            vision_radius (float, optional): Sichtweite der Agenten.
+            house_capacity (int, optional): Kapazität der Häuser.
+            rewards (dict, optional): Abweichende Rewards, ergänzt REWARDS.
+            profiler (PhaseProfiler, optional): Misst die Phasen jedes Ticks.
+            world_size (tuple, optional): (Breite, Höhe) der Welt in Pixeln.
+            decisions_per_tick (int, optional): Höchstens so viele Agenten
+                entscheiden pro Tick, die übrigen altern nur (reihum).
+        """
+        self.rng = RandomStreams(seed)
+        self.seed = self.rng.seed
+        self.recorder = None
+        self.metrics = None
+        self.day_time = day_time
+        self.night_time = night_time
+        self.enemy_count = enemy_count
+        self.vision_radius = vision_radius
+        self.house_capacity = house_capacity
+        self.rewards = dict(REWARDS, **rewards) if rewards else REWARDS
+
+        # Ressourcen generieren
+        self.world_size = area = (int(world_size[0]), int(world_size[1]))
+        self.regrowth = regrowth
+        world = self.rng.world
+        self.trees = ResourcePool(Tree, tree_count, area, vision_radius, regrowth, world)
+        self.stones = ResourcePool(Stone, stone_count, area, vision_radius, regrowth, world)
+        self.bushes = ResourcePool(Bush, bush_count, area, vision_radius, regrowth, world)
+        self.respawn_resources()
+
+        self.clock = SimClock()
+        self.events = events if events else EventLog(level=OFF)
+        self.stats = WorldStats()
+        self.scheduler = Scheduler(decisions_per_tick)
+        self.profiler = profiler if profiler else PhaseProfiler(enabled=False)
+
+        # Agenten und Häuser
+        self.population = Population(seed=self.seed, bounds=area) if vectorized else None
+        self.swarm = EnemySwarm() if vectorized else None
+        self.agents = AgentRegistry()
+        self.agent_grid = SpatialGrid(SIGHT)
+        for x in (400, 420):
+            self.add_agent(Agent(x, 360, clock=self.clock, rng=self.rng.agents))
+        self.houses = []
+        self.house_grid = SpatialGrid(2 * HOUSE_SIZE, position=House.center)
+        self.house_index = HouseIndex(TRIBE_RADIUS / 2)
+        self.add_house(House(430, 350, "wood", capacity=house_capacity))
+        self.enemies = SpatialGrid(VISION_RADIUS)
+        self.tribes = []
+
+        self.is_day = True
+        self.cycle_start = self.clock.tick
+
+    @property
+    def tick(self):
+        """Anzahl bisher simulierter Ticks."""
+        return self.clock.tick
+
+    def config(self):
+        """
+        Argumente, mit denen `Simulation` diese Welt neu erzeugt.
+
+        Returns:
+            dict: Konfiguration inkl. Startwert, ohne Protokoll und Profiler.
+        """
+        return {
+            "vectorized": self.population is not None,
+            "regrowth": self.regrowth,
+            "seed": self.seed,
+            "day_time": self.day_time,
+            "night_time": self.night_time,
+            "enemy_count": self.enemy_count,
+            "vision_radius": self.vision_radius,
+            "house_capacity": self.house_capacity,
+            "tree_count": self.trees.target,
+            "stone_count": self.stones.target,
+            "bush_count": self.bushes.target,
+            "rewards": self.rewards,
+            "world_size": list(self.world_size),
+            "decisions_per_tick": self.scheduler.decisions_per_tick,
+        }
+
+    def apply_input(self, kind, **args):
+        """
+        Wendet einen Eingriff von außen an, z.B. beim Aufbau eines Szenarios.
+
+        Eingriffe laufen über diese Methode, damit `recorder` sie mit Tick
+        aufzeichnen und ein Replay sie an derselben Stelle wiederholen kann.
+
+        Args:
+            kind (str): Art des Eingriffs, einer aus INPUTS:
+                "agent" (x, y, age=0) setzt einen neuen Agenten,
+                "house" (x, y, material="wood") baut ein herrenloses Haus,
+                "night" beginnt sofort die Nacht.
+            **args: Parameter des Eingriffs, müssen JSON-serialisierbar sein.
+
+        Raises:
+            ValueError: Bei unbekannter Art.
+        """
+        if kind not in INPUTS:
+            raise ValueError(f"Unbekannter Eingriff: {kind}")
+        if self.recorder is not None:
+            self.recorder.input(self.clock.tick, kind, args)
+
+        if kind == "agent":
+            agent = Agent(args["x"], args["y"], clock=self.clock, rng=self.rng.agents)
+            agent.age = args.get("age", 0.0)
+            self.add_agent(agent)
+        elif kind == "house":
+            self.add_house(House(args["x"], args["y"], args.get("material", "wood"),
+                                 capacity=self.house_capacity))
+        elif kind == "night" and self.is_day:
+            self.is_day = False
+            self.cycle_start = self.clock.tick
+            self.spawn_enemies()
+            self.events.log(INFO, self.clock.tick, "night")
+
+    def add_agent(self, agent):
+        """
+        Registriert einen Agenten in Liste, Raster und ggf. Population.
+
+        Args:
+            agent (Agent): Neuer Agent.
+        """
+        agent.vision_radius = self.vision_radius
+        agent.rewards = self.rewards
+        agent.rng = self.rng.agents
+        agent.bounds = self.world_size
+        self.agents.append(agent)
+        self.agent_grid.append(agent)
+        self.scheduler.add(agent)
+        self.stats.agent_added(agent)
+        if self.population is not None:
+            self.population.add(agent)
+
+    def remove_agent(self, agent, cause="starved"):
+        """
+        Entfernt einen Agenten aus der Welt, falls er noch lebt.
+
+        Einziger Weg für Tod oder Despawn: der Agent wird aus Verzeichnis,
+        Raster, Statistik und Population genommen und aus seinem Haus,
+        seinem Stamm und als Ziel von Gegnern gelöst. Danach hält die Welt
+        keine Referenz mehr auf ihn.
+
+        Args:
+            agent (Agent): Toter Agent.
+            cause (str, optional): Todesursache für das Ereignisprotokoll.
+        """
+        if agent not in self.agents:
+            return
+        self.events.log(INFO, self.clock.tick, "died", agent.id, cause=cause, age=round(agent.age, 2))
+        self.agents.remove(agent)
+        self.agent_grid.discard(agent)
+        self.scheduler.discard(agent)
+        self.stats.agent_removed(agent)
+        if self.population is not None:
+            self.population.remove(agent)
+
+        if agent.current_house is not None:
+            agent.current_house.leave(agent)
+        if agent.tribe is not None:
+            agent.tribe.remove_member(agent)
+        for enemy in self.enemies:
+            if enemy.target is agent:
+                enemy.target = None
+
+    def add_house(self, house):
+        """
+        Registriert ein Haus in Liste, Raster und Statistik.
+
+        Args:
+            house (House): Neues Haus.
+        """
+        house.observer = self
+        house.rng = self.rng.houses
+        self.houses.append(house)
+        self.house_grid.append(house)
+        self.house_index.add(house)
+        self.stats.house_built(house)
+
+    def occupancy_changed(self, house, delta):
+        """Beobachter der Häuser: meldet Belegungsänderungen an Statistik und Hausindex."""
+        self.stats.occupancy_changed(house, delta)
+        self.house_index.occupancy_changed(house, delta)
+
+    def update_day_night(self):
+        """
+        Prüft den Tag/Nacht-Wechsel basierend auf der Simulationsuhr.
+        Spawnt Gegner bei Nacht und Ressourcen bei Tag.
+        """
+        elapsed = self.clock.tick - self.cycle_start
+
+        if self.is_day and elapsed > self.clock.ticks(self.day_time):
+            self.is_day = False
+            self.cycle_start = self.clock.tick
+            self.spawn_enemies()  # Gegner erscheinen bei Nacht
+            self.events.log(INFO, self.clock.tick, "night")
+        elif not self.is_day and elapsed > self.clock.ticks(self.night_time):
+            self.is_day = True
+            self.cycle_start = self.clock.tick
+            self.enemies.clear()  # Gegner verschwinden bei Tag
+            self.scheduler.wake_all(self.clock.tick)
+            self.events.log(INFO, self.clock.tick, "day")
+            if not self.regrowth:
+                self.respawn_resources()
+            for house in self.houses:
+                house.reset_occupants()  # Nacht-Status zurücksetzen
+
+    def respawn_resources(self):
+        """
+        Setzt Ressourcen zurück und verteilt sie neu an zufälligen Positionen.
+        Die Objekte der Pools werden dabei wiederverwendet.
+        """
+        self.trees.reset()
+        self.stones.reset()
+        self.bushes.reset()
+
+    def regrow_resources(self):
+        """
+        Lässt Ressourcen stetig nachwachsen (nur mit `regrowth`).
+        """
+        self.trees.regrow()
+        self.stones.regrow()
+        self.bushes.regrow()
+
+    def spawn_enemies(self):
+        """
+        Spawnt Gegner zufällig in der Welt.
+        """
+        rng = self.rng.enemies
+        for _ in range(self.enemy_count):
+            self.enemies.append(Enemy(rng.randint(0, self.world_size[0]), rng.randint(0, self.world_size[1]), rng))
+
+    def reproduce(self):
+        """
+        Fortpflanzung nachts: pro Haus und Nacht bekommen
+        mindestens zwei erwachsene Bewohner 1-2 Kinder.
+
+        Betrachtet werden nur bewohnte Häuser aus dem `house_index`, in
+        Bau-Reihenfolge.
+        """
+        tick = self.clock.tick
+        settle = self.scheduler.settle
+        for house in sorted(self.house_index.occupied, key=self.house_index.order.get):
+            if house.has_reproduced or len(house.occupants) < 2:
+                continue
+            for a in house.occupants:
+                settle(a, tick)  # Alter schlafender Bewohner nachholen
+            adults = [a for a in house.occupants if a.age >= 18]
+            if len(adults) >= 2:
+                num_children = self.rng.houses.randint(1, 2)
+                for _ in range(num_children):
+                    parents = self.rng.houses.sample(adults, 2)
+                    child = parents[0].make_child(parents[1])
+                    house.enter(child)
+                    self.add_agent(child)
+                    self.events.log(INFO, self.clock.tick, "born", child.id, generation=child.generation)
+                house.has_reproduced = True
+
+    def build_house(self, agent, material, x, y):
+        """
+        Baut ein Haus für einen Agenten und ordnet es einem Tribe zu.
+
+        Liegt ein Haus eines bestehenden Tribes in Reichweite, tritt der
+        Agent diesem bei, sonst gründet er einen neuen Tribe.
+
+        Args:
+            agent (Agent): Bauender Agent.
+            material (str): Baumaterial ("wood" oder "stone").
+            x, y (float): Position des neuen Hauses.
+        """
+        old_tribe = agent.tribe
+
+        # Nearby Tribe finden
+        nearby_tribes = self.house_index.tribes_near(x, y, TRIBE_RADIUS)
+
+        if nearby_tribes:
+            tribe = self.rng.tribes.choice(nearby_tribes)
+        else:
+            # Neuen Tribe erstellen, falls keiner in der Nähe
+            tribe = Tribe(agent, x, y, rng=self.rng.tribes)
+            self.tribes.append(tribe)
+
+        # Stammeswechsel: aus dem alten Tribe austreten
+        if old_tribe is not None and old_tribe is not tribe:
+            old_tribe.remove_member(agent)
+        tribe.add_member(agent)  # Agent dem Tribe hinzufügen
+        self.stats.tribe_changed(old_tribe, tribe)
+        # Haus erzeugen und Tribe zuordnen
+        new_house = House(x, y, material, capacity=self.house_capacity, tribe=tribe)
+        tribe.houses.append(new_house)
+        self.add_house(new_house)
+        self.events.log(INFO, self.clock.tick, "build_house", agent.id, material=material, tribe=tribe.id)
+
+    def step(self):
+        """
+        Rechnet einen Simulations-Tick:
+        - Tag/Nacht wechseln
+        - Fortpflanzung nachts
+        - Agenten aktualisieren & Hausbau
+        - Gegner aktualisieren
+        - Tote Agenten entfernen
+
+        Nach jeder Phase setzt `profiler` eine Marke.
+        """
+        mark = self.profiler.mark
+        self.update_day_night()
+        mark("update_day_night")
+        if self.regrowth:
+            self.regrow_resources()
+            mark("regrow")
+
+        # Fortpflanzung nachts
+        if not self.is_day:
+            self.reproduce()
+            mark("reproduce")
+
+        if self.population is not None:
+            dead_agents = self.update_agents_vectorized()
+        else:
+            dead_agents = self.update_agents()
+        mark("agents")
+
+        if self.swarm is not None:
+            for killed in self.swarm.update(self):
+                self.remove_agent(killed, cause="enemy")
+        else:
+            for enemy in self.enemies:
+                killed = enemy.update(self.agent_grid, self.house_grid)
+                self.enemies.move(enemy)
+                if killed:
+                    self.remove_agent(killed, cause="enemy")
+        mark("enemies")
+
+        for d in dead_agents:
+            self.remove_agent(d, cause="old_age" if d.age >= 100 else "starved")
+
+        self.clock.advance()
+        if self.recorder is not None:
+            self.recorder.stepped(self)
+        if self.metrics is not None:
+            self.metrics.stepped(self)
+        mark("remove_dead")
+
+    def settle(self):
+        """Holt Alter und Hunger schlafender Agenten bis zum aktuellen Tick nach."""
+        self.scheduler.settle_all(self.clock.tick)
+
+    def log_action(self, agent):
+        """Protokolliert die zuletzt gewählte Aktion eines Agenten (DEBUG)."""
+        if agent.last_action is not None:
+            self.events.log(DEBUG, self.clock.tick, agent.last_action, agent.id,
+                            age=round(agent.age, 2), wood=agent.wood, stone=agent.stone)
+
+    def update_agents(self):
+        """
+        Aktualisiert alle Agenten einzeln über `Agent.update`.
+
+        Agenten, die nachts im Haus sitzen, schlafen danach im `scheduler`
+        bis Tagesanbruch; durchlaufen werden nur seine wachen Agenten. Ein
+        Entscheidungsbudget gilt nur für Agenten außerhalb der Häuser,
+        die nicht ausgewählten altern in diesem Tick nur.
+
+        Returns:
+            list: Gestorbene Agenten.
+        """
+        dead_agents = []
+        log_actions = self.events.enabled(DEBUG)
+        mark = self.profiler.mark
+        tick = self.clock.tick
+        scheduler = self.scheduler
+        scheduler.wake_due(tick)
+        night = not self.is_day
+
+        awake = scheduler.awake_agents(self.agents)
+        deciding = None
+        if scheduler.decisions_per_tick is not None:
+            # Auswahl unabhängig davon, wer schon schläft (gleich nach Laden eines Checkpoints)
+            outside = [a for a in awake if not (a.in_house and a.current_house is not None)] if night else awake
+            deciding = scheduler.deciding(outside)
+        for agent in awake:
+            sheltered = night and agent.in_house and agent.current_house is not None
+            if deciding is not None and not sheltered and agent not in deciding:
+                if agent.grow_older():
+                    dead_agents.append(agent)
+                continue
+
+            agent.last_action = None
+            status, data = agent.update(
+                self.trees,
+                self.stones,
+                self.bushes,
+                self.agents,
+                self.house_index,
+                self.is_day,
+                self.enemies
+            )
+            self.agent_grid.move(agent)
+            if log_actions:
+                self.log_action(agent)
+
+            if status == "dead":
+                dead_agents.append(agent)
+            elif sheltered:
+                scheduler.sleep(agent, tick)  # bis Tagesanbruch nur noch altern
+
+            if status == "build_house":
+                material, x, y = data
+                mark("agents")
+                self.build_house(agent, material, x, y)
+                mark("build_house")
+
+        return dead_agents
+
+    def update_agents_vectorized(self):
+        """
+        Aktualisiert alle Agenten über das NumPy-Backend: Altern, Hunger,
+        Tod, Clamping im Haus, Aktionswahl und die häufigen Aktionen
+        (Zufallsschritt, Spitzhacke, Weg zur nächsten Ressource) laufen
+        gebündelt in `Population`. Nur Agenten mit Gegner in Reichweite,
+        erreichter Ressource, Hausbau oder Haus zu verlassen führen ihre
+        Aktion einzeln per `Agent.act` aus, in Zeilenreihenfolge. Lernen,
+        Bewegungen und das Agenten-Raster werden anschließend gemeinsam
+        übernommen. Ein Entscheidungsbudget im `scheduler` gilt reihum
+        über die Zeilen.
+
+        Returns:
+            list: Gestorbene Agenten.
+        """
+        pop = self.population
+        log_actions = self.events.enabled(DEBUG)
+        mark = self.profiler.mark
+        dead_agents = pop.age_step()
+        active = pop.living()
+
+        # Nacht: im Haus bleiben
+        if not self.is_day:
+            active &= ~pop.clamp_sheltered()
+
+        # Zeilen ändern sich erst beim Entfernen toter Agenten nach dem Tick
+        chosen = pop.choose_actions()
+        start = self.scheduler.window(int(active.sum()))
+        if start is not None:
+            active = pop.window(active, start, self.scheduler.decisions_per_tick)
+        resources = {CHOP_TREE: self.trees, EAT_BUSH: self.bushes, MINE_STONE: self.stones}
+        single = pop.act(active, chosen, self.is_day, resources, self.enemies, self.rewards, self.vision_radius)
+
+        views = pop.views
+        chosen = chosen.tolist()
+        for row in single.tolist():
+            agent = views[row]
+            agent.last_action = None
+            status, data = agent.act(
+                self.trees,
+                self.stones,
+                self.bushes,
+                self.agents,
+                self.house_index,
+                self.is_day,
+                self.enemies,
+                ACTIONS[chosen[row]]
+            )
+            if status == "build_house":
+                material, x, y = data
+                mark("agents")
+                self.build_house(agent, material, x, y)
+                mark("build_house")
+        if log_actions:
+            for row in active.nonzero()[0].tolist():
+                self.log_action(views[row])
+
+        pop.apply_learning(self.clock.tick)
+        pop.apply_movement()
+        grid = self.agent_grid
+        for row in pop.changed_cells(grid.cell_size).tolist():
+            grid.move(views[row])
+
+        return dead_agents
+
+    def run(self, ticks):
+        """
+        Simuliert eine feste Anzahl an Ticks ohne Rendering.
+
+        Args:
+            ticks (int): Anzahl der Ticks.
+
+        Returns:
+            Simulation: self, für verkettete Aufrufe.
+        """
+        profiler = self.profiler
+        for _ in range(ticks):
+            profiler.start()
+            self.step()
+            profiler.end_frame()
+        self.events.flush()
+        return self
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Life Sim AI ohne Fenster ausführen.")
+    parser.add_argument("--ticks", type=int, default=10000, help="Anzahl der Ticks")
+    parser.add_argument("--seed", type=int, help="Startwert der Zufallsströme")
+    parser.add_argument("--world-size", default=f"{WORLD_W}x{WORLD_H}", help="Weltgröße in Pixeln, z.B. 16000x10800")
+    parser.add_argument("--vectorized", action="store_true", help="NumPy-Backend für Agenten nutzen")
+    parser.add_argument("--decisions-per-tick", type=int, help="Höchstens so viele Agenten-Entscheidungen pro Tick")
+    parser.add_argument("--regrowth", type=float, help="Stetiges Nachwachsen (Anteil der Zielmenge pro Tick)")
+    parser.add_argument("--log", help="Ereignisse als NDJSON in diese Datei schreiben")
+    parser.add_argument("--log-level", choices=sorted(LEVELS), default="info", help="Mindeststufe der Ereignisse")
+    parser.add_argument("--log-sample", type=int, default=1, help="Nur jede n-te Aktion protokollieren")
+    parser.add_argument("--load", help="Welt aus einem Checkpoint laden statt neu zu erzeugen")
+    parser.add_argument("--save", help="Welt nach dem Lauf als Checkpoint speichern")
+    parser.add_argument("--record", help="Lauf für ein späteres Replay aufzeichnen (.gz für gzip)")
+    parser.add_argument("--replay", help="Aufzeichnung headless abspielen statt einer neuen Welt")
+    parser.add_argument("--until", type=int, help="Replay nur bis zu diesem Tick abspielen")
+    parser.add_argument("--profile", action="store_true", help="Perzentile der Tick-Phasen ausgeben")
+    parser.add_argument("--profile-csv", help="Phasenzeiten pro Tick als CSV speichern")
+    parser.add_argument("--metrics", help="Zeitreihe der Kennzahlen in diese Datei schreiben (.csv oder .ndjson)")
+    parser.add_argument("--metrics-every", type=int, default=600, help="Ticks zwischen zwei Messpunkten")
+    parser.add_argument("--metrics-format", choices=("csv", "ndjson", "columnar"), help="Format der Zeitreihe")
+    parser.add_argument("--metrics-rotate", type=int, metavar="BYTES", help="Zeitreihe ab dieser Größe rotieren")
+    parser.add_argument("--metrics-port", type=int, help="Letzten Messpunkt per HTTP auf 127.0.0.1 anbieten")
+    args = parser.parse_args()
+
+    events = EventLog(args.log, LEVELS[args.log_level], sample_every=args.log_sample) if args.log else None
+    if args.replay:
+        from replay import Replay, state_hash
+        replay = Replay(args.replay, events=events, keyframe_interval=0)
+        start = time.perf_counter()
+        sim = replay.run(args.until)
+        elapsed = time.perf_counter() - start
+        replay.close()
+        sim.events.close()
+        if args.save:
+            import checkpoint
+            checkpoint.save(sim, args.save)
+        print(f"Replay bis Tick {sim.tick} in {elapsed:.2f}s ({sim.tick / max(elapsed, 1e-9):.0f} Ticks/s), "
+              f"Seed {replay.seed}, Prüfsumme {state_hash(sim)}")
+        raise SystemExit
+
+    if args.load:
+        import checkpoint
+        sim = checkpoint.load(args.load, events=events)
+    else:
+        world_size = tuple(int(v) for v in args.world_size.lower().split("x"))
+        sim = Simulation(vectorized=args.vectorized, events=events, regrowth=args.regrowth, seed=args.seed,
+                         world_size=world_size, decisions_per_tick=args.decisions_per_tick)
+    recorder = None
+    if args.record:
+        from replay import Recorder
+        recorder = Recorder(sim, args.record)
+    if args.metrics:
+        from metrics import MetricsExporter
+        MetricsExporter(sim, args.metrics, every=args.metrics_every, format=args.metrics_format,
+                        max_bytes=args.metrics_rotate, port=args.metrics_port)
+    if args.profile or args.profile_csv:
+        sim.profiler = PhaseProfiler(window=args.ticks)
+    start = time.perf_counter()
+    sim.run(args.ticks)
+    elapsed = time.perf_counter() - start
+    sim.events.close()
+    if recorder:
+        recorder.close()
+    if sim.metrics is not None:
+        sim.metrics.close()
+    if args.save:
+        import checkpoint
+        checkpoint.save(sim, args.save)
+    if args.profile:
+        print("\n".join(sim.profiler.report_lines()))
+    if args.profile_csv:
+        sim.profiler.export_csv(args.profile_csv)
+    print(f"{args.ticks} Ticks ({sim.clock.seconds:.0f}s Simulationszeit) in {elapsed:.2f}s "
+          f"({args.ticks / max(elapsed, 1e-9):.0f} Ticks/s), Agenten: {len(sim.agents)}, Stämme: {len(sim.tribes)}, "
+          f"Seed: {sim.seed}")
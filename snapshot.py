@@ -0,0 +1,290 @@
+import queue
+import threading
+import time
+
+from Objects.house import HOUSE_SIZE
+
+PUBLISH_RATE = 60   # Snapshots pro Sekunde, entspricht der Bildwiederholrate
+UI_EVERY = 15       # Snapshots zwischen zwei Neuberechnungen der Infoleiste
+CATCH_UP = 0.25     # Sekunden Rückstand, ab denen das Tempo neu angesetzt wird
+
+NO_TRIBE_COLOR = (255, 255, 255)
+
+
+class Snapshot:
+    """
+    Unveränderliches Abbild dessen, was der Renderer von der Welt braucht.
+
+    Enthält nur Positionen und Farben als Tupel, keine Referenzen auf
+    Objekte der Simulation. Der Render-Thread kann einen Snapshot daher
+    zeichnen, während die Simulation im eigenen Thread weiterrechnet.
+
+    Attributes:
+        tick (int): Tick, zu dem der Snapshot entstand.
+        is_day (bool): Status Tag/Nacht.
+        static (tuple): (Farbe, (x, y, w, h)) für Ressourcen und Häuser.
+        static_version (int): Ändert sich, sobald `static` neu erfasst wird.
+        patches (list): Ausbesserungen von `static` seit dieser Erfassung als
+            (Bereich, Inhalt), Bereich (x, y, w, h) in Weltkoordinaten, Inhalt
+            wie `static`. Wird nur angehängt und mit späteren Snapshots derselben
+            Version geteilt.
+        patch_count (int): Anzahl der Einträge von `patches`, die zu diesem Snapshot gehören.
+        agents (tuple): (x, y, Farbe) pro Agent.
+        enemies (tuple): (x, y) pro Gegner.
+        ui_lines (tuple): Zeilen der Infoleiste, evtl. aus einem älteren Snapshot.
+    """
+
+    __slots__ = ("tick", "is_day", "static", "static_version", "patches", "patch_count",
+                 "agents", "enemies", "ui_lines")
+
+    def __init__(self, tick, is_day, static, static_version, agents, enemies, ui_lines=(),
+                 patches=(), patch_count=0):
+        self.tick = tick
+        self.is_day = is_day
+        self.static = static
+        self.static_version = static_version
+        self.patches = patches
+        self.patch_count = patch_count
+        self.agents = agents
+        self.enemies = enemies
+        self.ui_lines = ui_lines
+
+    @staticmethod
+    def capture_static(sim):
+        """
+        Ressourcen und Häuser als (Farbe, Rechteck)-Tupel.
+
+        Args:
+            sim (Simulation): Abzubildende Welt.
+
+        Returns:
+            tuple
+        """
+        static = []
+        for pool in (sim.trees, sim.stones, sim.bushes):
+            static.extend((obj.color, (int(obj.x), int(obj.y), obj.size, obj.size)) for obj in pool)
+        for house in sim.houses:
+            color = house.tribe.color if house.tribe is not None else house.color
+            static.append((color, (int(house.x), int(house.y), int(house.width), int(house.height))))
+        return tuple(static)
+
+    @staticmethod
+    def capture_area(sim, area):
+        """
+        Ressourcen und Häuser, die einen Weltbereich berühren, wie in `capture_static`.
+
+        Args:
+            sim (Simulation): Abzubildende Welt.
+            area (tuple): (x, y, Breite, Höhe) in Weltkoordinaten.
+
+        Returns:
+            tuple
+        """
+        x, y, w, h = area
+        static = []
+        for pool in (sim.trees, sim.stones, sim.bushes):
+            size = pool.factory.size
+            static.extend((obj.color, (int(obj.x), int(obj.y), obj.size, obj.size))
+                          for obj in pool.query_rect(x - size, y - size, w + size, h + size))
+        houses = sim.house_grid.query_rect(x - HOUSE_SIZE, y - HOUSE_SIZE, w + 2 * HOUSE_SIZE, h + 2 * HOUSE_SIZE)
+        for house in sorted(houses, key=sim.house_index.order.get):
+            color = house.tribe.color if house.tribe is not None else house.color
+            static.append((color, (int(house.x), int(house.y), int(house.width), int(house.height))))
+        return tuple(static)
+
+    @staticmethod
+    def capture_agents(sim):
+        """Agenten als (x, y, Farbe), Farbe des Stammes oder weiß."""
+        return tuple(
+            (int(a.x), int(a.y), a.tribe.color if a.tribe is not None else NO_TRIBE_COLOR)
+            for a in sim.agents
+        )
+
+
+class SnapshotBuffer:
+    """
+    Doppelpuffer für Snapshots zwischen Simulations- und Render-Thread.
+
+    Der Schreiber legt den neuen Snapshot im hinteren Platz ab und tauscht
+    dann unter einer Sperre vorne und hinten. Der Leser bekommt immer den
+    zuletzt vollständig veröffentlichten Snapshot, ohne auf die Simulation
+    zu warten.
+
+    Attributes:
+        published (int): Anzahl veröffentlichter Snapshots.
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, snapshot):
+        """Veröffentlicht einen Snapshot (nur vom Simulations-Thread)."""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+            self.published += 1
+
+    def latest(self):
+        """
+        Returns:
+            Snapshot: Zuletzt veröffentlichter Snapshot oder None.
+        """
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread(threading.Thread):
+    """
+    Rechnet die Simulation in einem eigenen Thread und veröffentlicht
+    PUBLISH_RATE-mal pro Sekunde einen Snapshot.
+
+    Die statische Ebene wird nur bei einer neuen Welt, beim Wechsel von
+    Tag und Nacht, bei neuen Häusern oder einer Neuverteilung der
+    Ressourcen komplett erfasst. Einzelne verbrauchte oder nachgewachsene
+    Ressourcen werden als Ausbesserungen ihres Bereichs angehängt, der
+    Renderer zeichnet dann nur diese Bereiche neu.
+
+    Das Tempo folgt `sim.clock.speed`: bei festem Faktor werden
+    speed x ticks_per_second Ticks pro Sekunde gerechnet, bei MAX so viele
+    wie möglich. Änderungen von außen (Tempo, Sprünge im Replay, Eingriffe)
+    werden über `submit` zwischen zwei Ticks im Simulations-Thread
+    ausgeführt, damit nie zwei Threads gleichzeitig die Welt verändern.
+
+    Attributes:
+        buffer (SnapshotBuffer): Ziel der Snapshots.
+        rate (float): Gemessene Ticks pro Sekunde.
+        paused (bool): Angehalten, Befehle werden weiter ausgeführt.
+    """
+
+    def __init__(self, world, step, buffer=None, ui_lines=None, publish_rate=PUBLISH_RATE, ui_every=UI_EVERY):
+        """
+        Args:
+            world (callable): Liefert die aktuelle Simulation (kann sich beim Replay ändern).
+            step (callable): Rechnet einen Tick.
+            buffer (SnapshotBuffer, optional): Ziel der Snapshots, sonst ein neuer.
+            ui_lines (callable, optional): Liefert die Zeilen der Infoleiste.
+            publish_rate (float, optional): Snapshots pro Sekunde.
+            ui_every (int, optional): Snapshots zwischen zwei Infoleisten-Updates.
+        """
+        super().__init__(name="simulation", daemon=True)
+        self.world = world
+        self.step = step
+        self.buffer = buffer if buffer is not None else SnapshotBuffer()
+        self.ui_lines = ui_lines
+        self.publish_interval = 1 / publish_rate
+        self.ui_every = max(1, ui_every)
+        self.rate = 0.0
+        self.paused = False
+        self._commands = queue.Queue()
+        self._stop_event = threading.Event()
+
+        self._sim = None
+        self._static = ()
+        self._static_key = None
+        self._static_version = 0
+        self._patches = []
+        self._ui = ()
+
+    def submit(self, command):
+        """
+        Führt `command()` vor dem nächsten Tick im Simulations-Thread aus.
+
+        Args:
+            command (callable): Aufruf ohne Argumente.
+        """
+        self._commands.put(command)
+
+    def stop(self, timeout=None):
+        """Beendet den Thread nach dem laufenden Tick und wartet darauf."""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    # ----------------------------
+
+    def publish(self):
+        """Erzeugt einen Snapshot der aktuellen Welt und veröffentlicht ihn."""
+        sim = self.world()
+        pools = (sim.trees, sim.stones, sim.bushes)
+        if sim is not self._sim:
+            # neue Welt (z.B. nach einem Sprung im Replay): alles neu erfassen
+            self._sim = sim
+            self._static_key = None
+            for pool in pools:
+                pool.track_changes()
+
+        key = (sim.is_day, len(sim.houses)) + tuple(pool.version for pool in pools)
+        if key != self._static_key:
+            self._static_key = key
+            self._static = Snapshot.capture_static(sim)
+            self._static_version += 1
+            self._patches = []  # frische Liste, ältere Snapshots behalten ihre
+            for pool in pools:
+                pool.take_changes()  # in der Erfassung enthalten
+        else:
+            areas = {}
+            for pool in pools:
+                for x, y, size in pool.take_changes():
+                    areas[(x, y, size, size)] = None
+            self._patches.extend((area, Snapshot.capture_area(sim, area)) for area in areas)
+
+        if self.ui_lines is not None and self.buffer.published % self.ui_every == 0:
+            self._ui = tuple(self.ui_lines())
+
+        self.buffer.publish(Snapshot(
+            sim.clock.tick, sim.is_day, self._static, self._static_version,
+            Snapshot.capture_agents(sim),
+            tuple((int(e.x), int(e.y)) for e in sim.enemies),
+            self._ui,
+            self._patches,
+            len(self._patches),
+        ))
+
+    def _run_commands(self):
+        ran = False
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return ran
+            command()
+            ran = True
+
+    def run(self):
+        clock = time.perf_counter
+        next_publish = next_tick = rate_start = clock()
+        rate_ticks = 0
+        self.publish()
+
+        while not self._stop_event.is_set():
+            if self._run_commands():
+                next_tick = clock()
+                next_publish = 0  # Änderung sofort zeigen
+
+            now = clock()
+            if now >= next_publish:
+                self.publish()
+                next_publish = now + self.publish_interval
+                if now - rate_start >= 1:
+                    self.rate = rate_ticks / (now - rate_start)
+                    rate_start, rate_ticks = now, 0
+
+            if self.paused:
+                time.sleep(self.publish_interval / 2)
+                next_tick = clock()
+                continue
+
+            speed = self.world().clock.speed
+            if speed is not None:
+                if now < next_tick:
+                    time.sleep(min(next_tick, next_publish) - now)
+                    continue
+                next_tick += 1 / (speed * self.world().clock.ticks_per_second)
+                if now - next_tick > CATCH_UP:
+                    next_tick = now
+            self.step()
+            rate_ticks += 1
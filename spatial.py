@@ -0,0 +1,435 @@
+try:
+    import numpy as np
+except ImportError:  # nur grid_pairs/grid_nearest brauchen NumPy (vektorisiertes Backend)
+    np = None
+
+import math
+
+# Kodierung einer Zelle (cx, cy) als eine Zahl für die sortierte Suche in grid_pairs
+_CELL_OFFSET = 1 << 20
+_CELL_STRIDE = 1 << 21
+
+class SpatialGrid:
+    """
+    Uniformes Raster (Spatial Hash) für Nachbarschaftsabfragen.
+
+    Objekte mit x- und y-Attributen werden der Zelle zugeordnet, in der
+    ihre Position liegt. Abfragen betrachten nur die Zellen, die den
+    Suchradius überdecken, statt alle Objekte der Welt.
+
+    Das Raster verhält sich zusätzlich wie eine Liste (append, remove,
+    clear, len, Iteration in Einfügereihenfolge) und kann deshalb die
+    bisherigen Objektlisten direkt ersetzen.
+
+    Attributes:
+        cell_size (float): Kantenlänge einer Zelle. Sollte etwa dem
+            typischen Suchradius entsprechen.
+        cells (dict): (cx, cy) -> dict der Objekte in dieser Zelle.
+        position (callable): Objekt -> (x, y) für Zellzuordnung und
+            Distanzen, None = (obj.x, obj.y).
+    """
+
+    def __init__(self, cell_size, objects=(), position=None):
+        """
+        Args:
+            cell_size (float): Kantenlänge einer Zelle.
+            objects (iterable, optional): Initiale Objekte.
+            position (callable, optional): Abweichender Bezugspunkt, z.B.
+                der Mittelpunkt eines Hauses.
+        """
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.position = position
+        self._keys = {}  # Objekt -> Zelle, Reihenfolge = Einfügereihenfolge
+        self.extend(objects)
+
+    # ----------------------------
+
+    def _key(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def _pos(self, obj):
+        return self.position(obj) if self.position else (obj.x, obj.y)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(list(self._keys))
+
+    def __contains__(self, obj):
+        return obj in self._keys
+
+    # ----------------------------
+
+    def append(self, obj):
+        """Registriert ein Objekt an seiner aktuellen Position."""
+        key = self._key(*self._pos(obj))
+        self._keys[obj] = key
+        self.cells.setdefault(key, {})[obj] = None
+
+    def extend(self, objects):
+        """Registriert mehrere Objekte."""
+        for obj in objects:
+            self.append(obj)
+
+    def remove(self, obj):
+        """
+        Entfernt ein Objekt aus dem Raster.
+
+        Raises:
+            ValueError: Wenn das Objekt nicht registriert ist (wie list.remove).
+        """
+        key = self._keys.pop(obj, None)
+        if key is None:
+            raise ValueError("SpatialGrid.remove(x): x not in grid")
+        cell = self.cells[key]
+        del cell[obj]
+        if not cell:
+            del self.cells[key]
+
+    def discard(self, obj):
+        """Entfernt ein Objekt, falls es registriert ist."""
+        if obj in self._keys:
+            self.remove(obj)
+
+    def clear(self):
+        """Entfernt alle Objekte."""
+        self.cells.clear()
+        self._keys.clear()
+
+    def move(self, obj):
+        """
+        Aktualisiert die Zelle eines Objekts nach einer Positionsänderung.
+        Kostet nur etwas, wenn das Objekt die Zelle gewechselt hat.
+        """
+        old = self._keys.get(obj)
+        if old is None:
+            return
+        key = self._key(*self._pos(obj))
+        if key != old:
+            cell = self.cells[old]
+            del cell[obj]
+            if not cell:
+                del self.cells[old]
+            self._keys[obj] = key
+            self.cells.setdefault(key, {})[obj] = None
+
+    # ----------------------------
+
+    def query(self, x, y, radius):
+        """
+        Liefert alle Objekte aus den Zellen, die den Kreis um (x, y)
+        überdecken. Die exakte Distanzprüfung übernimmt der Aufrufer.
+
+        Args:
+            x, y (float): Mittelpunkt der Suche.
+            radius (float): Suchradius.
+
+        Returns:
+            list: Kandidaten in der Nähe.
+        """
+        cs = self.cell_size
+        x0, x1 = int((x - radius) // cs), int((x + radius) // cs)
+        y0, y1 = int((y - radius) // cs), int((y + radius) // cs)
+        cells = self.cells
+        found = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # Großer Radius: belegte Zellen direkt filtern statt leere abzufragen
+            for (cx, cy), cell in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.extend(cell)
+            return found
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    def cells_in_rect(self, x, y, w, h):
+        """
+        Belegte Zellen, die ein Rechteck überdecken.
+
+        Args:
+            x, y (float): Linke obere Ecke.
+            w, h (float): Breite und Höhe.
+
+        Returns:
+            list: ((cx, cy), Zelle)-Paare.
+        """
+        cs = self.cell_size
+        x0, x1 = int(x // cs), int((x + w) // cs)
+        y0, y1 = int(y // cs), int((y + h) // cs)
+        cells = self.cells
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            return [(key, cell) for key, cell in cells.items()
+                    if x0 <= key[0] <= x1 and y0 <= key[1] <= y1]
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.append(((cx, cy), cell))
+        return found
+
+    def query_rect(self, x, y, w, h):
+        """
+        Liefert alle Objekte aus den Zellen, die ein Rechteck überdecken,
+        z.B. den sichtbaren Ausschnitt. Die exakte Prüfung übernimmt der
+        Aufrufer.
+
+        Returns:
+            list: Kandidaten im Rechteck.
+        """
+        found = []
+        for _, cell in self.cells_in_rect(x, y, w, h):
+            found.extend(cell)
+        return found
+
+    def nearest(self, x, y, radius=None, accept=None):
+        """
+        Findet das nächste Objekt mit Distanz < radius.
+
+        Ohne Radius wird in wachsenden Ringen gesucht, bis ein Objekt
+        gefunden ist; das Ergebnis ist trotzdem exakt das nächste.
+
+        Args:
+            x, y (float): Mittelpunkt der Suche.
+            radius (float, optional): Maximale Distanz (exklusiv).
+            accept (callable, optional): Filter, nur Objekte mit
+                accept(obj) == True kommen in Frage.
+
+        Returns:
+            Objekt oder None.
+        """
+        if radius is not None:
+            return self._nearest_within(x, y, radius, accept)
+        if not self._keys:
+            return None
+
+        radius = self.cell_size
+        while True:
+            best = self._nearest_within(x, y, radius, accept)
+            if best is not None:
+                return best
+            if self._covers_all(x, y, radius):
+                return None
+            radius *= 2
+
+    def _nearest_within(self, x, y, radius, accept):
+        best = None
+        best_dist = radius
+        position = self.position
+        for obj in self.query(x, y, radius):
+            if accept is not None and not accept(obj):
+                continue
+            ox, oy = position(obj) if position else (obj.x, obj.y)
+            d = math.hypot(x - ox, y - oy)
+            if d < best_dist:
+                best, best_dist = obj, d
+        return best
+
+    def _covers_all(self, x, y, radius):
+        """Prüft, ob ein Suchkreis alle belegten Zellen vollständig einschließt."""
+        cs = self.cell_size
+        for cx, cy in self.cells:
+            far_x = max(abs(x - cx * cs), abs(x - (cx + 1) * cs))
+            far_y = max(abs(y - cy * cs), abs(y - (cy + 1) * cs))
+            if math.hypot(far_x, far_y) >= radius:
+                return False
+        return True
+
+
+class HouseIndex:
+    """
+    Index der Häuser für Stammesbeitritt und Schutzsuche.
+
+    Häuser liegen nach ihrer Ecke (x, y) in einem gemeinsamen Raster und
+    zusätzlich, solange sie freien Platz haben, in einem Raster pro Stamm.
+    Damit lassen sich "Stämme mit einem Haus im Umkreis" und "nächstes
+    Haus des eigenen Stammes mit freiem Platz" beantworten, ohne alle
+    Häuser zu durchlaufen; volle Häuser werden bei der Schutzsuche gar
+    nicht erst betrachtet. Bewohnte Häuser führt er für die Fortpflanzung
+    gesondert. Die Belegung erfährt der Index über
+    `occupancy_changed` (Beobachter der Häuser). Distanzen und Reihenfolge
+    bei Gleichstand entsprechen den bisherigen linearen Suchen über die
+    Hausliste.
+
+    Verhält sich wie die Hausliste (len, Iteration in Bau-Reihenfolge).
+
+    Attributes:
+        grid (SpatialGrid): Alle Häuser.
+        tribes (dict): Tribe (oder None) -> SpatialGrid seiner Häuser mit freiem Platz.
+        occupied (dict): Bewohnte Häuser als Schlüssel.
+        order (dict): Haus -> laufende Nummer in Bau-Reihenfolge.
+    """
+
+    def __init__(self, cell_size, houses=()):
+        """
+        Args:
+            cell_size (float): Zellgröße der Raster.
+            houses (iterable, optional): Initiale Häuser.
+        """
+        self.cell_size = cell_size
+        self.grid = SpatialGrid(cell_size)
+        self.tribes = {}
+        self.occupied = {}
+        self.order = {}
+        for house in houses:
+            self.add(house)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(list(self.order))
+
+    def add(self, house):
+        """Registriert ein neues Haus (der Stamm eines Hauses ändert sich nicht)."""
+        self.order[house] = len(self.order)
+        self.grid.append(house)
+        self.occupancy_changed(house, 0)
+
+    def occupancy_changed(self, house, delta):
+        """Agenten haben ein Haus betreten oder verlassen: freie und bewohnte Häuser nachführen."""
+        if house.occupants:
+            self.occupied[house] = None
+        else:
+            self.occupied.pop(house, None)
+        grid = self.tribes.get(house.tribe)
+        if grid is None:
+            grid = self.tribes[house.tribe] = SpatialGrid(self.cell_size)
+        if house.has_space():
+            if house not in grid:
+                grid.append(house)
+        elif house in grid:
+            grid.remove(house)
+
+    def tribes_near(self, x, y, radius):
+        """
+        Stämme, die ein Haus mit Distanz < radius zu (x, y) besitzen.
+
+        Returns:
+            list: Stämme in Gründungsreihenfolge (nach id).
+        """
+        found = set()
+        for house in self.grid.query(x, y, radius):
+            if house.tribe is not None and house.tribe not in found \
+                    and math.hypot(house.x - x, house.y - y) < radius:
+                found.add(house.tribe)
+        return sorted(found, key=lambda t: t.id)
+
+    def nearest_free(self, x, y, tribe):
+        """
+        Nächstes Haus des Stammes `tribe` mit freiem Platz.
+
+        Args:
+            x, y (float): Position des suchenden Agenten.
+            tribe (Tribe): Stamm, None = Häuser ohne Stamm.
+
+        Returns:
+            House oder None. Bei gleicher Distanz gewinnt das früher gebaute Haus.
+        """
+        grid = self.tribes.get(tribe)
+        if grid is None:
+            return None
+        best = grid.nearest(x, y)
+        if best is None:
+            return None
+        dist = math.hypot(x - best.x, y - best.y)
+        ties = [h for h in grid.query(x, y, dist) if math.hypot(x - h.x, y - h.y) == dist]
+        return min(ties, key=self.order.get) if len(ties) > 1 else best
+
+
+def grid_pairs(grid, xs, ys, radius):
+    """
+    Alle Paare aus Punkt und Objekt in den Zellen um den Punkt, für viele
+    Punkte auf einmal.
+
+    Gegenstück zu `SpatialGrid.query` für das NumPy-Backend: die belegten
+    Zellen werden einmal kodiert und sortiert, die Zellen um alle Punkte
+    per Binärsuche gefunden. Pro Punkt läuft kein Python-Code, nur pro
+    getroffener Zelle. Die exakte Distanzprüfung übernimmt der Aufrufer.
+
+    Args:
+        grid (SpatialGrid): Raster der Objekte.
+        xs, ys (numpy.ndarray): Koordinaten der Punkte.
+        radius (float): Suchradius um jeden Punkt.
+
+    Returns:
+        tuple: (objects, point, index) - Objekte der getroffenen Zellen und
+            pro Paar der Index des Punktes und des Objekts in `objects`.
+    """
+    cells = grid.cells
+    if not cells or not len(xs):
+        return [], np.zeros(0, np.intp), np.zeros(0, np.intp)
+    cs = grid.cell_size
+    keys = list(cells)
+    codes = np.array([(cx + _CELL_OFFSET) * _CELL_STRIDE + cy + _CELL_OFFSET for cx, cy in keys], np.int64)
+    order = np.argsort(codes)
+    codes = codes[order]
+
+    px = np.floor(np.asarray(xs) / cs).astype(np.int64) + _CELL_OFFSET
+    py = np.floor(np.asarray(ys) / cs).astype(np.int64) + _CELL_OFFSET
+    reach = int(math.ceil(radius / cs))
+    points, slots = [], []
+    for dx in range(-reach, reach + 1):
+        for dy in range(-reach, reach + 1):
+            wanted = (px + dx) * _CELL_STRIDE + py + dy
+            pos = np.minimum(np.searchsorted(codes, wanted), len(codes) - 1)
+            hit = np.flatnonzero(codes[pos] == wanted)
+            points.append(hit)
+            slots.append(pos[hit])
+    point = np.concatenate(points)
+    slot = np.concatenate(slots)
+
+    # Objekte nur aus den getroffenen Zellen
+    objects = []
+    starts = np.zeros(len(codes), np.intp)
+    lengths = np.zeros(len(codes), np.intp)
+    for s in np.unique(slot).tolist():
+        cell = cells[keys[order[s]]]
+        starts[s] = len(objects)
+        lengths[s] = len(cell)
+        objects.extend(cell)
+    counts = lengths[slot]
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if len(ends) else 0
+    index = np.arange(total) + np.repeat(starts[slot] - (ends - counts), counts)
+    return objects, np.repeat(point, counts), index
+
+
+def grid_nearest(grid, xs, ys, radius):
+    """
+    Nächstes Objekt mit Distanz < radius für viele Punkte auf einmal,
+    wie `SpatialGrid.nearest` mit Radius.
+
+    Args:
+        grid (SpatialGrid): Raster der Objekte.
+        xs, ys (numpy.ndarray): Koordinaten der Punkte.
+        radius (float): Maximale Distanz (exklusiv).
+
+    Returns:
+        tuple: (objects, best, dist, ox, oy) - Objekte der getroffenen
+            Zellen, pro Punkt der Index des nächsten Objekts in `objects`
+            (-1 = keins) und seine Distanz, dazu die Positionen von `objects`.
+    """
+    objects, point, index = grid_pairs(grid, xs, ys, radius)
+    best = np.full(len(xs), -1, np.intp)
+    dist = np.full(len(xs), np.inf)
+    if not objects:
+        return objects, best, dist, np.zeros(0), np.zeros(0)
+    position = grid.position
+    if position:
+        ox, oy = (np.array(v, float) for v in zip(*map(position, objects)))
+    else:
+        ox = np.fromiter((o.x for o in objects), float, len(objects))
+        oy = np.fromiter((o.y for o in objects), float, len(objects))
+    d = np.hypot(np.asarray(xs)[point] - ox[index], np.asarray(ys)[point] - oy[index])
+    inside = np.flatnonzero(d < radius)
+    inside = inside[np.lexsort((d[inside], point[inside]))]
+    found, first = np.unique(point[inside], return_index=True)
+    best[found] = index[inside[first]]
+    dist[found] = d[inside[first]]
+    return objects, best, dist, ox, oy
@@ -0,0 +1,146 @@
+from agent import ACTIONS
+
+class WorldStats:
+    """
+    Laufende Statistik der Welt für Infoleiste und Auswertungen.
+
+    Zähler, die sich nur durch Ereignisse ändern (Bevölkerung, Häuser,
+    Kapazität, Belegung, Mitglieder und Häuser pro Stamm), werden bei
+    Geburt, Tod, Hausbau, Stammeswechsel und Betreten/Verlassen von
+    Häusern direkt angepasst. Werte, die sich jeden Tick für alle
+    Agenten ändern (Alter, Hunger, Reward, Memory), berechnet `refresh`
+    in einem Durchlauf, den der Aufrufer nur in seiner Wunschrate auslöst.
+
+    Attributes:
+        population (int): Lebende Agenten.
+        houses (int): Anzahl Häuser.
+        capacity (int): Summe der Hauskapazitäten.
+        occupied (int): Belegte Plätze in Häusern.
+        tribes (dict): Tribe -> [Mitglieder, Häuser].
+        max_generation (int): Höchste bisher erreichte Generation.
+        kids, adults, hungry (int): Stand des letzten `refresh`.
+        sum_age, sum_hunger, sum_reward (float): Stand des letzten `refresh`.
+        sampled (int): Anzahl Agenten beim letzten `refresh`.
+        action_totals (dict): Aktion -> Summe der Memory-Werte (letzter `refresh`).
+        refreshed_tick (int): Tick des letzten `refresh`, None = noch nie.
+    """
+
+    def __init__(self):
+        self.population = 0
+        self.houses = 0
+        self.capacity = 0
+        self.occupied = 0
+        self.tribes = {}
+        self.max_generation = 0
+
+        self.kids = 0
+        self.adults = 0
+        self.hungry = 0
+        self.sum_age = 0.0
+        self.sum_hunger = 0.0
+        self.sum_reward = 0.0
+        self.sampled = 0
+        self.action_totals = {}
+        self.refreshed_tick = None
+
+    # ----------------------------
+    # Ereignisse
+
+    def agent_added(self, agent):
+        """Geburt oder Spawn eines Agenten."""
+        self.population += 1
+        self.max_generation = max(self.max_generation, agent.generation)
+        if agent.tribe:
+            self._tribe(agent.tribe)[0] += 1
+
+    def agent_removed(self, agent):
+        """Tod eines Agenten."""
+        self.population -= 1
+        if agent.tribe:
+            self._tribe(agent.tribe)[0] -= 1
+
+    def tribe_changed(self, old, new):
+        """Ein lebender Agent wechselt von `old` zu `new` (jeweils evtl. None)."""
+        if old is new:
+            return
+        if old:
+            self._tribe(old)[0] -= 1
+        if new:
+            self._tribe(new)[0] += 1
+
+    def house_built(self, house):
+        """Ein neues Haus wurde gebaut."""
+        self.houses += 1
+        self.capacity += house.capacity
+        self.occupied += len(house.occupants)
+        if house.tribe:
+            self._tribe(house.tribe)[1] += 1
+
+    def occupancy_changed(self, house, delta):
+        """Agenten haben ein Haus betreten (delta > 0) oder verlassen."""
+        self.occupied += delta
+
+    def _tribe(self, tribe):
+        counts = self.tribes.get(tribe)
+        if counts is None:
+            counts = self.tribes[tribe] = [0, 0]
+        return counts
+
+    # ----------------------------
+
+    def refresh(self, sim):
+        """
+        Berechnet die tickabhängigen Werte neu. Mit NumPy-Backend laufen
+        Alter, Hunger, Reward und Memory als Array-Operationen.
+
+        Args:
+            sim (Simulation): Auszuwertende Simulation.
+        """
+        agents = sim.agents
+        pop = sim.population
+        if pop is not None and pop.count:
+            n = pop.count
+            age, hunger = pop.age[:n], pop.hunger[:n]
+            self.kids = int((age < 18).sum())
+            self.adults = int(((age >= 18) & (age < 80)).sum())
+            self.hungry = int((hunger < 30).sum())
+            self.sum_age = float(age.sum())
+            self.sum_hunger = float(hunger.sum())
+            self.sum_reward = float(pop.total_reward[:n].sum())
+            self.action_totals = dict(zip(ACTIONS, pop.memory[:n].sum(axis=0).tolist()))
+        else:
+            sim.settle()
+            kids = adults = hungry = 0
+            sum_age = sum_hunger = 0.0
+            for a in agents:
+                age = a.age
+                if age < 18:
+                    kids += 1
+                elif age < 80:
+                    adults += 1
+                if a.hunger < 30:
+                    hungry += 1
+                sum_age += age
+                sum_hunger += a.hunger
+            self.kids, self.adults, self.hungry = kids, adults, hungry
+            self.sum_age, self.sum_hunger = sum_age, sum_hunger
+
+            self.sum_reward = sum(a.total_reward for a in agents)
+            totals = [0.0] * len(ACTIONS)
+            for a in agents:
+                for i, v in enumerate(a.memory):
+                    totals[i] += v
+            self.action_totals = dict(zip(ACTIONS, totals)) if agents else {}
+        self.sampled = len(agents)
+        self.refreshed_tick = sim.clock.tick
+
+    # ----------------------------
+
+    def average(self, total):
+        """Durchschnitt einer `refresh`-Summe pro Agent."""
+        return total / max(1, self.sampled)
+
+    def top_action(self):
+        """Aktion mit der höchsten Memory-Summe oder "-"."""
+        totals = self.action_totals
+        return max(totals, key=totals.get) if totals else "-"
@@ -0,0 +1,57 @@
+import random
+
+# Teilsysteme mit eigenem Zufallsgenerator. Die Reihenfolge ist Teil des
+# Checkpoint-Formats und darf nur am Ende erweitert werden.
+STREAMS = ("world", "agents", "houses", "tribes", "enemies")
+
+
+class RandomStreams:
+    """
+    Ein reproduzierbar geseedeter Zufallsgenerator pro Teilsystem.
+
+    Alle Ströme werden aus einem gemeinsamen Startwert abgeleitet. Weil
+    jedes Teilsystem nur aus seinem eigenen Strom zieht, verschiebt z.B.
+    ein zusätzlicher Gegner nicht die Entscheidungen der Agenten, und
+    gleiche Startwerte liefern unabhängig von Aufrufreihenfolgen anderer
+    Module denselben Lauf.
+
+    Attributes:
+        seed (int): Gemeinsamer Startwert.
+        world (random.Random): Ressourcen (Verteilen, Nachwachsen).
+        agents (random.Random): Bewegung, Aktionswahl und Vererbung der Agenten.
+        houses (random.Random): Plätze im Haus und Fortpflanzung.
+        tribes (random.Random): Stammesfarben, Stammeswahl und Abspaltung.
+        enemies (random.Random): Spawn, Patrouille und Bewegung der Gegner.
+    """
+
+    __slots__ = ("seed",) + STREAMS
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed (int, optional): Startwert. Ohne Startwert wird einer aus
+                dem Modul random gezogen, damit er für eine Aufzeichnung
+                bekannt ist.
+        """
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        for name in STREAMS:
+            # str-Seeds werden über SHA-512 abgeleitet und sind damit
+            # unabhängig von PYTHONHASHSEED und Prozess
+            setattr(self, name, random.Random(f"{self.seed}/{name}"))
+
+    def getstate(self):
+        """
+        Returns:
+            dict: Name -> Zustand (wie random.getstate) für jeden Strom.
+        """
+        return {name: getattr(self, name).getstate() for name in STREAMS}
+
+    def setstate(self, states):
+        """
+        Stellt die Zustände aus `getstate` wieder her.
+
+        Args:
+            states (dict): Name -> Zustand.
+        """
+        for name, state in states.items():
+            getattr(self, name).setstate(state)
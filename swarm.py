@@ -0,0 +1,143 @@
+try:
+    import numpy as np
+except ImportError:  # optionales Backend, ohne NumPy rechnet jeder Gegner einzeln
+    np = None
+
+import math
+
+from Objects.enemy import KILL_RANGE, Waypoint
+from Objects.house import HOUSE_SIZE
+from spatial import grid_pairs
+
+
+class EnemySwarm:
+    """
+    Rechnet alle Gegner eines Ticks gebündelt mit NumPy.
+
+    Statt dass jeder Gegner einzeln Sichtbarkeit und Abstand zu allen
+    Agenten in seiner Nähe prüft, werden pro Tick alle Paare Gegner ->
+    Agent aus den Rasterzellen in Sichtweite gebildet und ihre Abstände
+    in einer Array-Operation berechnet, einmal für die Zielwahl und
+    einmal nach der Bewegung für die Angriffe. Positionen und `in_house`
+    kommen direkt aus den Spalten der `Population`. Ob ein Agent von einem
+    Haus verdeckt wird, prüft nur für die Agenten in Sichtweite eines
+    Gegners, über die Häuser in ihrer Nähe aus `sim.house_grid`.
+
+    Alle Gegner wählen ihr Ziel aus demselben Zustand zu Beginn der Phase,
+    Bewegung und Angriffe folgen gemeinsam. Konflikte werden fest
+    aufgelöst: Gegner greifen in ihrer Reihenfolge in `sim.enemies` an,
+    jeder den nächsten noch lebenden Agenten in Reichweite (bei gleicher
+    Distanz den mit der kleineren Zeile in der Population); erreichen
+    zwei Gegner denselben Agenten, tötet ihn der erste, der zweite nimmt
+    den nächsten übrigen oder geht leer aus. Die Zufallswinkel der
+    Patrouille ziehen Gegner ohne sichtbares Ziel ebenfalls in dieser
+    Reihenfolge aus `sim.rng.enemies`.
+
+    Die Gegner bleiben `Enemy`-Objekte im Raster `sim.enemies`; Positionen
+    und Ziele werden nach der Rechnung zurückgeschrieben, Renderer und
+    Checkpoints sehen keinen Unterschied.
+    """
+
+    def __init__(self):
+        """
+        Raises:
+            ImportError: Ohne NumPy.
+        """
+        if np is None:
+            raise ImportError("EnemySwarm benötigt NumPy (pip install numpy)")
+
+    def update(self, sim):
+        """
+        Rechnet Zielwahl, Bewegung und Angriffe aller Gegner.
+
+        Args:
+            sim (Simulation): Welt mit Gegnern, Agenten und Häusern.
+
+        Returns:
+            list: Getötete Agenten, höchstens einer pro Gegner.
+        """
+        enemies = list(sim.enemies)
+        if not enemies:
+            return []
+        n = len(enemies)
+        ex = np.fromiter((e.x for e in enemies), float, n)
+        ey = np.fromiter((e.y for e in enemies), float, n)
+        speed = np.fromiter((e.speed for e in enemies), float, n)
+        sight = np.fromiter((e.sight for e in enemies), float, n)
+        pop = sim.population
+        ax, ay = pop.x[:pop.count], pop.y[:pop.count]
+
+        # Paare Gegner -> Agent aus den Rasterzellen in Sichtweite
+        agents, pe, index = grid_pairs(sim.agent_grid, ex, ey, float(sight.max()))
+        rows = np.fromiter((a._idx for a in agents), np.intp, len(agents))
+        pa = rows[index]
+
+        # Verdeckt: im Haus oder innerhalb der Fläche eines Hauses in der Nähe,
+        # geprüft nur für Agenten, die ein Gegner sehen könnte
+        hidden = pop.in_house[:pop.count].copy()
+        if sim.houses and len(pa):
+            cand = np.unique(pa)
+            cand = cand[~hidden[cand]]
+            near, pc, index = grid_pairs(sim.house_grid, ax[cand], ay[cand], HOUSE_SIZE)
+            if near:
+                m = len(near)
+                hx = np.fromiter((h.x for h in near), float, m)[index]
+                hy = np.fromiter((h.y for h in near), float, m)[index]
+                hw = np.fromiter((h.width for h in near), float, m)[index]
+                hh = np.fromiter((h.height for h in near), float, m)[index]
+                hr = cand[pc]
+                inside = (hx <= ax[hr]) & (ax[hr] <= hx + hw) & (hy <= ay[hr]) & (ay[hr] <= hy + hh)
+                hidden[hr[inside]] = True
+
+        # Zielwahl: nächster sichtbarer Agent, bei gleicher Distanz die kleinere Zeile
+        targets = [None] * n
+        tx, ty = ex.copy(), ey.copy()
+        dist = np.hypot(ex[pe] - ax[pa], ey[pe] - ay[pa])
+        seen = ((dist <= sight[pe]) & ~hidden[pa]).nonzero()[0]
+        order = seen[np.lexsort((pa[seen], dist[seen], pe[seen]))]
+        chasing, first = np.unique(pe[order], return_index=True)
+        chosen = pa[order[first]]
+        tx[chasing], ty[chasing] = ax[chosen], ay[chosen]
+        views = pop.views
+        for i, row in zip(chasing.tolist(), chosen.tolist()):
+            targets[i] = views[row]
+
+        # Sonst Patrouille ums nächste Haus, Zufallswinkel in Gegner-Reihenfolge
+        if sim.houses:
+            rng = sim.rng.enemies
+            idle = np.ones(n, bool)
+            idle[chasing] = False
+            for i in idle.nonzero()[0].tolist():
+                house = sim.house_grid.nearest(float(ex[i]), float(ey[i]))
+                angle = rng.uniform(0, 2 * math.pi)
+                radius = max(house.width, house.height) / 2 + 1  # 1 Pixel Abstand
+                point = Waypoint(house.x + house.width / 2 + radius * math.cos(angle),
+                                 house.y + house.height / 2 + radius * math.sin(angle))
+                targets[i] = point
+                tx[i], ty[i] = point.x, point.y
+        moving = np.fromiter((t is not None for t in targets), bool, n)
+
+        # Bewegung aller Gegner mit Ziel
+        dx, dy = tx - ex, ty - ey
+        step = np.where(moving, speed / np.maximum(1, np.hypot(dx, dy)), 0.0)
+        ex += step * dx
+        ey += step * dy
+
+        # Angriffe in Gegner-Reihenfolge, jeder Agent stirbt höchstens einmal
+        killed = []
+        dist = np.hypot(ex[pe] - ax[pa], ey[pe] - ay[pa])
+        hits = ((dist < KILL_RANGE) & ~pop.in_house[pa] & moving[pe]).nonzero()[0]
+        if len(hits):
+            attacked, victims = set(), set()
+            for k in hits[np.lexsort((pa[hits], dist[hits], pe[hits]))].tolist():
+                i, row = int(pe[k]), int(pa[k])
+                if i in attacked or row in victims:
+                    continue  # Gegner hat schon getötet oder Agent ist schon tot
+                attacked.add(i)
+                victims.add(row)
+                killed.append(views[row])
+
+        for enemy, x, y, target in zip(enemies, ex.tolist(), ey.tolist(), targets):
+            enemy.x, enemy.y, enemy.target = x, y, target
+            sim.enemies.move(enemy)
+        return killed
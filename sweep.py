@@ -0,0 +1,133 @@
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from simulation import Simulation
+
+
+def expand_grid(grid):
+    """
+    Bildet alle Kombinationen eines Parameter-Grids.
+
+    Args:
+        grid (dict): Parametername -> Liste von Werten, z.B.
+            {"day_time": [20, 30], "enemy_count": [5, 10]}.
+            Die Namen entsprechen den Argumenten von `Simulation`.
+
+    Returns:
+        list: Ein dict pro Konfiguration.
+    """
+    names = list(grid)
+    values = [v if isinstance(v, (list, tuple)) else [v] for v in grid.values()]
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def run_one(params, seed, ticks):
+    """
+    Simuliert eine Welt headless und fasst das Ergebnis zusammen.
+
+    Args:
+        params (dict): Argumente für `Simulation`.
+        seed (int): Startwert der Zufallsgeneratoren.
+        ticks (int): Anzahl der Ticks.
+
+    Returns:
+        dict: Parameter, Seed und Kennzahlen des Laufs.
+    """
+    start = time.perf_counter()
+    sim = Simulation(seed=seed, **params).run(ticks)
+    elapsed = time.perf_counter() - start
+
+    stats = sim.stats
+    stats.refresh(sim)
+    row = dict(params)
+    row.update({
+        "seed": seed,
+        "ticks": ticks,
+        "population": stats.population,
+        "max_generation": stats.max_generation,
+        "tribes": len(sim.tribes),
+        "houses": stats.houses,
+        "avg_reward": round(stats.average(stats.sum_reward), 4),
+        "avg_age": round(stats.average(stats.sum_age), 2),
+        "runtime_s": round(elapsed, 3),
+    })
+    return row
+
+
+def _run_task(task):
+    return run_one(*task)
+
+
+def sweep(grid, seeds, ticks, workers=None):
+    """
+    Führt alle Konfigurationen × Seeds parallel in eigenen Prozessen aus.
+
+    Jeder Lauf ist unabhängig, daher skaliert die Sweep-Zeit linear mit
+    der Anzahl der Kerne.
+
+    Args:
+        grid (dict): Parameter-Grid, siehe `expand_grid`.
+        seeds (list): Seeds, jede Konfiguration läuft einmal pro Seed.
+        ticks (int): Ticks pro Lauf.
+        workers (int, optional): Anzahl Prozesse, Standard = Anzahl Kerne.
+
+    Returns:
+        list: Ergebniszeilen in der Reihenfolge Konfiguration, dann Seed.
+    """
+    tasks = [(params, seed, ticks) for params in expand_grid(grid) for seed in seeds]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_task, tasks))
+
+
+def write_results(rows, path):
+    """
+    Schreibt die Ergebnistabelle als CSV oder, bei Endung .json/.ndjson,
+    als eine JSON-Zeile pro Lauf.
+
+    Args:
+        rows (list): Ergebniszeilen aus `sweep`.
+        path (str): Zieldatei.
+    """
+    if path.endswith((".json", ".ndjson")):
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        return
+
+    columns = []
+    for row in rows:
+        columns.extend(k for k in row if k not in columns)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: json.dumps(v) if isinstance(v, dict) else v for k, v in row.items()})
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parameter-Sweep über headless Simulationen.")
+    parser.add_argument("grid", help='Parameter-Grid als JSON oder Pfad zu einer JSON-Datei, '
+                                     'z.B. \'{"day_time": [20, 30], "enemy_count": [5, 10]}\'')
+    parser.add_argument("--seeds", default="1,2,3", help="Kommagetrennte Seeds")
+    parser.add_argument("--ticks", type=int, default=20000, help="Ticks pro Lauf")
+    parser.add_argument("--workers", type=int, help="Anzahl Prozesse (Standard: alle Kerne)")
+    parser.add_argument("--out", default="sweep_results.csv", help="Ergebnisdatei (.csv oder .ndjson)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.grid):
+        with open(args.grid, encoding="utf-8") as f:
+            grid = json.load(f)
+    else:
+        grid = json.loads(args.grid)
+    seeds = [int(s) for s in args.seeds.split(",") if s]
+
+    start = time.perf_counter()
+    rows = sweep(grid, seeds, args.ticks, args.workers)
+    write_results(rows, args.out)
+    print(f"{len(rows)} Läufe in {time.perf_counter() - start:.1f}s -> {args.out}")
@@ -0,0 +1,54 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from agent import Agent
+from camera import Camera
+from Objects.enemy import Enemy
+from renderer import CameraRenderer, PixelRenderer, np
+from simulation import Simulation
+
+VIEW = (800, 600)
+
+
+@unittest.skipIf(np is None, "NumPy nicht installiert")
+class PixelRendererTest(unittest.TestCase):
+    """PixelRenderer zeichnet pixelgleich zum CameraRenderer."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        cls.screen = pygame.display.set_mode(VIEW)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def frame(self, cls, sim, zoom):
+        cam = Camera(VIEW, sim.world_size, x=300.3, y=199.6, zoom=zoom)
+        cls(sim, cam).draw(self.screen)
+        return pygame.image.tostring(self.screen, "RGB")
+
+    def check(self, sim):
+        # Agent ragt über den linken, Gegner über den oberen Rand
+        sim.add_agent(Agent(298, 400, clock=sim.clock, rng=sim.rng.agents))
+        sim.enemies.append(Enemy(500, 197.5))
+        for zoom in (1, 1.7, 3):
+            with self.subTest(zoom=zoom, day=sim.is_day):
+                self.assertEqual(self.frame(CameraRenderer, sim, zoom), self.frame(PixelRenderer, sim, zoom))
+
+    def test_day(self):
+        self.check(Simulation(seed=1))
+
+    def test_night_vectorized(self):
+        sim = Simulation(seed=1, vectorized=True)
+        sim.run(2200)
+        self.assertFalse(sim.is_day)
+        self.check(sim)
+
+
+if __name__ == "__main__":
+    unittest.main()
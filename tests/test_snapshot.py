@@ -0,0 +1,53 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from camera import Camera
+from renderer import SnapshotRenderer
+from simulation import Simulation
+from snapshot import Snapshot, SimulationThread
+
+
+class SnapshotPatchTest(unittest.TestCase):
+    """
+    Einzelne Ressourcen-Änderungen bessern die statische Ebene aus, statt
+    sie neu zu erfassen, und ergeben dasselbe Bild wie eine volle Erfassung.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        cls.screen = pygame.display.set_mode((800, 600))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def test_patched_static_matches_full_capture(self):
+        sim = Simulation(seed=1)
+        thread = SimulationThread(lambda: sim, sim.step)
+        renderer = SnapshotRenderer(Camera((800, 600), sim.world_size))
+        thread.publish()
+        first = thread.buffer.latest()
+        renderer.draw(self.screen, first)
+
+        for _ in range(60):
+            sim.run(10)
+            thread.publish()
+            renderer.draw(self.screen, thread.buffer.latest())
+        snapshot = thread.buffer.latest()
+        self.assertTrue(sim.is_day)
+        self.assertEqual(snapshot.static_version, first.static_version)
+        self.assertGreater(snapshot.patch_count, 0)
+
+        full = SnapshotRenderer(Camera((800, 600), sim.world_size))
+        full.draw(self.screen, Snapshot(sim.clock.tick, sim.is_day, Snapshot.capture_static(sim), 0, (), ()))
+        self.assertEqual(pygame.image.tostring(renderer.static, "RGB"),
+                         pygame.image.tostring(full.static, "RGB"))
+
+
+if __name__ == "__main__":
+    unittest.main()